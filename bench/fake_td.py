@@ -0,0 +1,888 @@
+'''Stand-in TouchDesigner object model for running the HoveredMidiRelative extension
+outside of TouchDesigner (benchmarks and event replay).
+
+Only the subset of the TD API used by the extension is modelled: Par/ParGroup/OP,
+sequences, CHOP channels, table DATs, run() with a virtual frame clock, ui.undo,
+tdu, absTime, CustomParHelper and TDStoreTools.StorageManager.
+Every parameter write, websocket message and MIDI output is counted in STATS.
+'''
+import builtins
+import enum
+import fnmatch
+import sys
+import time
+import types
+
+
+class Stats:
+	"""Counters collected while the extension runs against the fake model"""
+
+	def __init__(self):
+		self.reset()
+
+	def reset(self):
+		self.par_writes = 0
+		self.component_par_writes = 0
+		self.ws_messages = 0
+		self.ws_bytes = 0
+		self.ws_payloads = []
+		self.midi_out = 0
+		self.runs_scheduled = 0
+		self.runs_executed = 0
+		self.undo_blocks = 0
+
+	def as_dict(self) -> dict:
+		return {
+			'par_writes': self.par_writes,
+			'component_par_writes': self.component_par_writes,
+			'lua_messages': self.ws_messages,
+			'lua_bytes': self.ws_bytes,
+			'midi_out': self.midi_out,
+			'runs_scheduled': self.runs_scheduled,
+			'runs_executed': self.runs_executed,
+			'undo_blocks': self.undo_blocks,
+		}
+
+
+STATS = Stats()
+KEEP_PAYLOADS = False  # Keep every websocket payload in STATS.ws_payloads (for inspection/emulation)
+WS_LISTENERS = []  # Called with (text, virtual seconds) for every websocket payload, e.g. VSN1Emulator.receive
+
+
+class tdError(Exception):
+	pass
+
+
+class ParMode(enum.Enum):
+	CONSTANT = 0
+	EXPRESSION = 1
+	EXPORT = 2
+	BIND = 3
+
+
+NUMERIC_STYLES = {'Float', 'Int', 'XY', 'XYZ', 'XYZW', 'WH', 'UV', 'UVW', 'RGB', 'RGBA'}
+
+
+# region parameters
+
+class Par:
+	"""A single parameter"""
+
+	def __init__(self, owner, name, value=0.0, style=None, *, label=None, normMin=0.0, normMax=1.0,
+				 min=None, max=None, clampMin=False, clampMax=False, default=None,
+				 menuNames=None, menuLabels=None, isCustom=True, page='Custom',
+				 readOnly=False, enable=True, isInt=None):
+		if style is None:
+			if isinstance(value, bool):
+				style = 'Toggle'
+			elif isinstance(value, int):
+				style = 'Int'
+			elif isinstance(value, float):
+				style = 'Float'
+			else:
+				style = 'Str'
+		self.owner = owner
+		self.name = name
+		self.style = style
+		self.label = label or name.capitalize()
+		self.normMin = normMin
+		self.normMax = normMax
+		self.min = normMin if min is None else min
+		self.max = normMax if max is None else max
+		self.clampMin = clampMin
+		self.clampMax = clampMax
+		self.default = value if default is None else default
+		self.normVal = 0.0
+		self.menuNames = list(menuNames or [])
+		self.menuLabels = list(menuLabels or self.menuNames)
+		self.isCustom = isCustom
+		self.page = page
+		self.readOnly = readOnly
+		self.enable = enable
+		self.mode = ParMode.CONSTANT
+		self.expr = ''
+		self.bindExpr = ''
+		self.enableExpr = ''
+		self.sequenceBlock = None
+		self.valid = True
+		self._isInt = (style == 'Int') if isInt is None else isInt
+		self._value = value
+		self.on_pulse = None
+		self.on_change = None
+		self._parGroup = None
+
+	def __repr__(self):
+		owner = getattr(self.owner, 'path', '?')
+		return f'<Par {owner}:{self.name}>'
+
+	# Type flags
+	@property
+	def isNumber(self):
+		return self.style in NUMERIC_STYLES
+
+	@property
+	def isFloat(self):
+		return self.isNumber and not self._isInt
+
+	@property
+	def isInt(self):
+		return self.isNumber and self._isInt
+
+	@property
+	def isMenu(self):
+		return self.style in ('Menu', 'StrMenu')
+
+	@property
+	def isString(self):
+		return self.style in ('Str', 'StrMenu', 'OP', 'COMP', 'File', 'Folder')
+
+	@property
+	def isToggle(self):
+		return self.style == 'Toggle'
+
+	@property
+	def isPulse(self):
+		return self.style == 'Pulse'
+
+	@property
+	def isMomentary(self):
+		return self.style == 'Momentary'
+
+	@property
+	def isOP(self):
+		return self.style in ('OP', 'COMP')
+
+	@property
+	def parGroup(self):
+		# Standalone parameters belong to a single-member group, as in TD
+		if self._parGroup is None:
+			self._parGroup = ParGroup(self.owner, self.name, [self])
+		return self._parGroup
+
+	# Value access
+	def eval(self):
+		return self._value
+
+	@property
+	def val(self):
+		return self._value
+
+	@val.setter
+	def val(self, value):
+		if self.isMenu and isinstance(value, int) and not isinstance(value, bool) and self.style == 'Menu':
+			if 0 <= value < len(self.menuNames):
+				value = self.menuNames[value]
+		elif self.isInt:
+			value = int(round(value)) if isinstance(value, (int, float)) else value
+		elif self.isFloat and isinstance(value, (int, float)) and not isinstance(value, bool):
+			value = float(value)
+			if self.clampMin:
+				value = builtins.max(value, self.min)
+			if self.clampMax:
+				value = builtins.min(value, self.max)
+		STATS.par_writes += 1
+		if getattr(self.owner, 'isComponent', False):
+			STATS.component_par_writes += 1
+		changed = value != self._value
+		self._value = value
+		if changed and self.on_change is not None:
+			self.on_change(self, value)
+
+	@property
+	def menuIndex(self):
+		try:
+			return self.menuNames.index(self._value)
+		except ValueError:
+			return None
+
+	@menuIndex.setter
+	def menuIndex(self, index):
+		self.val = self.menuNames[index]
+
+	def pulse(self, *args, **kwargs):
+		if self.on_pulse is not None:
+			self.on_pulse(self)
+
+	def reset(self):
+		self.val = self.default
+
+
+class ParGroup:
+	"""A group of parameters sharing a base name (e.g. t -> tx ty tz)"""
+
+	def __init__(self, owner, name, pars, style=None):
+		self.owner = owner
+		self.name = name
+		self._pars = list(pars)
+		self.style = style or (self._pars[0].style if self._pars else None)
+		self.label = name.capitalize()
+		self.page = self._pars[0].page if self._pars else 'Custom'
+		self.isCustom = self._pars[0].isCustom if self._pars else True
+		self.valid = True
+		for par in self._pars:
+			par._parGroup = self
+
+	def __repr__(self):
+		return f'<ParGroup {getattr(self.owner, "path", "?")}:{self.name}>'
+
+	def __iter__(self):
+		return iter(self._pars)
+
+	def __len__(self):
+		return len(self._pars)
+
+	def __getitem__(self, idx):
+		return self._pars[idx]
+
+	def eval(self):
+		return tuple(p.eval() for p in self._pars)
+
+	def pars(self, *patterns):
+		if not patterns:
+			return list(self._pars)
+		return [p for p in self._pars if any(fnmatch.fnmatchcase(p.name, pattern) for pattern in patterns)]
+
+	def __getattr__(self, name):
+		# Group-level access to shared member attributes (mode, normMin, ...)
+		if name.startswith('_') or not self.__dict__.get('_pars'):
+			raise AttributeError(name)
+		return getattr(self._pars[0], name)
+
+
+class ParGroupUnit(ParGroup):
+	pass
+
+
+class ParGroupPulse(ParGroup):
+	pass
+
+
+class ParCollection:
+	"""op.par - attribute and item access to parameters (None for unknown names)"""
+
+	def __init__(self, owner, permissive=False):
+		object.__setattr__(self, '_owner', owner)
+		object.__setattr__(self, '_pars', {})
+		object.__setattr__(self, '_permissive', permissive)
+
+	def _add(self, par):
+		self._pars[par.name] = par
+		return par
+
+	def _get(self, name):
+		par = self._pars.get(name)
+		if par is None and self._permissive and not name.startswith('_'):
+			par = self._add(Par(self._owner, name, 0))
+		return par
+
+	def __getattr__(self, name):
+		if name.startswith('__'):
+			raise AttributeError(name)
+		return self._get(name)
+
+	def __getitem__(self, name):
+		return self._get(name)
+
+	def __setattr__(self, name, value):
+		par = self._get(name)
+		if par is None:
+			raise tdError(f'Invalid Par {name}')
+		par.val = value
+
+	def __iter__(self):
+		return iter(list(self._pars.values()))
+
+	def __contains__(self, item):
+		return item in self._pars.values()
+
+
+class ParGroupCollection:
+	"""op.parGroup - access to parameter groups"""
+
+	def __init__(self, owner):
+		self._owner = owner
+		self._groups = {}
+
+	def _add(self, group):
+		self._groups[group.name] = group
+		return group
+
+	def __getattr__(self, name):
+		if name.startswith('_'):
+			raise AttributeError(name)
+		return self._groups.get(name)
+
+	def __getitem__(self, name):
+		return self._groups.get(name)
+
+	def __iter__(self):
+		return iter(list(self._groups.values()))
+
+# endregion parameters
+
+# region operators
+
+class Channel:
+	def __init__(self, name, value=0.0):
+		self.name = name
+		self.val = value
+
+	def eval(self):
+		return self.val
+
+	def __getitem__(self, idx):
+		return self.val
+
+
+class Cell:
+	def __init__(self, table, row, col):
+		self._table = table
+		self.row = row
+		self.col = col
+
+	@property
+	def val(self):
+		return self._table._rows[self.row][self.col]
+
+	@val.setter
+	def val(self, value):
+		self._table._rows[self.row][self.col] = str(value)
+
+	def __str__(self):
+		return self.val
+
+
+_ids = iter(range(1, 1 << 30))
+
+
+class OP:
+	"""Generic operator: COMP, CHOP (channels) and table DAT (rows) in one class"""
+
+	def __init__(self, name, parent=None, *, permissive_pars=False, family='COMP', chans=None, rows=None):
+		self.name = name
+		self.id = next(_ids)
+		self._parent = parent
+		self.family = family
+		self.OPType = family.lower()
+		self.type = family.lower()
+		self.isCOMP = family == 'COMP'
+		self.valid = True
+		self.isComponent = False
+		self.children = {}
+		self.par = ParCollection(self, permissive=permissive_pars)
+		self.parGroup = ParGroupCollection(self)
+		self.ext = types.SimpleNamespace()
+		self.tags = set()
+		self.docked = []
+		self.storage = {}
+		self.selectedChildren = []
+		self.currentPage = None
+		self.seq = types.SimpleNamespace()
+		self.cooks = 0
+		self._chans = [Channel(n, v) for n, v in (chans or {}).items()]
+		self._rows = [list(map(str, r)) for r in (rows or [])]
+		self._script_errors = []
+		if parent is not None:
+			parent.children[name] = self
+
+	def __repr__(self):
+		return f'<{self.family} {self.path}>'
+
+	@property
+	def path(self):
+		if self._parent is None:
+			return '/' if self.name == '' else f'/{self.name}'
+		base = self._parent.path
+		return f'{base.rstrip("/")}/{self.name}'
+
+	def parent(self, level=1):
+		node = self
+		for _ in range(level):
+			node = node._parent if node is not None else None
+		return node
+
+	def op(self, path):
+		if isinstance(path, OP):
+			return path
+		path = str(path)
+		if path.startswith('/'):
+			return ROOT.op(path.lstrip('/')) if path != '/' else ROOT
+		node = self
+		for part in path.split('/'):
+			if part in ('', '.'):
+				continue
+			if part == '..':
+				node = node._parent
+			else:
+				node = node.children.get(part)
+			if node is None:
+				return None
+		return node
+
+	def ops(self, *patterns):
+		return [c for name, c in sorted(self.children.items())
+				if any(fnmatch.fnmatchcase(name, p) for p in patterns)]
+
+	def create(self, op_type, name):
+		family = 'DAT' if op_type in (tableDAT,) else 'COMP'
+		return OP(name, self, family=family)
+
+	def destroy(self):
+		if self._parent is not None:
+			self._parent.children.pop(self.name, None)
+		self.valid = False
+		for par in self.par:
+			par.valid = False
+
+	def cook(self, force=False, recurse=False):
+		self.cooks += 1
+
+	# Storage
+	def store(self, key, value):
+		self.storage[key] = value
+
+	def fetch(self, key, default=None, search=True, storeDefault=False):
+		return self.storage.get(key, default)
+
+	def unstore(self, key):
+		self.storage.pop(key, None)
+
+	# Script errors
+	def scriptErrors(self, recurse=False):
+		return '\n'.join(self._script_errors)
+
+	def addScriptError(self, msg):
+		self._script_errors.append(msg)
+
+	def clearScriptErrors(self, recurse=False, error='*'):
+		self._script_errors = [e for e in self._script_errors if not fnmatch.fnmatchcase(e, error)]
+
+	# CHOP channels / table cells
+	def __getitem__(self, key):
+		if isinstance(key, tuple):
+			row, col = key
+			return Cell(self, row, col)
+		if isinstance(key, str):
+			for chan in self._chans:
+				if chan.name == key:
+					return chan
+			return None
+		return self._chans[key] if key < len(self._chans) else None
+
+	def __setitem__(self, key, value):
+		row, col = key
+		self._rows[row][col] = str(value)
+
+	@property
+	def numChans(self):
+		return len(self._chans)
+
+	@property
+	def numRows(self):
+		return len(self._rows)
+
+	@property
+	def numCols(self):
+		return max((len(r) for r in self._rows), default=0)
+
+	def rows(self):
+		return [[Cell(self, r, c) for c in range(len(row))] for r, row in enumerate(self._rows)]
+
+	def clear(self):
+		self._rows = []
+
+	def setSize(self, rows, cols):
+		self._rows = [(r + [''] * cols)[:cols] for r in self._rows[:rows]]
+		while len(self._rows) < rows:
+			self._rows.append([''] * cols)
+
+	def appendRow(self, values):
+		self._rows.append([str(v) for v in values])
+
+	# Misc COMP API
+	def openParameters(self):
+		pass
+
+	def mod(self, name):
+		return MODULES[name]
+
+
+class CountingWebsocket(OP):
+	"""websocketDAT stand-in - counts outgoing messages and bytes"""
+
+	def __init__(self, name, parent):
+		super().__init__(name, parent, family='DAT')
+		self.sent = 0
+
+	def sendText(self, text):
+		STATS.ws_messages += 1
+		STATS.ws_bytes += len(text.encode('utf-8'))
+		if KEEP_PAYLOADS:
+			STATS.ws_payloads.append(text)
+		for listener in WS_LISTENERS:
+			listener(text, SCHEDULER.seconds)
+		return len(text)
+
+	def receiveText(self, text):
+		"""Text from the server - runs onReceiveText of the callbacks DAT (par.callbacks) on the next frame"""
+		SCHEDULER.schedule("args[0]._onReceiveText(args[1])", self, text)
+
+	def _onReceiveText(self, text):
+		callbacks = self.par.callbacks.eval() if self.par.callbacks is not None else None
+		if callbacks is None:
+			return
+		scope = {}
+		exec(callbacks.text, scope)
+		if 'onReceiveText' in scope:
+			scope['onReceiveText'](self, 0, text)
+
+
+class CountingMidiOut(OP):
+	"""midioutCHOP stand-in - counts sent MIDI messages"""
+
+	def __init__(self, name, parent):
+		super().__init__(name, parent, family='CHOP')
+
+	def _send(self, *args, **kwargs):
+		STATS.midi_out += 1
+
+	sendControl = _send
+	sendNoteOn = _send
+	sendNoteOff = _send
+	sendProgram = _send
+	sendExclusive = _send
+
+
+class Block:
+	"""A block of a sequential parameter"""
+
+	def __init__(self, sequence, index, template):
+		self.sequence = sequence
+		self.index = index
+		self.owner = sequence.owner
+		self.par = ParCollection(sequence.owner)
+		for name, value in template.items():
+			par = self.par._add(Par(sequence.owner, f'{sequence.name.lower()}{index}{name.lower()}', value))
+			par.sequenceBlock = self
+			self.par._pars[name] = par
+
+
+class Sequence:
+	"""op.seq.<Name>"""
+
+	def __init__(self, owner, name, template, num_blocks):
+		self.owner = owner
+		self.name = name
+		self._template = dict(template)
+		self._blocks = []
+		self.numBlocks = num_blocks
+
+	@property
+	def numBlocks(self):
+		return len(self._blocks)
+
+	@numBlocks.setter
+	def numBlocks(self, value):
+		while len(self._blocks) < value:
+			self._blocks.append(Block(self, len(self._blocks), self._template))
+		del self._blocks[value:]
+
+	def __iter__(self):
+		return iter(list(self._blocks))
+
+	def __len__(self):
+		return len(self._blocks)
+
+	def __getitem__(self, idx):
+		return self._blocks[idx]
+
+	@property
+	def blocks(self):
+		return list(self._blocks)
+
+	@property
+	def blockPars(self):
+		return types.SimpleNamespace(**{
+			name: [b.par._pars[name] for b in self._blocks] for name in self._template
+		})
+
+# endregion operators
+
+# region runtime
+
+class Run:
+	def __init__(self, script, args, due_frame, due_time, end_frame):
+		self.script = script
+		self.args = args
+		self.due_frame = due_frame
+		self.due_time = due_time
+		self.end_frame = end_frame
+		self.active = True
+
+	def kill(self):
+		self.active = False
+
+	@property
+	def remainingMilliseconds(self):
+		if self.due_time is None:
+			return 0
+		return builtins.max(0.0, (self.due_time - SCHEDULER.seconds) * 1000.0)
+
+	@property
+	def remainingFrames(self):
+		return builtins.max(0, self.due_frame - SCHEDULER.frame)
+
+
+class Scheduler:
+	"""Virtual frame clock driving run() calls"""
+
+	FPS = 60.0
+
+	def __init__(self):
+		self.frame = 1
+		self.seconds = 0.0
+		self.pending = []
+		self.on_run = None  # callback(script, elapsed_seconds)
+		self.frame_listeners = []  # Called at the start of every frame, after the clock advanced
+		self.run_globals = {}
+
+	def schedule(self, script, *args, endFrame=False, delayFrames=0, delayMilliSeconds=0,
+				 delaySeconds=0, delayRef=None, fromOP=None, group=None, asParameter=False):
+		due_time = None
+		if delayMilliSeconds or delaySeconds:
+			due_time = self.seconds + (delayMilliSeconds / 1000.0) + delaySeconds
+		run_obj = Run(script, args, self.frame + int(delayFrames), due_time, endFrame)
+		self.pending.append(run_obj)
+		STATS.runs_scheduled += 1
+		return run_obj
+
+	def _execute(self, run_obj):
+		run_obj.active = False
+		STATS.runs_executed += 1
+		scope = dict(self.run_globals)
+		scope['args'] = run_obj.args
+		start = time.perf_counter()
+		exec(run_obj.script, scope)
+		if self.on_run is not None:
+			self.on_run(run_obj.script, time.perf_counter() - start)
+
+	def step_frame(self):
+		"""Finish the current frame (endFrame runs) and start the next one"""
+		current = [r for r in self.pending if r.active and r.end_frame and r.due_time is None and r.due_frame <= self.frame]
+		for run_obj in current:
+			if run_obj.active:
+				self._execute(run_obj)
+		self.frame += 1
+		self.seconds += 1.0 / self.FPS
+		ABSTIME.frame = self.frame
+		ABSTIME.seconds = self.seconds
+		for listener in self.frame_listeners:
+			listener()
+		due = [r for r in self.pending if r.active and not r.end_frame and (
+			(r.due_time is not None and r.due_time <= self.seconds) or
+			(r.due_time is None and r.due_frame <= self.frame))]
+		for run_obj in due:
+			if run_obj.active:
+				self._execute(run_obj)
+		self.pending = [r for r in self.pending if r.active]
+
+	def advance_to(self, seconds):
+		"""Step frames until the virtual clock reaches the given time"""
+		while self.seconds + 1.0 / self.FPS <= seconds:
+			self.step_frame()
+
+	def drain(self, max_frames=600):
+		"""Step frames until nothing is pending (bounded)"""
+		for _ in range(max_frames):
+			if not any(r.active for r in self.pending):
+				break
+			self.step_frame()
+
+
+SCHEDULER = Scheduler()
+ABSTIME = types.SimpleNamespace(frame=1, seconds=0.0)
+
+
+class _Undo:
+	def __init__(self):
+		self.state = True
+		self.globalState = True
+
+	def startBlock(self, name, enable=True):
+		STATS.undo_blocks += 1
+
+	def endBlock(self):
+		pass
+
+	def addCallback(self, callback, info=None):
+		pass
+
+
+class _Colors(dict):
+	def __missing__(self, key):
+		return (0.0, 0.0, 0.0)
+
+
+UI = types.SimpleNamespace(
+	undo=_Undo(),
+	colors=_Colors(),
+	panes=[],
+	rolloverPar=None,
+	rolloverOp=None,
+	status='',
+	messageBox=lambda *a, **k: 0,
+	viewFile=lambda *a, **k: None,
+	copyOPs=lambda *a, **k: None,
+)
+
+
+def _match(pattern, inputList, caseSensitive=True):
+	"""tdu.match - TD pattern matching (space separated, wildcards, ^ exclusion)"""
+	tokens = str(pattern).replace(',', ' ').split()
+	result = []
+	for item in inputList:
+		text = str(item)
+		matched = False
+		for token in tokens:
+			if token.startswith('^'):
+				if fnmatch.fnmatchcase(text, token[1:]):
+					matched = False
+			elif fnmatch.fnmatchcase(text, token):
+				matched = True
+		if matched:
+			result.append(item)
+	return result
+
+
+def _clamp(value, lo, hi):
+	return builtins.max(lo, builtins.min(hi, value))
+
+
+def _remap(value, inMin, inMax, outMin, outMax):
+	if inMax == inMin:
+		return outMin
+	return outMin + (value - inMin) * (outMax - outMin) / (inMax - inMin)
+
+
+class _Dependency:
+	def __init__(self, value=None):
+		self.val = value
+
+	def modified(self):
+		pass
+
+
+TDU = types.SimpleNamespace(match=_match, clamp=_clamp, remap=_remap, Dependency=_Dependency)
+
+# endregion runtime
+
+# region helpers used by extensions
+
+class CustomParHelper:
+	"""Stand-in for the ExtUtils CustomParHelper: evalX/parX properties on the extension class"""
+
+	@staticmethod
+	def Init(extension, ownerComp, enable_properties=True, enable_callbacks=True, **kwargs):
+		cls = type(extension)
+		for par in ownerComp.par:
+			name = par.name
+			if not name[:1].isupper():
+				continue
+			if not hasattr(cls, f'eval{name}'):
+				setattr(cls, f'eval{name}', property(
+					lambda self, _n=name: self.ownerComp.par[_n].eval(),
+					lambda self, value, _n=name: setattr(self.ownerComp.par, _n, value)))
+			if not hasattr(cls, f'par{name}'):
+				setattr(cls, f'par{name}', property(lambda self, _n=name: self.ownerComp.par[_n]))
+
+
+class StorageManager:
+	"""Stand-in for TDStoreTools.StorageManager: properties backed by ownerComp.storage"""
+
+	def __init__(self, extension, ownerComp, storedItems=None, **kwargs):
+		cls = type(extension)
+		for item in storedItems or []:
+			name = item['name']
+			ownerComp.storage.setdefault(name, item.get('default'))
+			if item.get('property', True) and not hasattr(cls, name):
+				setattr(cls, name, property(
+					lambda self, _n=name: self.ownerComp.storage.get(_n),
+					lambda self, value, _n=name: self.ownerComp.storage.__setitem__(_n, value)))
+
+
+MODULES = {'CustomParHelper': types.SimpleNamespace(CustomParHelper=CustomParHelper)}
+
+
+class _OpFinder:
+	"""Global op() - resolves absolute paths from the fake root"""
+
+	def __init__(self):
+		self.TDResources = None
+
+	def __call__(self, path):
+		if path is None:
+			return None
+		if isinstance(path, OP):
+			return path
+		return ROOT.op(str(path))
+
+
+ROOT = OP('', None)
+OP_FINDER = _OpFinder()
+tableDAT = type('tableDAT', (), {})
+websocketDAT = type('websocketDAT', (), {})
+timerDAT = type('timerDAT', (), {})
+
+DEBUG_LOG = []
+
+
+def _debug(*args):
+	DEBUG_LOG.append(' '.join(str(a) for a in args))
+
+
+def reset():
+	"""Drop the operator network and pending runs so a fresh component can be built"""
+	ROOT.children.clear()
+	SCHEDULER.pending = []
+	STATS.reset()
+	DEBUG_LOG.clear()
+
+
+def install():
+	"""Install the fake TD globals into builtins and TDStoreTools into sys.modules"""
+	OP_FINDER.TDResources = ROOT.op('sys/TDResources') or OP('TDResources', OP('sys', ROOT))
+	ext_utils = OP('ExtUtils', ROOT)
+	ext_utils.tags.add('ExtUtils')
+	me = types.SimpleNamespace(docked=[ext_utils], parent=lambda *a: ROOT)
+
+	td_globals = {
+		'Par': Par,
+		'ParGroup': ParGroup,
+		'ParGroupUnit': ParGroupUnit,
+		'ParGroupPulse': ParGroupPulse,
+		'ParMode': ParMode,
+		'tdError': tdError,
+		'op': OP_FINDER,
+		'run': SCHEDULER.schedule,
+		'ui': UI,
+		'tdu': TDU,
+		'absTime': ABSTIME,
+		'debug': _debug,
+		'me': me,
+		'tableDAT': tableDAT,
+		'websocketDAT': websocketDAT,
+		'timerDAT': timerDAT,
+		'CustomParHelper': CustomParHelper,
+		'JumpToOpExt': object,
+		'PopDialogExt': object,
+		'IntechGridCommExt': object,
+		'OP': OP,
+		'COMP': OP,
+	}
+	for name, value in td_globals.items():
+		setattr(builtins, name, value)
+	SCHEDULER.run_globals = dict(td_globals)
+	sys.modules['TDStoreTools'] = types.SimpleNamespace(StorageManager=StorageManager)
+	return td_globals
+
+# endregion helpers used by extensions
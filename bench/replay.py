@@ -0,0 +1,429 @@
+'''Knob-storm benchmark and event replay harness for the HoveredMidiRelative MIDI input path.
+
+Runs the real extension code (scripts/HoveredMidiRelative) against the stand-in
+TouchDesigner object model in fake_td.py - no TouchDesigner install needed.
+
+Events come either from a recording made in TouchDesigner with
+	op('ParHoverMIDI_VSN1').ext.HoveredMidiRelativeExt.StartEventRecording('events.jsonl')
+	...
+	op('ParHoverMIDI_VSN1').ext.HoveredMidiRelativeExt.StopEventRecording()
+or from the built-in synthetic knob storm generator.
+
+Recorded operator paths are resolved against the fake network, so recordings made
+against other networks only replay hover events for /project1/noise1 style targets
+(use --map to rename operator paths).
+
+Usage:
+	python bench/replay.py --storm 2000 --rate 400
+	python bench/replay.py --storm 2000 --target t --multi 200
+	python bench/replay.py events.jsonl --speed 1
+	python bench/replay.py --storm 1000 --json result.json
+	python bench/replay.py --storm 2000 --emulate --golden bench/golden/storm2000.json
+'''
+import argparse
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import fake_td
+from fake_td import OP, Par, ParGroup, Sequence, CountingWebsocket, CountingMidiOut, STATS, SCHEDULER
+
+
+SCRIPT_DIRS = [
+	os.path.join(REPO_DIR, 'scripts', 'HoveredMidiRelative'),
+	os.path.join(REPO_DIR, 'scripts', 'HoveredMidiRelative', 'managers'),
+	os.path.join(REPO_DIR, 'scripts', 'IntechGridComm'),
+]
+
+# VSN1 defaults (see VSN1Constants)
+CHANNEL = 16
+KNOB_INDEX = 9
+STEPS = {10: 0.001, 11: 0.01, 12: 0.1, 13: 1}
+SLOTS = [1, 2, 3, 4, 5, 6, 7, 8]
+BANKS = [10, 11, 12, 13]
+
+MODIFIER_CHOPS = [
+	'null_push', 'null_setdefault', 'null_midibank', 'null_modesel', 'null_resetpar',
+	'null_setnormmin', 'null_setnormmax', 'null_setclamp', 'null_customopen'
+]
+
+RECORDED_CALLBACKS = {
+	'onReceiveMidi', 'onReceiveStep', 'onReceiveMidiLearn', 'onHoveredParChange'
+}
+
+
+def _menu(comp, name, value, names):
+	return comp.par._add(Par(comp, name, value, 'Menu', menuNames=names))
+
+
+def build_component(root):
+	"""Build the ParHoverMIDI_VSN1 COMP with the parameters and operators the extension uses"""
+	comp = OP('ParHoverMIDI_VSN1', root, permissive_pars=True)
+	comp.isComponent = True
+	add = comp.par._add
+
+	# Custom page
+	add(Par(comp, 'Active', True))
+	add(Par(comp, 'Midistatus', True))
+	_menu(comp, 'Stepmode', 'Fixed', ['Fixed', 'Adaptive'])
+	_menu(comp, 'Pushstepmode', 'Coarser', ['Fixed', 'Finer', 'Coarser'])
+	add(Par(comp, 'Pushstep', 0.01))
+	add(Par(comp, 'Loopmenus', True))
+	add(Par(comp, 'Controlstrmenus', True))
+	_menu(comp, 'Multiadjustmode', 'Off', ['Off', 'Snap', 'Relative'])
+	add(Par(comp, 'Shortcuts', True))
+	add(Par(comp, 'Slotlearnholdlength', 0.33))
+	add(Par(comp, 'Bankswitchholdlength', 0.34))
+	add(Par(comp, 'Resetholdlength', 0.01))
+	add(Par(comp, 'Minmaxclampholdlength', 0.01))
+	add(Par(comp, 'Customizeholdlength', 0.33))
+	add(Par(comp, 'Hovertimeoutlength', 0.15))
+	add(Par(comp, 'Stickypar', True))
+	add(Par(comp, 'Enableundo', True))
+	add(Par(comp, 'Undotimeout', 1.0))
+	add(Par(comp, 'Slotsreporepo', './SlotsRepo'))
+	add(Par(comp, 'Autocreaterepo', False))
+	add(Par(comp, 'Slotsreporepocreate', 0, 'Pulse'))
+	# VSN1 / UI page
+	add(Par(comp, 'Vsn1support', True))
+	add(Par(comp, 'Autostartgrideditor', False))
+	add(Par(comp, 'Resetcomm', 0, 'Pulse'))
+	_menu(comp, 'Knobledupdate', 'Value', ['Off', 'Value', 'Step'])
+	add(Par(comp, 'Enableui', False))
+	add(Par(comp, 'Colorhoveredui', False))
+	add(Par(comp, 'Activateonjump', True))
+	add(Par(comp, 'Enablezoom', False))
+	_menu(comp, 'Zoommode', 'Seek', ['Seek', 'Target'])
+	add(Par(comp, 'Zoomnetwork', 0.015))
+	add(Par(comp, 'Zoominterpolation', 0.015))
+	add(Par(comp, 'Colorindex', 1))
+	_menu(comp, 'Labeldisplaymode', 'Compressed', ['Truncated', 'Compressed'])
+	# Mapping page
+	add(Par(comp, 'Deviceid', 1))
+	add(Par(comp, 'Channel', CHANNEL))
+	add(Par(comp, 'Knobindex', str(KNOB_INDEX)))
+	add(Par(comp, 'Pushindex', str(KNOB_INDEX)))
+
+	comp.seq.Steps = Sequence(comp, 'Steps', {'Index': '', 'Step': 0.001}, len(STEPS))
+	for block, (index, step) in zip(comp.seq.Steps, STEPS.items()):
+		block.par.Index.val = str(index)
+		block.par.Step.val = step
+	comp.seq.Slots = Sequence(comp, 'Slots', {'Index': ''}, len(SLOTS))
+	for block, index in zip(comp.seq.Slots, SLOTS):
+		block.par.Index.val = str(index)
+	comp.seq.Banks = Sequence(comp, 'Banks', {'Index': ''}, len(BANKS))
+	for block, index in zip(comp.seq.Banks, BANKS):
+		block.par.Index.val = str(index)
+
+	# Internal operators
+	CountingMidiOut('midiout1', comp)
+	CountingWebsocket('websocket1', comp)
+	OP('info_midi1', comp, family='CHOP', chans={'warnings': 0})
+	for name in MODIFIER_CHOPS:
+		OP(name, comp, family='CHOP', chans={'chan1': 0})
+	for name in ['midiin_active', 'midiin_steps', 'midiin_push', 'midiin_slots', 'midiin_bank',
+				 'midiin_modesel', 'midiin_resetpar', 'midiin_default', 'midiin_normmin',
+				 'midiin_normmax', 'midiin_setclamp']:
+		OP(name, comp, family='CHOP')
+	OP('parexec2', comp, family='DAT', permissive_pars=True)
+	OP('window', comp, permissive_pars=True)
+	OP('table_default_ui_cols', comp, family='DAT', rows=[['parms.dialog.fg', 1, 1, 1]])
+	OP('null_page_cols', comp, family='DAT', rows=[[0.2, 0.2, 0.2] for _ in range(8)])
+
+	repo_maker = OP('repoMaker', comp)
+	repo_maker.Repo = OP('SlotsRepo', comp)
+
+	ui_root = OP('_UI', comp)
+	ui = OP('UI', ui_root, permissive_pars=True)
+	buttons = OP('BUTTONS', ui)
+	for i in range(len(SLOTS)):
+		OP(f'button{i}', buttons, permissive_pars=True)
+
+	jump = OP('JumpToOp', comp)
+	jump.ext.JumpToOpExt = _FakeJumpToOp()
+	jump.Jump = jump.ext.JumpToOpExt.Jump
+	popdialog = OP('popDialog', comp)
+	popdialog.Open = lambda *a, **k: None
+
+	# Grid communication - uses the real IntechGridCommExt with a counting websocket
+	comm = OP('IntechGridComm', comp)
+	comm.par._add(Par(comm, 'Queuedmessage', True))
+	comm.par._add(Par(comm, 'Luacode', ''))
+	comm.par._add(Par(comm, 'Resetcomm', 0, 'Pulse'))
+	websocket = CountingWebsocket('websocket1', comm)
+	# Callbacks DAT as shipped: IntechGridCommExt appends its receive hook to it
+	callbacks_dat = OP('websocket1_callbacks', comm, family='DAT')
+	callbacks_dat.text = 'def onReceiveText(dat, rowIndex, message):\n\treturn\n'
+	websocket.par._add(Par(websocket, 'callbacks', callbacks_dat))
+	OP('timer1', comm, permissive_pars=True)
+	callbacks = OP('callbackManager', comm)
+	callbacks.Do_Callback = lambda *a, **k: None
+	from IntechGridCommExt import IntechGridCommExt
+	comm.ext.IntechGridCommExt = IntechGridCommExt(comm)
+	return comp
+
+
+class _FakeJumpToOp:
+	currPane = None
+	currentZoom = 1.0
+
+	def Jump(self, *args, **kwargs):
+		pass
+
+	def setZoom(self, *args, **kwargs):
+		pass
+
+	def mousePosInEditor(self, *args, **kwargs):
+		return None
+
+
+def build_network(root, clones: int = 0):
+	"""Build /project1 with noise1 (float, int, menu and XYZ group pars) and optional clones"""
+	project = OP('project1', root)
+	targets = []
+	for i in range(1 + clones):
+		noise = OP(f'noise{i + 1}', project, family='TOP')
+		noise.par._add(Par(noise, 'amp', 1.0, normMin=0.0, normMax=10.0, isCustom=False, page='Noise'))
+		noise.par._add(Par(noise, 'seed', 1, normMin=0, normMax=100, isCustom=False, page='Noise'))
+		noise.par._add(Par(noise, 'type', 'sparse', 'Menu', isCustom=False, page='Noise',
+						   menuNames=['sparse', 'hermite', 'harmonic', 'perlin', 'simplex', 'random']))
+		members = [noise.par._add(Par(noise, f't{axis}', 0.0, 'XYZ', normMin=-1.0, normMax=1.0, isCustom=False, page='Transform'))
+				   for axis in 'xyz']
+		noise.parGroup._add(ParGroup(noise, 't', members))
+		targets.append(noise)
+	if clones:
+		project.selectedChildren = list(targets)
+	return project
+
+
+def load_extension(clones: int = 0):
+	"""Install the fake TD model, build the component and construct the extension"""
+	fake_td.reset()
+	fake_td.install()
+	for path in SCRIPT_DIRS:
+		if path not in sys.path:
+			sys.path.insert(0, path)
+	comp = build_component(fake_td.ROOT)
+	build_network(fake_td.ROOT, clones)
+	from HoveredMidiRelativeExt import HoveredMidiRelativeExt
+	ext = HoveredMidiRelativeExt(comp)
+	comp.ext.HoveredMidiRelativeExt = ext
+	# Let the delayed postInit and startup runs execute
+	SCHEDULER.drain(max_frames=200)
+	return ext
+
+
+def knob_storm(count: int, rate: float, target: str = 'amp', value: int = 65, reverse_every: int = 0):
+	"""Synthetic events: hover a parameter, then spin the knob at the given message rate"""
+	events = []
+	par_group, par = ('t', '') if target == 't' else ('', target)
+	events.append({'t': 0.0, 'cb': 'onHoveredParChange', 'args': ['/project1/noise1', par_group, par, '', '']})
+	interval = 1.0 / rate
+	for i in range(count):
+		direction_value = value
+		if reverse_every and (i // reverse_every) % 2:
+			direction_value = 128 - value
+		events.append({
+			't': 0.05 + i * interval,
+			'cb': 'onReceiveMidi',
+			'args': ['midiin_active', i, 'Control Change', CHANNEL, KNOB_INDEX, direction_value, 0, [0xB0 + CHANNEL - 1, KNOB_INDEX, direction_value]]
+		})
+	return events
+
+
+def load_events(path: str, path_map: dict = None) -> list:
+	events = []
+	with open(path, encoding='utf-8') as f:
+		for line in f:
+			line = line.strip()
+			if not line:
+				continue
+			event = json.loads(line)
+			if path_map and event['cb'] == 'onHoveredParChange' and event['args'] and event['args'][0] in path_map:
+				event['args'][0] = path_map[event['args'][0]]
+			events.append(event)
+	return events
+
+
+def percentiles(samples: list) -> dict:
+	if not samples:
+		return {}
+	ordered = sorted(samples)
+	def pick(q):
+		return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+	return {
+		'count': len(ordered),
+		'p50_us': pick(0.50) * 1e6,
+		'p90_us': pick(0.90) * 1e6,
+		'p99_us': pick(0.99) * 1e6,
+		'max_us': ordered[-1] * 1e6,
+		'total_ms': sum(ordered) * 1e3,
+	}
+
+
+def replay(ext, events: list, speed: float = 0.0) -> dict:
+	"""Replay events against the extension.
+
+	speed 0 replays as fast as possible on the virtual clock, speed 1 in real time.
+	"""
+	latencies = {}
+
+	def on_run(script, elapsed):
+		latencies.setdefault(f'run: {script}', []).append(elapsed)
+
+	SCHEDULER.on_run = on_run
+	STATS.reset()
+	grid_comm = ext.display_manager.grid_comm
+	grid_comm.ResetMessageStats()
+	base_time = SCHEDULER.seconds
+	wall_start = time.perf_counter()
+	skipped = 0
+
+	for event in events:
+		callback_name = event['cb']
+		if callback_name not in RECORDED_CALLBACKS:
+			skipped += 1
+			continue
+		event_time = base_time + event['t']
+		if speed > 0:
+			wait = wall_start + event['t'] / speed - time.perf_counter()
+			if wait > 0:
+				time.sleep(wait)
+		SCHEDULER.advance_to(event_time)
+		callback = getattr(ext, callback_name)
+		start = time.perf_counter()
+		callback(*event['args'])
+		latencies.setdefault(callback_name, []).append(time.perf_counter() - start)
+
+	# Let trailing frame-end/timer work finish (display flushes, undo timeouts, ...)
+	SCHEDULER.advance_to(SCHEDULER.seconds + 2.0)
+	SCHEDULER.on_run = None
+
+	return {
+		'events': len(events) - skipped,
+		'skipped': skipped,
+		'wall_s': time.perf_counter() - wall_start,
+		'virtual_s': SCHEDULER.seconds - base_time,
+		'stats': dict(STATS.as_dict(), lua_calls=grid_comm.luaCalls),
+		'latency': {name: percentiles(samples) for name, samples in sorted(latencies.items())},
+	}
+
+
+def print_report(result: dict):
+	print(f"events: {result['events']} (skipped {result['skipped']})  "
+		  f"wall: {result['wall_s']:.3f}s  virtual: {result['virtual_s']:.3f}s")
+	for key, value in result['stats'].items():
+		print(f'  {key:<22} {value}')
+	print()
+	print(f"{'callback':<48} {'count':>7} {'p50 us':>9} {'p90 us':>9} {'p99 us':>9} {'max us':>9} {'total ms':>9}")
+	for name, p in result['latency'].items():
+		label = name if len(name) <= 48 else name[:45] + '...'
+		print(f"{label:<48} {p['count']:>7} {p['p50_us']:>9.1f} {p['p90_us']:>9.1f} "
+			  f"{p['p99_us']:>9.1f} {p['max_us']:>9.1f} {p['total_ms']:>9.2f}")
+	if 'emulator' in result:
+		print()
+		print('VSN1 emulator')
+		for key, value in result['emulator'].items():
+			print(f'  {key:<30} {value:.2f}' if isinstance(value, float) else f'  {key:<30} {value}')
+	if result.get('telemetry'):
+		print()
+		print('Bridge telemetry (IntechGridCommExt.Telemetry)')
+		for key, value in result['telemetry'].items():
+			print(f'  {key:<30} {value}')
+
+
+def check_golden(emulator, path: str, update: bool = False) -> bool:
+	"""Compare the emulated screen, LEDs and display state with a golden snapshot (written if missing)"""
+	snapshot = emulator.snapshot()
+	if update or not os.path.exists(path):
+		with open(path, 'w', encoding='utf-8') as f:
+			json.dump(snapshot, f, indent=2)
+		print(f'golden frame written: {path}')
+		return True
+	with open(path, encoding='utf-8') as f:
+		expected = json.load(f)
+	mismatched = [key for key in snapshot if snapshot[key] != expected.get(key)]
+	if mismatched:
+		print(f"golden frame mismatch ({', '.join(mismatched)}): {path}")
+		return False
+	print(f'golden frame match: {path}')
+	return True
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+	parser.add_argument('events', nargs='?', help='Recorded events (JSON lines) to replay')
+	parser.add_argument('--storm', type=int, default=0, help='Generate a synthetic knob storm with this many messages')
+	parser.add_argument('--rate', type=float, default=400.0, help='Knob messages per second for --storm')
+	parser.add_argument('--target', default='amp', choices=['amp', 'seed', 'type', 't'], help='Hovered parameter for --storm')
+	parser.add_argument('--reverse-every', type=int, default=0, help='Flip knob direction every N messages')
+	parser.add_argument('--multi', type=int, default=0, help='Select N clones and enable Relative multi-adjust')
+	parser.add_argument('--stepmode', choices=['Fixed', 'Adaptive'], default='Fixed')
+	parser.add_argument('--accel', type=float, default=0.0, help='Knob acceleration amount (set on the extension, the component has no parameter for it yet)')
+	parser.add_argument('--speed', type=float, default=0.0, help='Replay speed (0 = as fast as possible, 1 = real time)')
+	parser.add_argument('--map', action='append', default=[], metavar='OLD=NEW', help='Rename operator paths in recorded hover events')
+	parser.add_argument('--json', help='Write the result to a JSON file')
+	parser.add_argument('--emulate', action='store_true', help='Feed the websocket output to the headless VSN1 emulator')
+	parser.add_argument('--golden', help='Compare the final emulated frame with this snapshot (written if missing)')
+	parser.add_argument('--update-golden', action='store_true', help='Overwrite the --golden snapshot')
+	parser.add_argument('--dump-frame', metavar='FILE.ppm', help='Save the final emulated frame as a PPM image')
+	args = parser.parse_args(argv)
+
+	if not args.events and not args.storm:
+		parser.error('give a recorded events file or --storm N')
+
+	emulator = None
+	if args.emulate or args.golden or args.dump_frame:
+		from vsn1_emulator import VSN1Emulator
+		emulator = VSN1Emulator()
+		fake_td.WS_LISTENERS[:] = [emulator.receive]
+		# Acks flow back through the websocket, and the bridge timers run on the frame clock
+		def reply(**message):
+			fake_td.ROOT.op('ParHoverMIDI_VSN1/IntechGridComm/websocket1').receiveText(json.dumps(message))
+		emulator.bridge.on_ack = lambda key, count: reply(event='ack', key=key, count=count)
+		emulator.bridge.on_pacing = lambda interval_ms, estimate_ms: reply(event='pacing', intervalMs=interval_ms, estimateMs=estimate_ms)
+		emulator.bridge.on_telemetry = lambda fields: reply(event='telemetry', **fields)
+		emulator.bridge.on_echo_lost = lambda: reply(event='echo-lost')
+		SCHEDULER.frame_listeners[:] = [lambda: emulator.bridge.tick(SCHEDULER.seconds)]
+
+	ext = load_extension(clones=args.multi)
+	ext.ownerComp.par.Stepmode.val = args.stepmode
+	# Knob acceleration has no parameter on the component yet, set the value the extension reads directly
+	ext.evalKnobacceleration = args.accel
+	if args.multi:
+		ext.ownerComp.par.Multiadjustmode.val = 'Relative'
+
+	if args.events:
+		path_map = dict(item.split('=', 1) for item in args.map)
+		events = load_events(args.events, path_map)
+	else:
+		events = knob_storm(args.storm, args.rate, args.target, reverse_every=args.reverse_every)
+
+	if emulator:
+		# Only count the replay, the startup frames still set up the screen
+		emulator.reset_counters()
+	result = replay(ext, events, speed=args.speed)
+	if emulator:
+		emulator.finish(SCHEDULER.seconds)
+		result['emulator'] = emulator.summary(result['events'])
+		# What IntechGridCommExt decoded from the last telemetry message
+		result['telemetry'] = dict(ext.ownerComp.op('IntechGridComm').ext.IntechGridCommExt.Telemetry.val)
+		for error in emulator.errors[:10]:
+			print(f'emulator: {error}')
+	print_report(result)
+	if args.json:
+		with open(args.json, 'w', encoding='utf-8') as f:
+			json.dump(result, f, indent=2)
+	if emulator and args.dump_frame:
+		emulator.write_ppm(args.dump_frame)
+	if emulator and args.golden and not check_golden(emulator, args.golden, args.update_golden):
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,32 @@
+'''Smoke tests for the bench harness: run replay.py like from the command line.
+
+	python -m pytest bench
+'''
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+GOLDEN = os.path.join(BENCH_DIR, 'golden', 'storm2000.json')
+
+
+def _replay(*args):
+	return subprocess.run(
+		[sys.executable, os.path.join(BENCH_DIR, 'replay.py'), *args],
+		cwd=REPO_DIR, capture_output=True, text=True, timeout=300)
+
+
+def test_storm():
+	result = _replay('--storm', '200')
+	assert result.returncode == 0, result.stdout + result.stderr
+	assert 'events: 201' in result.stdout
+
+
+def test_storm_golden_frame():
+	# A missing snapshot would be written and pass, so it has to exist up front
+	assert os.path.exists(GOLDEN)
+	result = _replay('--storm', '2000', '--emulate', '--golden', GOLDEN)
+	assert result.returncode == 0, result.stdout + result.stderr
+	assert 'golden frame match' in result.stdout
+	assert 'emulator:' not in result.stdout
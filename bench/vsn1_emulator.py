@@ -0,0 +1,645 @@
+'''Headless VSN1 emulator for measuring what the display pipeline costs on the module.
+
+Takes the websocket payloads the extension sends (through the same queueing as the
+Grid package bridge in index.js), interprets the Lua calls into a 320x240 framebuffer
+and an LED array, and counts bytes, messages, draw calls and screen swaps (ldsw).
+
+Only the Lua the extension emits is understood: the VSN1Routines install block and
+routine calls (pu, hc, ho, hb, hm, hl), plus update_param(), set_led() / set_l(),
+lcd:ldaf(), lcd:ldrr() and lcd:ldsw(). update_param() itself lives in the VSN1 profile,
+so its drawing here is a simplified layout (label, value bar, bottom text, step
+indicator, slot labels, bank) - good for golden frame comparisons and draw call
+counts, not a pixel-exact copy of the module.
+
+The framebuffer is a NumPy array when NumPy is installed, a bytearray otherwise.
+'''
+import hashlib
+import json
+import re
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
+WIDTH = 320
+HEIGHT = 240
+NUM_LEDS = 32
+BRIDGE_QUEUE_INTERVAL = 0.05  # index.js messageQueTimeout before pacing adapts
+PACING_MIN_INTERVAL = 0.02  # index.js pacingMinMs / pacingMaxMs defaults
+PACING_MAX_INTERVAL = 0.2
+PACING_SMOOTHING = 0.2
+PACING_SAMPLE_EVERY = 8  # index.js pacingSampleEvery
+PACKAGE_ID = 'package-touchdesigner-parhover'
+PACING_ECHO_ID = '__pacing'
+TELEMETRY_INTERVAL = 1.0  # index.js telemetryInterval
+PACING_ECHO_TIMEOUT = 1.0  # index.js pacingEchoTimeout
+# Rough module execution time model, only used for the pacing echo
+MODULE_SCRIPT_TIME = 0.004
+MODULE_DRAW_CALL_TIME = 0.0015
+
+# Profile color table c[1..3] (black, white, accent)
+PALETTE = {
+	1: (0, 0, 0),
+	2: (255, 255, 255),
+	3: (255, 140, 0),
+}
+
+NIL = object()  # pn, the pu() sentinel for fields that become nil
+UPDATE_PARAM_FIELDS = ('val', 'min', 'max', 'label', 'bottom', 'step', 'default', 'info', 'clamps', 'bank')
+
+
+class LuaSyntaxError(ValueError):
+	pass
+
+
+class LuaReader:
+	"""Tiny reader for the Lua subset the extension sends: call statements with literal arguments"""
+
+	_NUMBER = re.compile(r'-?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?')
+	_NAME = re.compile(r'[A-Za-z_]\w*')
+
+	def __init__(self, text: str, variables: dict):
+		self.text = text
+		self.pos = 0
+		self.variables = variables
+
+	def skip(self):
+		while self.pos < len(self.text) and self.text[self.pos] in ' \t\r\n;':
+			self.pos += 1
+
+	def done(self) -> bool:
+		self.skip()
+		return self.pos >= len(self.text)
+
+	def expect(self, char: str):
+		self.skip()
+		if self.text[self.pos:self.pos + 1] != char:
+			raise LuaSyntaxError(f'expected {char!r} at {self.pos}: {self.text[self.pos:self.pos + 20]!r}')
+		self.pos += 1
+
+	def name(self) -> str:
+		self.skip()
+		match = self._NAME.match(self.text, self.pos)
+		if not match:
+			raise LuaSyntaxError(f'expected a name at {self.pos}: {self.text[self.pos:self.pos + 20]!r}')
+		self.pos = match.end()
+		return match.group()
+
+	def value(self):
+		self.skip()
+		char = self.text[self.pos:self.pos + 1]
+		if char in ('"', "'"):
+			end = self.text.index(char, self.pos + 1)
+			result = self.text[self.pos + 1:end]
+			self.pos = end + 1
+			return result
+		if char == '{':
+			return self.table()
+		number = self._NUMBER.match(self.text, self.pos)
+		if number:
+			self.pos = number.end()
+			result = float(number.group())
+			return int(result) if result.is_integer() and '.' not in number.group() else result
+		identifier = self.name()
+		if identifier in ('true', 'false'):
+			return identifier == 'true'
+		if identifier == 'nil':
+			return None
+		if self.text[self.pos:self.pos + 1] == '[':
+			self.pos += 1
+			index = self.value()
+			self.expect(']')
+			return self.variables.get(identifier, {}).get(index)
+		return self.variables.get(identifier)
+
+	def table(self) -> dict:
+		"""Read a table constructor as a dict (positional items get 1-based keys)"""
+		self.expect('{')
+		result = {}
+		position = 1
+		while True:
+			self.skip()
+			if self.text[self.pos:self.pos + 1] == '}':
+				self.pos += 1
+				return result
+			if self.text[self.pos] == '[':
+				self.pos += 1
+				key = self.value()
+				self.expect(']')
+				self.expect('=')
+				result[key] = self.value()
+			else:
+				result[position] = self.value()
+				position += 1
+			self.skip()
+			if self.text[self.pos:self.pos + 1] == ',':
+				self.pos += 1
+
+	def arguments(self) -> list:
+		self.skip()
+		if self.text[self.pos:self.pos + 1] == '{':
+			return [self.table()]
+		self.expect('(')
+		args = []
+		while True:
+			self.skip()
+			if self.text[self.pos:self.pos + 1] == ')':
+				self.pos += 1
+				return args
+			args.append(self.value())
+			self.skip()
+			if self.text[self.pos:self.pos + 1] == ',':
+				self.pos += 1
+
+
+class BridgeModel:
+	"""Websocket side of index.js: execute-code goes straight through, queue-code / queue-state are kept
+	per coalescing key (latest wins, queue-state merges fields) and forwarded round-robin, one message per
+	queue interval. Time only moves when a payload arrives or tick() is called.
+	on_ack(key, count) is called for every forwarded queued message, like the ack index.js sends back.
+	Every PACING_SAMPLE_EVERY-th forwarded message ends with the pacing echo; echo() adapts the interval and
+	calls on_pacing(interval_ms, estimate_ms) when it changes, on_telemetry(fields) once per TELEMETRY_INTERVAL,
+	on_echo_lost() when forwarded scripts stopped echoing for PACING_ECHO_TIMEOUT.
+	
+	This is a hand-kept copy of the queue, pacing and telemetry logic in index.js (the package is
+	JavaScript and runs in the Grid Editor), update it alongside index.js."""
+
+	DEFAULT_KEY = 'display'
+
+	def __init__(self, deliver, interval: float = BRIDGE_QUEUE_INTERVAL):
+		self.deliver = deliver
+		self.interval = interval
+		self.pending = {}  # key -> message, in round-robin order
+		self.timer_due = None
+		self.replaced = 0
+		self.acks = 0
+		self.on_ack = None
+		self.estimate = interval
+		self.seq = 0
+		self.forwards_since_sample = 0
+		self.sample_next = True
+		self.sent_at = {}  # echo seq -> forward time
+		self.min_interval = PACING_MIN_INTERVAL
+		self.max_interval = PACING_MAX_INTERVAL
+		self.echo_routine = None
+		self.on_pacing = None
+		self.echo_check_due = None
+		self.echoes_lost = 0
+		self.on_echo_lost = None
+		# Telemetry counters (index.js newTelemetry)
+		self.frames_in = 0
+		self.execute_out = 0
+		self.bytes_out = 0
+		self.latency = None
+		self.telemetry_due = None
+		self.on_telemetry = None
+
+	def receive(self, text: str, now: float):
+		self.tick(now)
+		data = json.loads(text)
+		key = data.get('key') or self.DEFAULT_KEY
+		if data['type'] == 'execute-code':
+			self.execute_out += 1
+			self._forward(data['script'], now)
+		elif data['type'] == 'queue-code':
+			self._queue(key, {'script': data['script']}, now)
+		elif data['type'] == 'queue-state':
+			pending = self.pending[key].get('state') if key in self.pending else None
+			prefix = (pending['prefix'] if pending else '') + data.get('prefix', '')
+			if pending and not data.get('reset') and pending['func'] == data['func']:
+				state = dict(pending, prefix=prefix, fields={**pending['fields'], **data['fields']})
+			else:
+				state = {'func': data['func'], 'prefix': prefix, 'fields': dict(data['fields'])}
+			# JS orders integer-like object keys numerically
+			table = ','.join(f'[{k}]={v}' for k, v in sorted(state['fields'].items(), key=lambda kv: int(kv[0])))
+			self._queue(key, {'script': f"{state['prefix']}{state['func']}{{{table}}}", 'state': state}, now)
+		elif data['type'] == 'configure-pacing':
+			self.min_interval = data.get('minMs', self.min_interval * 1000) / 1000
+			self.max_interval = max(self.min_interval, data.get('maxMs', self.max_interval * 1000) / 1000)
+			self.echo_routine = data.get('echo', self.echo_routine)
+			self.sample_next = True
+
+	def _forward(self, script: str, now: float):
+		self.bytes_out += len(script.encode('utf-8'))
+		self.deliver(script, now)
+
+	def _queue(self, key: str, message: dict, now: float):
+		self.frames_in += 1
+		if key in self.pending:
+			self.replaced += 1
+			message['count'] = self.pending[key]['count'] + 1
+		else:
+			message['count'] = 1
+		self.pending[key] = message
+		if self.timer_due is None:
+			self._send_next(now)
+
+	def _send_next(self, now: float):
+		self.timer_due = None
+		if not self.pending:
+			return
+		key = next(iter(self.pending))
+		message = self.pending.pop(key)
+		self._check_echoes(now)
+		# The echo arrives after the next timer was set
+		self.timer_due = now + self.interval
+		self.echo_check_due = now + PACING_ECHO_TIMEOUT
+		script = message['script']
+		self.forwards_since_sample += 1
+		if self.sample_next or self.forwards_since_sample >= PACING_SAMPLE_EVERY:
+			self.sample_next = False
+			self.forwards_since_sample = 0
+			seq = self.seq
+			self.seq += 1
+			self.sent_at[seq] = now
+			if self.echo_routine:
+				script += f' {self.echo_routine}({seq})'
+			else:
+				script += f' gps("{PACKAGE_ID}","{PACING_ECHO_ID}",{seq})'
+		self._forward(script, now)
+		self.acks += 1
+		if self.on_ack is not None:
+			self.on_ack(key, message['count'])
+
+	def _check_echoes(self, now: float):
+		"""checkPacingEchoes in index.js"""
+		if not self.sent_at or now - min(self.sent_at.values()) < PACING_ECHO_TIMEOUT:
+			return
+		self.sent_at.clear()
+		self.echo_routine = None
+		self.sample_next = True
+		self.echoes_lost += 1
+		if self.on_echo_lost is not None:
+			self.on_echo_lost()
+
+	def echo(self, seq: int, now: float):
+		"""The module ran a forwarded script (handlePacingEcho in index.js)"""
+		if seq not in self.sent_at:
+			return
+		sent_at = self.sent_at[seq]
+		for pending in [s for s in self.sent_at if s <= seq]:
+			del self.sent_at[pending]
+		self.latency = now - sent_at
+		self.estimate += PACING_SMOOTHING * (self.latency - self.estimate)
+		interval = round(min(self.max_interval, max(self.min_interval, self.estimate)), 3)
+		if interval != self.interval:
+			self.interval = interval
+			if self.on_pacing is not None:
+				self.on_pacing(round(interval * 1000), round(self.estimate * 1000))
+
+	def tick(self, now: float):
+		"""Fire queue timers that are due by now"""
+		while self.timer_due is not None and now >= self.timer_due:
+			self._send_next(self.timer_due)
+		if self.echo_check_due is not None and now >= self.echo_check_due:
+			self.echo_check_due = None
+			self._check_echoes(now)
+		if self.on_telemetry is not None:
+			if self.telemetry_due is None:
+				self.telemetry_due = now + TELEMETRY_INTERVAL
+			while now >= self.telemetry_due:
+				self.telemetry_due += TELEMETRY_INTERVAL
+				self.on_telemetry(self.telemetry())
+
+	def telemetry(self) -> dict:
+		"""Fields of the index.js telemetry message (screen dimming and timestamps are not modelled)"""
+		return {
+			'framesIn': self.frames_in,
+			'framesOut': self.acks,
+			'framesDropped': self.replaced,
+			'executeOut': self.execute_out,
+			'bytesOut': self.bytes_out,
+			'latencyMs': -1 if self.latency is None else round(self.latency * 1000),
+			'queueDepth': len(self.pending),
+			'intervalMs': round(self.interval * 1000),
+			'estimateMs': round(self.estimate * 1000),
+		}
+
+
+class VSN1Emulator:
+	"""Screen, LEDs and routine state of one VSN1 module"""
+
+	def __init__(self, interval: float = BRIDGE_QUEUE_INTERVAL):
+		if np is not None:
+			self.back = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+			self.leds = np.zeros(NUM_LEDS, dtype=np.int32)
+		else:
+			self.back = bytearray(WIDTH * HEIGHT * 3)
+			self.leds = [0] * NUM_LEDS
+		self.front = self._copy(self.back)
+		self.bridge = BridgeModel(self.execute, interval)
+		self.reboot()
+		self.reset_counters()
+
+	def reboot(self):
+		"""Lose the Lua state like a module reboot or profile reload (the screen keeps its pixels)"""
+		# Lua globals the routines and profile use (c = color table, ps = pu() state)
+		self.variables = {'c': dict(PALETTE), 'pn': NIL, 'ps': {}, 'rc': 2, 'ci': 2, 'b': 0, 'hv': None}
+		self.routines = set()
+
+	def reset_counters(self):
+		self.messages_in = 0
+		self.bytes_in = 0
+		self.messages = 0
+		self.bytes = 0
+		self.draw_calls = 0
+		self.swaps = 0
+		self.update_params = 0
+		self.led_sets = 0
+		self.errors = []
+		self.records = []  # One per message delivered to the module
+		self.bridge.replaced = 0
+
+	# ------------------------------------------------------------------
+	# Input
+	# ------------------------------------------------------------------
+
+	def receive(self, text: str, now: float):
+		"""Websocket payload from IntechGridCommExt"""
+		self.messages_in += 1
+		self.bytes_in += len(text.encode('utf-8'))
+		self.bridge.receive(text, now)
+
+	def finish(self, now: float):
+		"""Let the bridge forward everything still queued"""
+		bridge = self.bridge
+		bridge.tick(now)
+		while bridge.pending:
+			bridge.tick(bridge.timer_due if bridge.timer_due is not None else now)
+
+	def execute(self, script: str, now: float = 0.0):
+		"""Run one Lua chunk as the module would receive it"""
+		draw_calls, swaps, led_sets = self.draw_calls, self.swaps, self.led_sets
+		self.messages += 1
+		self.bytes += len(script.encode('utf-8'))
+		self._echoes = []
+		try:
+			self._run_chunk(script)
+		except (LuaSyntaxError, ValueError, IndexError) as e:
+			self.errors.append(f'{e} in {script[:60]!r}')
+		done = now + MODULE_SCRIPT_TIME + (self.draw_calls - draw_calls) * MODULE_DRAW_CALL_TIME
+		for seq in self._echoes:
+			self.bridge.echo(seq, done)
+		self.records.append({
+			't': now,
+			'bytes': len(script.encode('utf-8')),
+			'draw_calls': self.draw_calls - draw_calls,
+			'swaps': self.swaps - swaps,
+			'led_sets': self.led_sets - led_sets,
+		})
+
+	_INSTALL = re.compile(r'if hv~=(\d+) then (.*?) hv=\1 end', re.S)
+
+	def _run_chunk(self, script: str):
+		# Batched scripts can hold the routine install block between plain calls
+		pos = 0
+		for install in self._INSTALL.finditer(script):
+			self._run_calls(script[pos:install.start()])
+			if self.variables['hv'] != int(install.group(1)):
+				self.routines.update(re.findall(r'function (\w+)\(', install.group(2)))
+				self.variables['hv'] = int(install.group(1))
+			pos = install.end()
+		self._run_calls(script[pos:])
+
+	def _run_calls(self, script: str):
+		reader = LuaReader(script, self.variables)
+		while not reader.done():
+			name = reader.name()
+			if reader.text[reader.pos:reader.pos + 1] == ':':
+				reader.pos += 1
+				name = f'{name}:{reader.name()}'
+			self.call(name, reader.arguments())
+
+	def call(self, name: str, args: list):
+		if name in ROUTINE_NAMES and name not in self.routines:
+			self.errors.append(f'{name}() called before the routines were installed')
+			return
+		handler = self.HANDLERS.get(name)
+		if handler is None:
+			self.errors.append(f'unknown call {name}()')
+			return
+		handler(self, *args)
+
+	# ------------------------------------------------------------------
+	# Routines (mirror VSN1Routines.ROUTINES)
+	# ------------------------------------------------------------------
+
+	def _pu(self, delta: dict):
+		state = self.variables['ps']
+		for key, value in delta.items():
+			if value is None or value is NIL:
+				state.pop(key, None)
+			else:
+				state[key] = value
+		self._update_param(*(state.get(i) for i in range(1, 11)))
+
+	def _hc(self):
+		self._ldaf(0, 0, 319, 239, PALETTE[1])
+		self._ldrr(3, 3, 317, 237, 10, PALETTE[2])
+		self._ldsw()
+
+	def _ho(self, color_index):
+		self.variables['rc'] = color_index
+		self._ldrr(3, 3, 317, 237, 10, PALETTE.get(color_index, PALETTE[2]))
+		self._ldsw()
+
+	def _hb(self, bank_idx):
+		self.variables['b'] = bank_idx
+		self._ldsw()
+
+	def _hm(self, color_index):
+		self.variables['ci'] = color_index
+
+	def _hl(self, leds: dict):
+		for idx, value in leds.items():
+			self._set_led(idx, 1, value)
+
+	def _he(self, seq):
+		self._gps(PACKAGE_ID, PACING_ECHO_ID, seq)
+
+	# ------------------------------------------------------------------
+	# Module API
+	# ------------------------------------------------------------------
+
+	def _set_led(self, idx, layer, value):
+		self.led_sets += 1
+		if 0 <= int(idx) < NUM_LEDS:
+			self.leds[int(idx)] = int(value)
+
+	def _gps(self, package, event, value):
+		if package == PACKAGE_ID and event == PACING_ECHO_ID:
+			self._echoes.append(int(value))
+
+	def _update_param(self, val=None, norm_min=None, norm_max=None, label=None, bottom=None,
+					  step=None, default=None, info=None, clamps=None, bank=None):
+		"""Simplified stand-in for the profile's update_param() screen"""
+		self.update_params += 1
+		white, accent, black = PALETTE[2], PALETTE[3], PALETTE[1]
+		self._ldaf(8, 8, 311, 231, black)
+		self._text(20, 20, str(label or ''), white, 3)
+		# Value bar with default notch and clamp caps
+		span = (norm_max or 0) - (norm_min or 0)
+		fill = 0.0
+		if isinstance(val, (int, float)) and span:
+			fill = min(max((val - norm_min) / span, 0.0), 1.0)
+		self._ldrr(20, 90, 299, 120, 4, white)
+		if fill > 0:
+			self._ldaf(22, 92, 22 + int(275 * fill), 118, accent)
+		if isinstance(default, (int, float)) and 0 <= default <= 1:
+			x = 22 + int(275 * default)
+			self._ldaf(x, 86, x + 1, 124, white)
+		if isinstance(clamps, dict):
+			if clamps.get(1):
+				self._ldaf(14, 90, 17, 120, accent)
+			if clamps.get(2):
+				self._ldaf(302, 90, 305, 120, accent)
+		self._text(20, 135, str(bottom or ''), white, 3)
+		# Step indicator
+		for i in range(4):
+			color = PALETTE.get(self.variables['ci'], accent) if step == i else white
+			self._ldrr(20 + i * 30, 170, 40 + i * 30, 180, 2, color)
+		# Slot labels (two rows of four) and bank
+		if isinstance(info, dict):
+			for i in range(8):
+				self._text(20 + (i % 4) * 72, 196 + (i // 4) * 16, str(info.get(i + 1, '')), white, 1)
+		if isinstance(bank, (int, float)):
+			self._ldaf(280 + int(bank) * 6, 170, 283 + int(bank) * 6, 180, accent)
+		self._ldsw()
+
+	def _ldaf(self, x1, y1, x2, y2, color):
+		"""Filled rectangle"""
+		self.draw_calls += 1
+		self._fill(x1, y1, x2, y2, self._color(color))
+
+	def _ldrr(self, x1, y1, x2, y2, r, color):
+		"""Rounded rectangle outline"""
+		self.draw_calls += 1
+		color = self._color(color)
+		r = max(0, min(int(r), (x2 - x1) // 2, (y2 - y1) // 2))
+		self._fill(x1 + r, y1, x2 - r, y1, color)
+		self._fill(x1 + r, y2, x2 - r, y2, color)
+		self._fill(x1, y1 + r, x1, y2 - r, color)
+		self._fill(x2, y1 + r, x2, y2 - r, color)
+		for dx in range(r + 1):
+			dy = int(round((r * r - dx * dx) ** 0.5))
+			for cx, cy, sx, sy in ((x1 + r, y1 + r, -1, -1), (x2 - r, y1 + r, 1, -1), (x1 + r, y2 - r, -1, 1), (x2 - r, y2 - r, 1, 1)):
+				self._fill(cx + sx * dx, cy + sy * dy, cx + sx * dx, cy + sy * dy, color)
+
+	def _ldsw(self):
+		"""Swap: the drawn buffer becomes visible"""
+		self.swaps += 1
+		self.front = self._copy(self.back)
+
+	def _text(self, x, y, text, color, scale):
+		"""Text as 5x7 blocks derived from the character codes (no font, but every string draws differently)"""
+		self.draw_calls += 1
+		color = self._color(color)
+		for i, char in enumerate(text):
+			if char == ' ':
+				continue
+			bits = (ord(char) * 2654435761) & 0x7FFFFFFFF
+			for bit in range(35):
+				if bits >> bit & 1:
+					px = x + (i * 6 + bit % 5) * scale
+					py = y + (bit // 5) * scale
+					self._fill(px, py, px + scale - 1, py + scale - 1, color)
+
+	HANDLERS = {
+		'pu': _pu,
+		'hc': _hc,
+		'ho': _ho,
+		'hb': _hb,
+		'hm': _hm,
+		'hl': _hl,
+		'he': _he,
+		'update_param': _update_param,
+		'gps': _gps,
+		'set_led': _set_led,
+		'set_l': _set_led,
+		'lcd:ldaf': _ldaf,
+		'lcd:ldrr': _ldrr,
+		'lcd:ldsw': _ldsw,
+	}
+
+	# ------------------------------------------------------------------
+	# Framebuffer helpers
+	# ------------------------------------------------------------------
+
+	@staticmethod
+	def _color(color):
+		if isinstance(color, tuple):
+			return color
+		return PALETTE.get(color, PALETTE[2])
+
+	@staticmethod
+	def _copy(buffer):
+		return buffer.copy() if np is not None else bytearray(buffer)
+
+	def _fill(self, x1, y1, x2, y2, color):
+		x1, x2 = sorted((max(0, int(x1)), min(WIDTH - 1, int(x2))))
+		y1, y2 = sorted((max(0, int(y1)), min(HEIGHT - 1, int(y2))))
+		if x1 > x2 or y1 > y2:
+			return
+		if np is not None:
+			self.back[y1:y2 + 1, x1:x2 + 1] = color
+			return
+		row = bytes(color) * (x2 - x1 + 1)
+		for y in range(y1, y2 + 1):
+			start = (y * WIDTH + x1) * 3
+			self.back[start:start + len(row)] = row
+
+	# ------------------------------------------------------------------
+	# Output
+	# ------------------------------------------------------------------
+
+	def frame_bytes(self) -> bytes:
+		"""Visible framebuffer as packed RGB rows"""
+		return self.front.tobytes() if np is not None else bytes(self.front)
+
+	def snapshot(self) -> dict:
+		"""Digest of everything visible on the module, for golden frame comparisons"""
+		return {
+			'frame_sha1': hashlib.sha1(self.frame_bytes()).hexdigest(),
+			'leds': [int(v) for v in self.leds],
+			'state': {UPDATE_PARAM_FIELDS[k - 1]: _plain(v) for k, v in sorted(self.variables['ps'].items())},
+		}
+
+	def write_ppm(self, path: str):
+		with open(path, 'wb') as f:
+			f.write(f'P6 {WIDTH} {HEIGHT} 255\n'.encode('ascii'))
+			f.write(self.frame_bytes())
+
+	def summary(self, interactions: int = 0) -> dict:
+		result = {
+			'ws_messages': self.messages_in,
+			'ws_bytes': self.bytes_in,
+			'bridge_replaced': self.bridge.replaced,
+			'bridge_acks': self.bridge.acks,
+			'bridge_interval_ms': round(self.bridge.interval * 1000),
+			'module_messages': self.messages,
+			'module_bytes': self.bytes,
+			'update_params': self.update_params,
+			'draw_calls': self.draw_calls,
+			'ldsw': self.swaps,
+			'led_sets': self.led_sets,
+			'max_draw_calls_per_message': max((r['draw_calls'] for r in self.records), default=0),
+			'errors': len(self.errors),
+		}
+		if interactions:
+			result['ldsw_per_interaction'] = self.swaps / interactions
+			result['module_bytes_per_interaction'] = self.bytes / interactions
+		return result
+
+
+ROUTINE_NAMES = {'pu', 'hc', 'ho', 'hb', 'hm', 'hl', 'he'}
+
+
+def _plain(value):
+	"""Lua table dicts as JSON friendly lists (array tables) or string-keyed dicts"""
+	if not isinstance(value, dict):
+		return value
+	if list(value) == list(range(1, len(value) + 1)):
+		return [_plain(v) for v in value.values()]
+	return {str(k): _plain(v) for k, v in value.items()}
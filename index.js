@@ -3,6 +3,7 @@ const path = require("path");
 const WebSocket = require("ws");
 
 const websocketPort = 9642;
+const packageId = require("./package.json").name;
 let activeWindowTitle = "TouchDesigner";
 
 let wss = undefined;
@@ -20,32 +21,180 @@ let screenActiveLevel = 100; // 0-100%, 100 = full brightness
 
 let actionId = 0;
 
-let latestUpdateParameMessage = undefined;
+// Latest pending message per coalescing key (display, leds, bank, ...), in round-robin order.
+// The queue, pacing and telemetry logic is mirrored by BridgeModel in bench/vsn1_emulator.py, keep them in sync.
+const pendingMessages = new Map();
+const defaultQueueKey = "display";
 let messageQueTimeoutId = undefined;
 let messageQueTimeout = 50;
 
+// Adaptive pacing: sampled queued scripts end with an echo back to this package (gps() or the installed
+// routine TouchDesigner names), the time from forwarding to the echo (module ran the script) is smoothed
+// and used as messageQueTimeout. Only every pacingSampleEvery-th forward is echoed, plus the first one
+// after (re)connecting or reconfiguring, to keep module -> package traffic low.
+const pacingEchoId = "__pacing";
+const pacingSmoothing = 0.2;
+let pacingMinMs = 20;
+let pacingMaxMs = 200;
+let pacingEstimateMs = messageQueTimeout;
+let pacingSeq = 0;
+const pacingSampleEvery = 8;
+let pacingForwardsSinceSample = 0;
+let pacingSampleNext = true;
+let pacingEcho = undefined; // Installed echo routine name, set by TouchDesigner
+const pacingSentAt = new Map(); // echo seq -> forward time, oldest first
+const pacingMaxInFlight = 32; // Forget the oldest echoes if the module never answers
+// No echo for this long: scripts stop before their end, e.g. the module rebooted or reloaded its
+// profile and lost the routines. TouchDesigner is told to install them again.
+const pacingEchoTimeout = 1000;
+let echoCheckTimeoutId = undefined;
+
+// Telemetry sent to TouchDesigner every telemetryInterval ms while it is connected.
+// Counters are cumulative since the connection, TouchDesigner derives rates.
+const telemetryInterval = 1000;
+let telemetryIntervalId = undefined;
+let telemetry = newTelemetry();
+
+function newTelemetry() {
+  return {
+    framesIn: 0, // queue-code / queue-state messages received
+    framesOut: 0, // queued messages forwarded to the module
+    framesDropped: 0, // queued messages replaced by a newer one before they were forwarded
+    executeOut: 0, // execute-code messages forwarded right away
+    bytesOut: 0, // script bytes forwarded to the module
+    latencyMs: -1, // last forward-to-echo round trip
+    lastForwardAt: undefined,
+    lastEchoAt: undefined,
+  };
+}
+
+function sendTelemetry() {
+  const now = performance.now();
+  const { lastForwardAt, lastEchoAt, ...counters } = telemetry;
+  clientWs?.send(JSON.stringify({
+    event: "telemetry",
+    ...counters,
+    queueDepth: pendingMessages.size,
+    intervalMs: messageQueTimeout,
+    estimateMs: Math.round(pacingEstimateMs),
+    screenActive: isScreenActive,
+    sinceForwardMs: lastForwardAt === undefined ? -1 : Math.round(now - lastForwardAt),
+    sinceEchoMs: lastEchoAt === undefined ? -1 : Math.round(now - lastEchoAt),
+  }));
+}
+
+function forwardScript(message) {
+  telemetry.bytesOut += Buffer.byteLength(message.script);
+  telemetry.lastForwardAt = performance.now();
+  controller.sendMessageToEditor(message);
+}
+
 let ledState = "auto"; // "auto" or "red"
 
 let inactivityTimeoutId = undefined;
 let isScreenActive = true;
 
-function queUpdateMessage(message) {
-  latestUpdateParameMessage = message;
+// Latest-wins per key: a newer message replaces the pending one but keeps its turn.
+// count is the number of TouchDesigner messages it stands for, returned in the ack.
+function queUpdateMessage(message, key = defaultQueueKey) {
+  telemetry.framesIn++;
+  if (pendingMessages.has(key)) telemetry.framesDropped++;
+  message.count = (pendingMessages.get(key)?.count || 0) + 1;
+  pendingMessages.set(key, message);
   if (messageQueTimeoutId === undefined) {
     sendNextMessage();
   }
 }
 
+// Merge a state delta into the pending message so fields from skipped deltas are kept
+function queStateMessage(data) {
+  const key = data.key || defaultQueueKey;
+  const pending = pendingMessages.get(key)?.state;
+  // Prefixes (state setters) of skipped deltas still run, in order, even when the fields reset
+  const prefix = (pending?.prefix || "") + (data.prefix || "");
+  const state =
+    pending && !data.reset && pending.func === data.func
+      ? { ...pending, prefix, fields: { ...pending.fields, ...data.fields } }
+      : { func: data.func, prefix, fields: { ...data.fields } };
+  const table = Object.entries(state.fields)
+    .map(([key, value]) => `[${key}]=${value}`)
+    .join(",");
+  queUpdateMessage({
+    type: "execute-lua-script",
+    script: `${state.prefix}${state.func}{${table}}`,
+    targetDx: data.targetDx,
+    targetDy: data.targetDy,
+    state,
+  }, key);
+}
+
 function sendNextMessage() {
   clearTimeout(messageQueTimeoutId);
   messageQueTimeoutId = undefined;
-  if (!latestUpdateParameMessage) return;
+  // Oldest key first, a key queued again goes to the back
+  const next = pendingMessages.entries().next();
+  if (next.done) return;
 
-  controller.sendMessageToEditor(latestUpdateParameMessage);
-  latestUpdateParameMessage = undefined;
+  const [key, { state, count, ...message }] = next.value;
+  pendingMessages.delete(key);
+  checkPacingEchoes();
+  if (pacingSampleNext || ++pacingForwardsSinceSample >= pacingSampleEvery) {
+    pacingSampleNext = false;
+    pacingForwardsSinceSample = 0;
+    const seq = pacingSeq++;
+    message.script += pacingEcho
+      ? ` ${pacingEcho}(${seq})`
+      : ` gps("${packageId}","${pacingEchoId}",${seq})`;
+    pacingSentAt.set(seq, performance.now());
+    if (pacingSentAt.size > pacingMaxInFlight) {
+      pacingSentAt.delete(pacingSentAt.keys().next().value);
+    }
+  }
+  telemetry.framesOut++;
+  forwardScript(message);
+  clearTimeout(echoCheckTimeoutId);
+  echoCheckTimeoutId = setTimeout(checkPacingEchoes, pacingEchoTimeout);
+  // Credit back to TouchDesigner: these queued messages have reached the module
+  clientWs?.send(JSON.stringify({ event: "ack", key, count }));
   messageQueTimeoutId = setTimeout(sendNextMessage, messageQueTimeout);
 }
 
+function handlePacingEcho(seq) {
+  const sentAt = pacingSentAt.get(seq);
+  if (sentAt === undefined) return;
+  // Echoes arrive in order, anything older was lost
+  for (const pendingSeq of pacingSentAt.keys()) {
+    pacingSentAt.delete(pendingSeq);
+    if (pendingSeq === seq) break;
+  }
+  telemetry.lastEchoAt = performance.now();
+  telemetry.latencyMs = Math.round(telemetry.lastEchoAt - sentAt);
+  pacingEstimateMs += pacingSmoothing * (telemetry.latencyMs - pacingEstimateMs);
+  updatePacing();
+}
+
+function checkPacingEchoes() {
+  const oldest = pacingSentAt.values().next();
+  if (oldest.done || performance.now() - oldest.value < pacingEchoTimeout) return;
+  pacingSentAt.clear();
+  // The echo routine may be gone too, use the inline echo until it is announced again
+  pacingEcho = undefined;
+  pacingSampleNext = true;
+  clientWs?.send(JSON.stringify({ event: "echo-lost" }));
+}
+
+function updatePacing(force = false) {
+  const interval = Math.round(Math.min(pacingMaxMs, Math.max(pacingMinMs, pacingEstimateMs)));
+  if (interval === messageQueTimeout && !force) return;
+  messageQueTimeout = interval;
+  // Let TouchDesigner throttle to the same rate
+  clientWs?.send(JSON.stringify({
+    event: "pacing",
+    intervalMs: messageQueTimeout,
+    estimateMs: Math.round(pacingEstimateMs),
+  }));
+}
+
 function startInactivityTimeout() {
   clearTimeout(inactivityTimeoutId);
   
@@ -132,6 +281,10 @@ exports.loadPackage = async function (gridController, persistedData) {
 
     ws.on("message", handleWebsocketMessage);
     notifyStatusChange();
+    updatePacing(true);
+    telemetry = newTelemetry();
+    clearInterval(telemetryIntervalId);
+    telemetryIntervalId = setInterval(sendTelemetry, telemetryInterval);
     
     // Start inactivity timeout when client connects
     isScreenActive = true;
@@ -139,6 +292,10 @@ exports.loadPackage = async function (gridController, persistedData) {
 
     ws.on("close", () => {
       clientWs = undefined;
+      pacingEcho = undefined;
+      pacingSampleNext = true;
+      clearInterval(telemetryIntervalId);
+      telemetryIntervalId = undefined;
       // Clear inactivity timeout when client disconnects
       clearInactivityTimeout();
       isScreenActive = true;
@@ -156,6 +313,10 @@ exports.loadPackage = async function (gridController, persistedData) {
 
 exports.unloadPackage = async function () {
   clearTimeout(messageQueTimeoutId);
+  pendingMessages.clear();
+  pacingSentAt.clear();
+  clearTimeout(echoCheckTimeoutId);
+  clearInterval(telemetryIntervalId);
   clearInactivityTimeout();
   while (--actionId >= 0) {
     controller.sendMessageToEditor({
@@ -251,6 +412,10 @@ exports.addMessagePort = async function (port, senderId) {
 
 exports.sendMessage = async function (args) {
   if (Array.isArray(args)) {
+    if (args[0] === pacingEchoId) {
+      handlePacingEcho(args[1]);
+      return;
+    }
     if (watchForActiveWindow && !isWindowActive) {
       return;
     }
@@ -326,7 +491,8 @@ function handleWebsocketMessage(message) {
   }
   
   if (data.type === "execute-code") {
-    controller.sendMessageToEditor({
+    telemetry.executeOut++;
+    forwardScript({
       type: "execute-lua-script",
       script: data.script,
       targetDx: data.targetDx,
@@ -339,7 +505,17 @@ function handleWebsocketMessage(message) {
       script: data.script,
       targetDx: data.targetDx,
       targetDy: data.targetDy,
-    });
+    }, data.key);
+  }
+  else if (data.type === "queue-state") {
+    queStateMessage(data);
+  }
+  else if (data.type === "configure-pacing") {
+    pacingMinMs = data.minMs ?? pacingMinMs;
+    pacingMaxMs = Math.max(pacingMinMs, data.maxMs ?? pacingMaxMs);
+    pacingEcho = data.echo ?? pacingEcho;
+    pacingSampleNext = true;
+    updatePacing(true);
   }
 }
 
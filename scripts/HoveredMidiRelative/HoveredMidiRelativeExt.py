@@ -13,16 +13,16 @@ CustomParHelper: CustomParHelper = next(d for d in me.docked if 'ExtUtils' in d.
 
 # Import separated modules
 from constants import *
-from validators import ParameterValidator
+from validators import ParameterValidator, SelectionSnapshot
 from formatters import LabelFormatter
-from handlers import MidiMessageHandler
-from display_manager import DisplayManager
+from handlers import MidiMessageHandler, StepTable
+from display_manager import DisplayManager, RenderTarget, VSN1Target, WebsocketMirrorTarget
 from slot_manager import SlotManager
 from ui_manager import UIManager
 from undo_manager import UndoManager
 from repo_manager import RepoManager
 from zoom_manager import ZoomManager
-from decorators import require_valid_parameter, block_during_invalidation
+from decorators import require_valid_parameter, block_during_invalidation, record_event, EventRecorder
 
 
 
@@ -63,6 +63,9 @@ class HoveredMidiRelativeExt:
 		self.zoom_manager = ZoomManager(self)
 
 		self.hover_timeout_run = None  # Run object for hover timeout and empty display
+		self.midiRoutes: Dict[tuple, int] = {}  # (MidiRoute, MIDI index) -> block index
+		self.stepTable = StepTable()  # Step values, current step index and min/max of seqSteps
+		self.eventRecorder: Optional[EventRecorder] = None  # Active input recording (see bench/replay.py)
 		self.lastCachedChange = None
 		self.slotPars = [[None for _ in range(self.numSlots)] for _ in range(self.numBanks)]
 		self.bankActiveSlots = [None for _ in range(self.numBanks)]
@@ -108,6 +111,9 @@ class HoveredMidiRelativeExt:
 		# Load from tables on first run 
 		self.repo_manager.load_from_tables_if_needed()
 
+		self._rebuild_midi_routes()
+		self._rebuild_step_table()
+
 		run("args[0].postInit()", self, delayRef=op.TDResources, delayFrames=120)
 
 	def postInit(self):
@@ -129,7 +135,7 @@ class HoveredMidiRelativeExt:
 		else:
 			self.ui_manager.set_hovered_ui_color(-1, force=True)
 
-		step_indicator = next((i for i, s in enumerate(self.seqSteps) if s.par.Step.eval() == self._currStep), None)
+		step_indicator = self.stepTable.current_index
 		# set UI stuff based on current evalStepmode
 		self.ui_manager.set_stepmode_indicator(self.stepMode, step_indicator)
 		run("args[0].onMidiError(args[1])", self, self.midiError, delayRef=op.TDResources, delayFrames=5)
@@ -280,6 +286,7 @@ class HoveredMidiRelativeExt:
 		if not self.evalVsn1support:
 			return
 			
+		# Clearing installs the routines first
 		self.display_manager.clear_screen()
 		if self.activePar is not None:
 			self.display_manager.update_parameter_display(self.activePar, force_knob_leds=True)
@@ -302,7 +309,7 @@ class HoveredMidiRelativeExt:
 			self.display_manager.update_outline_color_index(VSN1ColorIndex.COLOR.value)  # Hover mode
 
 		if self.knobLedUpdateMode in [KnobLedUpdateMode.STEPS]:
-			step_idx = next((i for i, s in enumerate(self.seqSteps) if s.par.Step.eval() == self._currStep), 0)
+			step_idx = self.stepTable.current_index or 0
 			self.display_manager.update_knob_leds_steps(step_idx)
 		
 # region properties
@@ -417,6 +424,7 @@ class HoveredMidiRelativeExt:
 	@_currStep.setter
 	def _currStep(self, value: float):
 		self.currStep = value
+		self.stepTable.set_current(value)
 		self.display_manager.update_step_display(value)
 
 	@property
@@ -430,10 +438,18 @@ class HoveredMidiRelativeExt:
 		"""Get the current knob LED update mode from component parameter"""
 		return KnobLedUpdateMode(self.evalKnobledupdate)
 
+	@property
+	def relativeEncoding(self) -> RelativeEncoding:
+		"""Get the knob relative encoding from component parameter (binary offset if not available)"""
+		try:
+			return RelativeEncoding(getattr(self, 'evalRelativeencoding', RelativeEncoding.BINARY_OFFSET.value))
+		except ValueError:
+			return RelativeEncoding.BINARY_OFFSET
+
 	@property
 	def knobPushState(self) -> bool:
-		"""Get the current push state from component parameter"""
-		return self.ownerComp.op('null_push')[0].eval()
+		"""Get the current push state from the modifier mask"""
+		return bool(self.midi_handler.held_modifiers(ModifierBits.PUSH))
 
 	@property
 	def stepMode(self) -> StepMode:
@@ -516,11 +532,44 @@ class HoveredMidiRelativeExt:
 			self, delayMilliSeconds=delay_ms, delayRef=op.TDResources
 		)
 	
+	def StartEventRecording(self, file_path: str):
+		"""Record MIDI/hover input callbacks to a JSON lines file for offline replay (bench/replay.py)"""
+		self.StopEventRecording()
+		self.eventRecorder = EventRecorder(file_path)
+		debug(f'Recording input events to {file_path}')
+
+	def StopEventRecording(self):
+		"""Stop an active input recording and close its file"""
+		if self.eventRecorder is not None:
+			self.eventRecorder.close()
+			debug(f'Recorded {self.eventRecorder.count} events to {self.eventRecorder.file_path}')
+			self.eventRecorder = None
+
+	def AddGridModule(self, grid_comm_comp: COMP) -> VSN1Target:
+		"""Mirror the display to another VSN1 behind its own IntechGridComm component.
+		Point its onConnect callback at onGridConnect so the module is set up again after reconnecting."""
+		target = VSN1Target(self.display_manager, grid_comm_comp.ext.IntechGridCommExt)
+		self.display_manager.add_render_target(target)
+		return target
+
+	def AddWebsocketMirror(self, websocket: websocketDAT, min_interval_ms: float = DisplaySchedulerConstants.MIN_INTERVAL_MS) -> WebsocketMirrorTarget:
+		"""Mirror the display frames as JSON messages over a websocket DAT"""
+		target = WebsocketMirrorTarget(self.display_manager, websocket, min_interval_ms)
+		self.display_manager.add_render_target(target)
+		return target
+
+	def RemoveRenderTarget(self, target: RenderTarget):
+		"""Stop mirroring the display to a target added with AddGridModule/AddWebsocketMirror"""
+		self.display_manager.remove_render_target(target)
+
 # endregion helper methods
 
+	@record_event
 	@block_during_invalidation
 	def onHoveredParChange(self, _op, _parGroup, _par, _expr, _bindExpr):
 		"""TouchDesigner callback when hovered parameter changes"""
+		# The selection may have changed while the mouse was off the parameter
+		SelectionSnapshot.invalidate()
 		if not self.evalActive or self.midiError:
 			return
 
@@ -660,6 +709,7 @@ class HoveredMidiRelativeExt:
 				
 				# Only activate/display when no active slot
 				if self.activeSlot is None:
+					self.midi_handler.prepare_control_plan(par_group_obj)
 					self._set_parexec_pars(None)
 					# Capture initial values for undo when hovering
 					self.undo_manager.on_parameter_hovered(par_group_obj)
@@ -728,6 +778,7 @@ class HoveredMidiRelativeExt:
 
 # region midi callbacks
 
+	@record_event
 	@require_valid_parameter
 	def onReceiveMidi(self, dat, rowIndex, message, channel, index, value, input, byteData):
 		"""TouchDesigner callback for MIDI input processing"""
@@ -759,7 +810,19 @@ class HoveredMidiRelativeExt:
 				if not self._is_component_parameter():
 					self._start_hover_timeout(restart_if_sticky=True)
 				return
-	
+
+	def _flush_knob_deltas(self):
+		"""End-of-frame callback for the knob deltas coalesced during this frame.
+		Not guarded itself so the pending deltas are dropped while recovery blocks the apply.
+		"""
+		self.midi_handler.flush_knob_deltas()
+
+	@require_valid_parameter
+	def _apply_knob_deltas(self, active_par, diff: int, ticks: int):
+		"""Apply coalesced knob deltas, blocked while invalidation recovery is active"""
+		self.midi_handler.apply_knob_deltas(active_par, diff, ticks)
+
+	@record_event
 	def onReceiveStep(self, channel_name: str, value: int):
 		if not self.evalActive:
 			return
@@ -785,6 +848,7 @@ class HoveredMidiRelativeExt:
 			return
 				
 
+	@record_event
 	@block_during_invalidation
 	def onReceiveMidiLearn(self, dat, rowIndex, message, channel, index, value, input, byteData):
 		"""TouchDesigner callback for MIDI learning mode"""
@@ -821,11 +885,10 @@ class HoveredMidiRelativeExt:
 		"""TouchDesigner callback for slot learning"""
 		hovered_par = self.hoveredPar
 
-		blocks = self._index_to_blocks(index, self.seqSlots)
-		if not blocks:
+		block = self._route_block(MidiRoute.SLOT, index, self.seqSlots)
+		if block is None:
 			return
 			
-		block = blocks[0]
 		block_idx = block.index
 		
 		if hovered_par is not None:
@@ -1048,13 +1111,44 @@ class HoveredMidiRelativeExt:
 		except (ValueError, TypeError, AttributeError):
 			return default
 	
-	def _index_to_blocks(self, index: int, sequence) -> List:
-		"""Find all sequence blocks matching the given MIDI index"""
-		blocks = []
-		for block in sequence:
-			if tdu.match(block.par.Index.eval(), [index]):
-				blocks.append(block)
-		return blocks
+	def _rebuild_step_table(self):
+		"""Re-read the step values of seqSteps into the step table"""
+		self.stepTable.rebuild(self.seqSteps, self._currStep)
+
+	def _rebuild_midi_routes(self):
+		"""Compile the (route, MIDI index) -> block index dispatch table.
+		
+		Index patterns are expanded once here, so incoming messages only need a dict lookup.
+		Called from the index/numBlocks callbacks - the first matching block wins, as before.
+		"""
+		routes = {}
+		
+		knob_index = self._safe_get_midi_index(self.evalKnobindex)
+		if knob_index is not None:
+			routes[(MidiRoute.KNOB, knob_index)] = 0
+		push_index = self._safe_get_midi_index(self.evalPushindex)
+		if push_index is not None:
+			routes[(MidiRoute.PUSH, push_index)] = 0
+		
+		for route, sequence in ((MidiRoute.STEP, self.seqSteps),
+								(MidiRoute.SLOT, self.seqSlots),
+								(MidiRoute.BANK, self.seqBanks)):
+			for block in sequence:
+				try:
+					matches = tdu.match(block.par.Index.eval(), MidiConstants.MIDI_INDEX_RANGE)
+				except Exception:
+					continue
+				for midi_index in matches:
+					routes.setdefault((route, midi_index), block.index)
+		
+		self.midiRoutes = routes
+	
+	def _route_block(self, route: MidiRoute, index: int, sequence):
+		"""Get the sequence block mapped to the given route and MIDI index (or None)"""
+		block_idx = self.midiRoutes.get((route, index))
+		if block_idx is None or block_idx >= sequence.numBlocks:
+			return None
+		return sequence[block_idx]
 	
 # endregion helper functions
 # region parameter callbacks
@@ -1128,20 +1222,45 @@ class HoveredMidiRelativeExt:
 	# TODO: These can be optimized using Dependency objects
 	def onSeqStepsNIndex(self, _par, idx):
 		"""TouchDesigner callback when sequence steps index changes"""
+		self._rebuild_midi_routes()
 		self._force_cook_midi_operators()
 
 	def onSeqSlotsNIndex(self, _par, idx):
 		"""TouchDesigner callback when sequence slots index changes"""
+		self._rebuild_midi_routes()
 		self._force_cook_midi_operators()
 
 	def onSeqBanksNIndex(self, _par, idx):
 		"""TouchDesigner callback when sequence banks index changes"""
+		self._rebuild_midi_routes()
 		self._force_cook_midi_operators()
 
 	def onParKnobindex(self, _par, _val):
 		"""TouchDesigner callback when knob index parameter changes"""
+		self._rebuild_midi_routes()
 		self._force_cook_midi_operators()
 
+	def onParRelativeencoding(self, _par, _val):
+		"""TouchDesigner callback when knob relative encoding changes"""
+		self.midi_handler.select_relative_encoding()
+
+	def onParPushindex(self, _par, _val):
+		"""TouchDesigner callback when push index parameter changes"""
+		self._rebuild_midi_routes()
+
+	def onSeqStepsNumBlocks(self, _par, _val):
+		"""TouchDesigner callback when number of steps changes"""
+		self._rebuild_midi_routes()
+		self._rebuild_step_table()
+
+	def onSeqStepsNStep(self, _par, idx):
+		"""TouchDesigner callback when a step value changes"""
+		self._rebuild_step_table()
+
+	def onSeqSlotsNumBlocks(self, _par, _val):
+		"""TouchDesigner callback when number of slots changes"""
+		self._rebuild_midi_routes()
+
 	def onParKnobledupdate(self, _val):
 		"""TouchDesigner callback when knob LED update mode parameter changes"""
 		if KnobLedUpdateMode(_val) in [KnobLedUpdateMode.VALUE]:
@@ -1151,10 +1270,24 @@ class HoveredMidiRelativeExt:
 			self.display_manager.update_knob_leds_gradual(0)
 			self.display_manager.update_knob_leds_steps(-1)
 		else:#
-			step_idx = next((i for i, s in enumerate(self.seqSteps) if s.par.Step.eval() == self._currStep), None)
+			step_idx = self.stepTable.current_index
 			self.display_manager.update_knob_leds_gradual(0)
 			self.display_manager.update_knob_leds_steps(step_idx)
 
+	def onParLabeldisplaymode(self, _val):
+		"""TouchDesigner callback when label display mode parameter changes"""
+		LabelFormatter.invalidate_labels()
+		self.display_manager.invalidate_slot_labels()
+		if self.activePar is not None:
+			self.display_manager.update_parameter_display(self.activePar)
+
+	def onParEnableui(self, _val):
+		"""TouchDesigner callback when enable UI parameter changes"""
+		# The UI kept its old contents while disabled, redraw every field
+		self.display_manager.invalidate_render_frame()
+		if _val and self.activePar is not None:
+			self.display_manager.update_parameter_display(self.activePar)
+
 	def onParVsn1support(self, _par, _val):
 		"""TouchDesigner callback when VSN1 support parameter changes"""
 		if _val:
@@ -1184,6 +1317,11 @@ class HoveredMidiRelativeExt:
 		self.parKnobindex.val = VSN1Constants.KNOB_INDEX
 		self.parPushindex.val = VSN1Constants.PUSH_INDEX
 
+		# Set knob encoding
+		if (encoding_par := getattr(self.ownerComp.par, 'Relativeencoding', None)) is not None:
+			encoding_par.val = RelativeEncoding.VSN1.value
+		self.midi_handler.select_relative_encoding()
+
 		# Force cook MIDI operators
 		self._force_cook_midi_operators()
 
@@ -1226,6 +1364,8 @@ class HoveredMidiRelativeExt:
 
 	def onSeqBanksNumBlocks(self, _par, _val):
 		"""TouchDesigner callback when number of banks changes"""
+		self._rebuild_midi_routes()
+		
 		# Revalidate storage to handle bank count changes
 		self._validate_storage()
 		
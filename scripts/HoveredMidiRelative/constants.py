@@ -17,6 +17,49 @@ class MidiConstants:
 	CONTROL_CHANGE = 'Control Change'
 	MAX_VELOCITY = 127
 	MIDI_FEEDBACK_OFFSET = 80
+	MIDI_INDEX_RANGE = list(range(128))
+
+class MidiRoute(Enum):
+	"""Message routes, keyed together with the MIDI index in the compiled dispatch table"""
+	KNOB = 'Knob'
+	PUSH = 'Push'
+	STEP = 'Step'
+	SLOT = 'Slot'
+	BANK = 'Bank'
+
+class ModifierBits:
+	"""Bit flags of the held modifier buttons, keyed by the null CHOP that reports each one"""
+	PUSH = 1 << 0
+	SETDEFAULT = 1 << 1
+	MIDIBANK = 1 << 2
+	MODESEL = 1 << 3
+	RESETPAR = 1 << 4
+	SETNORMMIN = 1 << 5
+	SETNORMMAX = 1 << 6
+	SETCLAMP = 1 << 7
+	CUSTOMOPEN = 1 << 8
+
+	# Buttons that share MIDI notes with bank/step buttons by default
+	SHORTCUTS = SETDEFAULT | MIDIBANK | MODESEL | RESETPAR | SETNORMMIN | SETNORMMAX | SETCLAMP | CUSTOMOPEN
+	ALL = PUSH | SHORTCUTS
+
+	BY_OP_NAME = {
+		'null_push': PUSH,
+		'null_setdefault': SETDEFAULT,
+		'null_midibank': MIDIBANK,
+		'null_modesel': MODESEL,
+		'null_resetpar': RESETPAR,
+		'null_setnormmin': SETNORMMIN,
+		'null_setnormmax': SETNORMMAX,
+		'null_setclamp': SETCLAMP,
+		'null_customopen': CUSTOMOPEN,
+	}
+
+class KnobAccelConstants:
+	HISTORY_SIZE = 16  # Recent knob message timestamps kept per parameter
+	WINDOW = 0.1  # Seconds of history used to measure turn speed
+	THRESHOLD_RATE = 20.0  # Messages per second below which no acceleration is applied
+	DEFAULT_MAX_GAIN = 8.0
 
 class VSN1Constants:
 	# VSN1 Hardware mappings
@@ -33,6 +76,102 @@ class VSN1Constants:
 	MAX_VALUE_LENGTH = 10
 
 	KNOB_LED_IDXS = [0, 1, 2, 3, 4]
+	RING_LED_RESOLUTION = 127  # Ring fill arrives as a 7-bit CC
+	LED_FEEDBACK_INTERVAL_MS = 20  # Minimum time between two sends to the same LED
+	# tdError messages of an unreachable MIDI out device, shown as script errors
+	MIDI_OUT_ERRORS = ('Cannot communicate with the MIDI device', 'Could not open the MIDI interface')
+
+class DisplaySchedulerConstants:
+	MIN_INTERVAL_MS = 33.0  # Fastest display flush rate (~30fps)
+	MAX_INTERVAL_MS = 200.0
+	BRIDGE_QUEUE_INTERVAL_MS = 50.0  # index.js messageQueTimeout until the package reports its adaptive pacing
+	INTERVAL_STEP_MS = 5.0  # Back off by this much when a frame outpaced the bridge
+	INTERVAL_DECAY = 0.9  # Otherwise speed back up towards MIN_INTERVAL_MS
+	COST_SMOOTHING = 0.2  # EMA factor for the measured render + send time
+	COST_FACTOR = 4.0  # Keep the interval at least this many times the render + send time
+
+class VSN1DisplayState:
+	"""Device-resident copy of the update_param() arguments, updated by field deltas.
+	Fields are keyed by their update_param() argument position (1-based, Lua style).
+	"""
+	VALUE = 1
+	NORM_MIN = 2
+	NORM_MAX = 3
+	LABEL = 4
+	BOTTOM_TEXT = 5
+	STEP_INDICATOR = 6
+	NORM_DEFAULT = 7
+	INFO = 8
+	CLAMPS = 9
+	BANK = 10
+	NUM_FIELDS = 10
+
+	UPDATE_FUNC = 'pu'  # Installed with VSN1Routines
+	# Sentinel for fields that should become nil (nil can't be stored in a table)
+	NIL = 'pn'
+
+class BridgeQueueKey:
+	"""Coalescing keys for queued messages in the Grid package bridge (index.js).
+	The latest message per key wins, pending keys are forwarded round-robin.
+	"""
+	DISPLAY = 'display'  # update_param() frames, with bank/outline/step mode setters as their prefix
+	LEDS = 'leds'
+
+class VSN1Routines:
+	"""Lua routines installed on the module on connect, so later messages are short calls with numeric args.
+	Bump VERSION whenever a routine changes - the module skips the install if it already has this version.
+	"""
+	VERSION = 3
+	
+	UPDATE_STATE = VSN1DisplayState.UPDATE_FUNC  # pu{[field]=value,...}: merge display fields, redraw
+	CLEAR = 'hc'  # hc(): clear screen
+	OUTLINE = 'ho'  # ho(color_index): outline color
+	BANK = 'hb'  # hb(bank_idx): bank indicator
+	STEP_MODE = 'hm'  # hm(color_index): step mode indicator color
+	LEDS = 'hl'  # hl{[idx]=value,...}: set LEDs
+	PACING_ECHO = 'he'  # he(seq): tell the package a queued script has run (appended by index.js)
+	
+	ROUTINES = {
+		UPDATE_STATE: (
+			'pn={} ps={} '
+			'function pu(d) for k,v in pairs(d) do if v==pn then ps[k]=nil else ps[k]=v end end '
+			'update_param(ps[1],ps[2],ps[3],ps[4],ps[5],ps[6],ps[7],ps[8],ps[9],ps[10]) end'
+		),
+		CLEAR: 'function hc() lcd:ldaf(0,0,319,239,c[1]) lcd:ldrr(3,3,317,237,10,c[2]) lcd:ldsw() end',
+		OUTLINE: 'function ho(i) rc=i lcd:ldrr(3,3,317,237,10,c[rc]) lcd:ldsw() end',
+		BANK: 'function hb(i) b=i lcd:ldsw() end',
+		STEP_MODE: 'function hm(i) ci=i end',
+		LEDS: 'function hl(t) for i,v in pairs(t) do set_led(i,1,v) end end',
+		PACING_ECHO: 'function he(s) gps("package-touchdesigner-parhover","__pacing",s) end',
+	}
+	
+	INSTALL = f"if hv~={VERSION} then {' '.join(ROUTINES.values())} hv={VERSION} end"
+
+class RelativeEncoding(Enum):
+	BINARY_OFFSET = 'Binaryoffset'
+	TWOS_COMPLEMENT = 'Twoscomplement'
+	SIGN_MAGNITUDE = 'Signmagnitude'
+	VSN1 = 'Vsn1'
+
+class RelativeDeltaTables:
+	"""Precomputed signed knob delta for every CC value (0-127), per relative encoding.
+	A delta of 0 means idle/no movement.
+	"""
+	# 64 = idle, 65 = +1, 63 = -1
+	BINARY_OFFSET = tuple(v - 64 for v in range(128))
+	# 0 = idle, 1 = +1, 127 = -1
+	TWOS_COMPLEMENT = tuple(v if v < 64 else v - 128 for v in range(128))
+	# Bit 6 is the sign: 1 = +1, 65 = -1 (0 and 64 idle)
+	SIGN_MAGNITUDE = tuple(-(v & 0x3F) if v & 0x40 else v for v in range(128))
+	# Grid/VSN1 relative knob mode sends 64 +/- delta
+	VSN1 = BINARY_OFFSET
+
+	BY_ENCODING = {
+		RelativeEncoding.BINARY_OFFSET: BINARY_OFFSET,
+		RelativeEncoding.TWOS_COMPLEMENT: TWOS_COMPLEMENT,
+		RelativeEncoding.SIGN_MAGNITUDE: SIGN_MAGNITUDE,
+		RelativeEncoding.VSN1: VSN1,
+	}
 
 class SupportedParameterTypes(Enum):
 	NUMBER = 'Number'
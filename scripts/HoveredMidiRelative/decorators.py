@@ -7,6 +7,8 @@ Saveversion : 2023.12120
 Info Header End'''
 
 from functools import wraps
+import json
+import time
 
 def require_valid_parameter(func):
 	"""Decorator that handles invalid parameters gracefully.
@@ -66,3 +68,62 @@ def block_during_invalidation(func):
 	
 	return wrapper
 
+
+class EventRecorder:
+	"""Writes timestamped callback events as JSON lines, for replay with bench/replay.py
+	
+	Each line: {"t": seconds since start, "cb": callback name, "args": [...]}
+	Operators are stored by path, everything else as plain JSON values.
+	"""
+	def __init__(self, file_path: str):
+		self.file_path = file_path
+		self.count = 0
+		self._file = open(file_path, 'w', encoding='utf-8')
+		self._start = time.perf_counter()
+	
+	def record(self, callback_name: str, args: tuple):
+		event = {
+			't': round(time.perf_counter() - self._start, 6),
+			'cb': callback_name,
+			'args': [self._serialize(arg) for arg in args]
+		}
+		self._file.write(json.dumps(event) + '\n')
+		self.count += 1
+	
+	def close(self):
+		if not self._file.closed:
+			self._file.close()
+	
+	@staticmethod
+	def _serialize(value):
+		if value is None or isinstance(value, (bool, int, float, str)):
+			return value
+		if isinstance(value, (bytes, bytearray)):
+			return list(value)
+		if isinstance(value, (list, tuple)):
+			return [EventRecorder._serialize(v) for v in value]
+		path = getattr(value, 'path', None)
+		if path is not None:
+			return path
+		return str(value)
+
+
+def record_event(func):
+	"""Decorator that records the callback and its arguments while an EventRecorder is active.
+	
+	Records before any other decorator runs, so blocked events are captured too.
+	
+	Usage:
+		@record_event
+		@require_valid_parameter
+		def onReceiveMidi(self, dat, rowIndex, message, channel, index, value, input, byteData):
+			pass
+	"""
+	@wraps(func)
+	def wrapper(self, *args, **kwargs):
+		recorder = getattr(self, 'eventRecorder', None)
+		if recorder is not None:
+			recorder.record(func.__name__, args)
+		return func(self, *args, **kwargs)
+	
+	return wrapper
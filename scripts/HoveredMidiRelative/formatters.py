@@ -9,12 +9,56 @@ Info Header End'''
 Label and value formatting utilities for HoveredMidiRelative
 """
 from typing import Any, Union, List
+from collections import OrderedDict
 from constants import VSN1Constants, LabelDisplayMode, ScreenMessages
 
 
 class LabelFormatter:
 	"""Utility class for label compression and formatting"""
 
+	# Memoized labels (LRU). Keys include the parameter label, so renamed labels miss naturally.
+	#   parameter labels: (owner id, par/group name, is group, label, mode, max_length) -> label
+	#   formatted strings: (label, mode, max_length) -> label
+	_par_labels = OrderedDict()
+	_formatted = OrderedDict()
+	_hits = 0
+	_misses = 0
+	MAX_CACHED_LABELS = 1024
+
+	@staticmethod
+	def _cache_get(cache: OrderedDict, key):
+		label = cache.get(key)
+		if label is None:
+			LabelFormatter._misses += 1
+			return None
+		LabelFormatter._hits += 1
+		cache.move_to_end(key)
+		return label
+
+	@staticmethod
+	def _cache_put(cache: OrderedDict, key, label: str):
+		cache[key] = label
+		if len(cache) > LabelFormatter.MAX_CACHED_LABELS:
+			cache.popitem(last=False)
+
+	@staticmethod
+	def invalidate_labels():
+		"""Drop all memoized labels (e.g. when the label display mode changes)"""
+		LabelFormatter._par_labels.clear()
+		LabelFormatter._formatted.clear()
+
+	@staticmethod
+	def label_cache_stats() -> dict:
+		"""Hit/miss counters and sizes of the label caches"""
+		lookups = LabelFormatter._hits + LabelFormatter._misses
+		return {
+			'hits': LabelFormatter._hits,
+			'misses': LabelFormatter._misses,
+			'hit_rate': LabelFormatter._hits / lookups if lookups else 0.0,
+			'parameter_labels': len(LabelFormatter._par_labels),
+			'formatted_labels': len(LabelFormatter._formatted),
+		}
+
 	@staticmethod
 	def get_label_for_parameter(par_or_group: Union[Par, ParGroup], mode: LabelDisplayMode, max_length: int = VSN1Constants.MAX_LABEL_LENGTH) -> str:
 		"""Get the label for a parameter or ParGroup
@@ -22,6 +66,17 @@ class LabelFormatter:
 		if par_or_group is None:
 			return ScreenMessages.HOVER
 		
+		is_group = isinstance(par_or_group, ParGroup)
+		key = (par_or_group.owner.id, par_or_group.name, is_group, par_or_group.label, mode, max_length)
+		label = LabelFormatter._cache_get(LabelFormatter._par_labels, key)
+		if label is None:
+			label = LabelFormatter._compute_label_for_parameter(par_or_group, mode, max_length)
+			LabelFormatter._cache_put(LabelFormatter._par_labels, key, label)
+		return label
+
+	@staticmethod
+	def _compute_label_for_parameter(par_or_group: Union[Par, ParGroup], mode: LabelDisplayMode, max_length: int) -> str:
+		"""Uncached get_label_for_parameter"""
 		# Handle ParGroup
 		if isinstance(par_or_group, ParGroup):
 			# Use ParGroup's name
@@ -100,6 +155,16 @@ class LabelFormatter:
 	@staticmethod
 	def format_label(label: str, mode: LabelDisplayMode, max_length: int = VSN1Constants.MAX_LABEL_LENGTH) -> str:
 		"""Format labels based on display mode - compression or truncation"""
+		key = (label, mode, max_length)
+		formatted = LabelFormatter._cache_get(LabelFormatter._formatted, key)
+		if formatted is None:
+			formatted = LabelFormatter._compute_format_label(label, mode, max_length)
+			LabelFormatter._cache_put(LabelFormatter._formatted, key, formatted)
+		return formatted
+	
+	@staticmethod
+	def _compute_format_label(label: str, mode: LabelDisplayMode, max_length: int) -> str:
+		"""Uncached format_label"""
 		if mode == LabelDisplayMode.COMPRESSED:
 			return LabelFormatter.compress_label(label, max_length)
 		elif mode == LabelDisplayMode.TRUNCATED:
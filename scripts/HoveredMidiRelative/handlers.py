@@ -5,32 +5,159 @@ Author : Dan@DAN-4090
 Saveorigin : HoveredMidiRelative.187.toe
 Saveversion : 2023.12120
 Info Header End'''
-from constants import MidiConstants, ScreenMessages, StepMode, PushStepMode, MultiAdjustMode
-from validators import ParameterValidator
+from constants import MidiConstants, MidiRoute, ModifierBits, RelativeDeltaTables, KnobAccelConstants, ScreenMessages, StepMode, PushStepMode, MultiAdjustMode
+from validators import ParameterValidator, ParGroupPlan
 from typing import Union
+from collections import deque
+import time
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+class KnobAccelerator:
+	"""Scales knob steps by turn speed, measured from the timestamps of recent knob messages"""
+	
+	def __init__(self, history_size: int = KnobAccelConstants.HISTORY_SIZE):
+		self.timestamps = deque(maxlen=history_size)
+		self._par = None
+	
+	def record(self, par, now: float = None):
+		"""Record a knob message for the given parameter (history restarts when the parameter changes)"""
+		if par is not self._par:
+			self.timestamps.clear()
+			self._par = par
+		self.timestamps.append(time.perf_counter() if now is None else now)
+	
+	def rate(self, now: float = None) -> float:
+		"""Knob messages per second over the measurement window"""
+		if now is None:
+			now = time.perf_counter()
+		window = KnobAccelConstants.WINDOW
+		count = sum(1 for t in self.timestamps if now - t <= window)
+		return count / window
+	
+	def gain(self, amount: float, max_gain: float, now: float = None) -> float:
+		"""Step multiplier for the current turn speed (1.0 when slow or disabled)
+		
+		Args:
+			amount: Acceleration amount, 0 disables acceleration
+			max_gain: Upper bound for the multiplier
+		"""
+		if amount <= 0:
+			return 1.0
+		threshold = KnobAccelConstants.THRESHOLD_RATE
+		rate = self.rate(now)
+		if rate <= threshold:
+			return 1.0
+		return max(1.0, min(max_gain, 1.0 + amount * (rate - threshold) / threshold))
+
+class StepTable:
+	"""Step values of the Steps sequence, with their min/max and the index of the current step.
+	Rebuilt from the sequence callbacks so display code doesn't evaluate the step parameters.
+	"""
+
+	def __init__(self):
+		self.steps = ()
+		self.min_step = None
+		self.max_step = None
+		self.current_step = None
+		self.current_index = None  # First block whose step equals the current step, or None
+
+	def rebuild(self, seq_steps, current_step: float):
+		"""Re-read all step values (numBlocks or Step parameter changed)"""
+		self.steps = tuple(block.par.Step.eval() for block in seq_steps)
+		self.min_step = min(self.steps) if self.steps else None
+		self.max_step = max(self.steps) if self.steps else None
+		self.set_current(current_step)
+
+	def set_current(self, step: float):
+		"""Update the current step and its index"""
+		self.current_step = step
+		self.current_index = self.index_of(step)
+
+	def index_of(self, step: float):
+		"""Index of the first block with this step value, or None"""
+		try:
+			return self.steps.index(step)
+		except ValueError:
+			return None
 
 class MidiMessageHandler:
 	"""Handles MIDI message processing logic"""
 	
 	def __init__(self, parent_ext):
 		self.parent = parent_ext
+		
+		# Per-frame knob coalescing: deltas arriving within one frame are summed
+		# and applied once at frame end (one write, one fan-out, one display update)
+		self._pending_knob_par = None
+		self._pending_knob_diff = 0  # Sum of signed deltas (value - MIDI_CENTER_VALUE)
+		self._pending_knob_ticks = 0  # Sum of per-message directions (for ints and menus)
+		self._knob_flush_run = None
+		self.knob_accelerator = KnobAccelerator()
+		self._pargroup_plan = None  # ParGroupPlan of the last active ParGroup
+		self.multiAdjustFailures = []  # (par path, error) of targets that failed in the last multi-op apply
+		
+		# Held modifier buttons as a ModifierBits mask, each read only polls the CHOPs of the bits it asks for
+		self.modifierMask = 0
+		
+		# CC value -> signed knob delta for the selected relative encoding
+		self.deltaTable = RelativeDeltaTables.BINARY_OFFSET
+		self.select_relative_encoding()
+
+	def prepare_control_plan(self, par_or_group):
+		"""Compile the control plan when a ParGroup becomes active (no-op for single pars)"""
+		if par_or_group is not None and ParameterValidator.is_pargroup(par_or_group):
+			self._pargroup_plan = ParGroupPlan(par_or_group)
+
+	def get_pargroup_plan(self, par_group: ParGroup) -> ParGroupPlan:
+		"""Get the control plan for a ParGroup, recompiled if it's stale or for another group"""
+		plan = self._pargroup_plan
+		if plan is None or not plan.is_current(par_group):
+			plan = self._pargroup_plan = ParGroupPlan(par_group)
+		return plan
+
+	def select_relative_encoding(self):
+		"""Pick the knob delta table for the current relative encoding"""
+		self.deltaTable = RelativeDeltaTables.BY_ENCODING.get(
+			self.parent.relativeEncoding, RelativeDeltaTables.BINARY_OFFSET)
+
+	@property
+	def modifiers(self) -> int:
+		"""Currently held modifier buttons as a ModifierBits mask"""
+		return self.held_modifiers(ModifierBits.ALL)
+
+	def held_modifiers(self, bits: int) -> int:
+		"""Held modifiers among the given ModifierBits, only polling the CHOPs of those bits"""
+		return self.sync_modifiers(bits) & bits
+
+	def sync_modifiers(self, bits: int = ModifierBits.ALL) -> int:
+		"""Poll the modifier CHOPs of the given bits and update those bits of the mask"""
+		mask = self.modifierMask & ~bits
+		for name, bit in ModifierBits.BY_OP_NAME.items():
+			if not bit & bits:
+				continue
+			chop = self.parent.ownerComp.op(name)
+			try:
+				if chop is not None and chop[0].eval():
+					mask |= bit
+			except (IndexError, AttributeError, tdError):
+				continue
+		self.modifierMask = mask
+		return mask
+
+	def is_chord_held(self, bits: int) -> bool:
+		"""Check if all modifiers in the given ModifierBits combination are held"""
+		return self.held_modifiers(bits) == bits
 
 	@property
 	def shortcutPressed(self) -> bool:
 		"""Used for checking if a bank off message coincides with a shortcuts
 		since by default these share the same MIDI button
 		"""
-		mode_buttons = [
-			'null_setdefault',
-			'null_midibank', 
-			'null_modesel',
-			'null_resetpar',
-			'null_setnormmin',
-			'null_setnormmax',
-			'null_setclamp',
-			'null_customopen'
-		]
-		return any(self.parent.ownerComp.op(button)[0].eval() for button in mode_buttons)
+		return bool(self.held_modifiers(ModifierBits.SHORTCUTS))
 	
 
 	def _clear_invalid_parameter_from_slots(self, active_par: Union['Par', 'ParGroup']) -> None:
@@ -64,11 +191,9 @@ class MidiMessageHandler:
 			if is_multi_op_active:
 				# Get all matching parameters from other operators for this ParGroup
 				all_additional_pars = []
-				for par in active_par:
-					# Skip unit parameters and invalid parameters
-					if par is not None and not (par.name.endswith('unit') and len(par.name) > 4) and ParameterValidator.is_valid_parameter(par):
-						matching_pars = ParameterValidator.get_matching_selected_pars(par)
-						all_additional_pars.extend(matching_pars)
+				for par in self.get_pargroup_plan(active_par).members:
+					matching_pars = ParameterValidator.get_matching_selected_pars(par)
+					all_additional_pars.extend(matching_pars)
 				
 				if all_additional_pars:
 					# Create grouped undo for ParGroup + all matching parameters
@@ -76,7 +201,7 @@ class MidiMessageHandler:
 					return
 			
 			# Normal ParGroup undo (no multi-operator editing)
-			self.parent.undo_manager.create_pargroup_undo(active_par)
+			self.parent.undo_manager.create_pargroup_undo(active_par, self.get_pargroup_plan(active_par).undo_pars)
 		else:
 			# Handle single Par
 			if is_multi_op_active:
@@ -92,13 +217,12 @@ class MidiMessageHandler:
 	
 	def handle_step_message(self, index: int, value: int) -> bool:
 		"""Handle step change messages"""
-		blocks = self.parent._index_to_blocks(index, self.parent.seqSteps)
+		block = self.parent._route_block(MidiRoute.STEP, index, self.parent.seqSteps)
 		if self.shortcutPressed:
 			return True
-		if not blocks:
+		if block is None:
 			return False
 			
-		block = blocks[0]
 		if self.parent.evalPushstepmode == PushStepMode.FIXED.value and self.parent.knobPushState:
 			self.parent.ownerComp.par.Pushstep.val = block.par.Step.eval()
 			return True
@@ -113,14 +237,14 @@ class MidiMessageHandler:
 		Note: Validation happens when parameter becomes active (hover/slot activation).
 		For maximum performance, we skip validation during knob turns.
 		"""
-		knob_index = self.parent._safe_get_midi_index(self.parent.evalKnobindex, default=-1)
-		if index != knob_index:
+		if (MidiRoute.KNOB, index) not in self.parent.midiRoutes:
 			return False
 
 
 		
 		# Only process actual knob movement (not center/idle position)
-		if value == MidiConstants.MIDI_CENTER_VALUE:
+		diff = self.deltaTable[value]
+		if diff == 0:
 			return True
 
 		# Only check if parameter exists - it was validated on activation
@@ -128,7 +252,7 @@ class MidiMessageHandler:
 			# Delegate zoom handling to zoom_manager (if zoom is enabled)
 			enable_zoom = getattr(self.parent, 'evalEnablezoom', False)
 			if enable_zoom:
-				return self.parent.zoom_manager.handle_zoom_knob(value)
+				return self.parent.zoom_manager.handle_zoom_knob(diff)
 			else:
 				# No zoom, no active parameter - nothing to do
 				self.parent.zoom_manager.clear_target()
@@ -137,22 +261,70 @@ class MidiMessageHandler:
 		# Parameter is active - clear any zoom state
 		self.parent.zoom_manager.clear_target()
 		
+		# Active parameter changed within the frame - apply what we have for the previous one first
+		if self._pending_knob_par is not None and self._pending_knob_par is not active_par:
+			self.flush_knob_deltas()
+		
+		# Accumulate the delta, the actual parameter change happens at the end of the frame
+		self.knob_accelerator.record(active_par)
+		self._pending_knob_par = active_par
+		self._pending_knob_diff += diff
+		self._pending_knob_ticks += 1 if diff > 0 else -1
+		self._schedule_knob_flush()
+		
+		return True
+	
+	def _schedule_knob_flush(self):
+		"""Schedule the end-of-frame flush of coalesced knob deltas (once per frame)"""
+		try:
+			if self._knob_flush_run is not None and self._knob_flush_run.active:
+				return
+		except (AttributeError, tdError):
+			pass
+		
+		self._knob_flush_run = run(
+			"args[0]._flush_knob_deltas()",
+			self.parent,
+			endFrame=True,
+			delayRef=op.TDResources
+		)
+	
+	def flush_knob_deltas(self):
+		"""Take the knob deltas accumulated during this frame and apply them as a single step.
+		The pending deltas are always cleared, even when the guarded apply is blocked by recovery.
+		"""
+		active_par = self._pending_knob_par
+		diff = self._pending_knob_diff
+		ticks = self._pending_knob_ticks
+		self._pending_knob_par = None
+		self._pending_knob_diff = 0
+		self._pending_knob_ticks = 0
+		
+		if active_par is None or (diff == 0 and ticks == 0):
+			return
+		
+		self.parent._apply_knob_deltas(active_par, diff, ticks)
+	
+	def apply_knob_deltas(self, active_par, diff: int, ticks: int):
+		"""Apply coalesced knob deltas to the active parameter"""
 		# Create undo action on first knob movement
 		self._create_undo_for_parameter(active_par)
 		
+		# Scale by turn speed (optional, 1.0 when acceleration is off)
+		gain = self.knob_accelerator.gain(
+			getattr(self.parent, 'evalKnobacceleration', 0),
+			getattr(self.parent, 'evalKnobaccelerationmax', KnobAccelConstants.DEFAULT_MAX_GAIN))
+		
 		# Apply parameter change
-		self._do_step(self.parent._currStep, value)
+		self._do_step(self.parent._currStep, diff, ticks, active_par, gain)
 		
 		# Restart timeout on every movement (resets the 2s timer)
 		# After 2s of inactivity, will clear captured values for new undo checkpoint
 		self.parent.undo_manager.start_undo_timeout(timeout_ms=self.parent.evalUndotimeout*1000)
-		
-		return True
 	
 	def handle_push_message(self, index: int, value: int, active_par) -> bool:
 		"""Handle pulse button messages"""
-		push_index = self.parent._safe_get_midi_index(self.parent.evalPushindex, default=-1)
-		if index != push_index:
+		if (MidiRoute.PUSH, index) not in self.parent.midiRoutes:
 			return False
 			
 		if hasattr(self, 'pushed_for_jump') and value == 0 and self.pushed_for_jump:
@@ -237,11 +409,10 @@ class MidiMessageHandler:
 		if value != MidiConstants.MAX_VELOCITY:
 			return False
 			
-		blocks = self.parent._index_to_blocks(index, self.parent.seqSlots)
-		if not blocks:
+		block = self.parent._route_block(MidiRoute.SLOT, index, self.parent.seqSlots)
+		if block is None:
 			return False
 			
-		block = blocks[0]
 		block_idx = block.index
 		
 		currBank = self.parent.currBank
@@ -286,53 +457,64 @@ class MidiMessageHandler:
 
 	def handle_bank_message(self, index: int) -> bool:
 		"""Handle bank change messages"""
-		blocks = self.parent._index_to_blocks(index, self.parent.seqBanks)
-		if not blocks:
+		block = self.parent._route_block(MidiRoute.BANK, index, self.parent.seqBanks)
+		if block is None:
 			return False
 		
-		block = blocks[0]
 		bank_idx = block.index
 		
 		# Switch to the requested bank
 		return self.parent.slot_manager.recall_bank(bank_idx)
 
-	def _do_step(self, step: float, value: int):
-		"""Apply step value to active parameter (or ParGroup) based on MIDI input"""
-		active_par = self.parent.activePar
+	def _do_step(self, step: float, diff: int, ticks: int, active_par=None, gain: float = 1.0):
+		"""Apply step value to active parameter (or ParGroup) based on coalesced MIDI input
+		
+		Args:
+			step: The step size
+			diff: Sum of signed knob deltas for this frame (decoded via deltaTable)
+			ticks: Sum of per-message directions for this frame
+			active_par: Parameter the deltas were collected for (defaults to the active parameter)
+			gain: Knob acceleration multiplier for numeric parameters
+		"""
+		if active_par is None:
+			active_par = self.parent.activePar
 		if active_par is None:
 			return
 		
 		# Handle ParGroup
 		if ParameterValidator.is_pargroup(active_par):
-			self._do_step_pargroup(active_par, step, value)
+			self._do_step_pargroup(active_par, step, diff, ticks, gain)
 			return
 		
 		# Handle single Par
-		self._do_step_single(active_par, step, value)
+		self._do_step_single(active_par, step, diff, ticks, gain)
 	
-	def _do_step_pargroup(self, par_group: ParGroup, step: float, value: int):
+	def _do_step_pargroup(self, par_group: ParGroup, step: float, diff: int, ticks: int, gain: float = 1.0):
 		"""Apply step value to all valid parameters in a ParGroup
-		Only applies to parameters that pass individual validation"""
-		# Apply step to each valid parameter in the group
-		for par in par_group:
-			# Skip invalid parameters within the group
-			# Also skip unit parameters (e.g., tunit, runit, sunit) but not "unit" itself
-			if par is not None and not (par.name.endswith('unit') and len(par.name) > 4) and ParameterValidator.is_valid_parameter(par):
-				self._do_step_single(par, step, value, update_display=False)
+		Only applies to the writable members of the group's control plan"""
+		# Members were filtered and validated when the plan was compiled
+		for par in self.get_pargroup_plan(par_group).members:
+			self._do_step_single(par, step, diff, ticks, gain, update_display=False, validated=True)
 		
 		# Update display once after all valid parameters are updated
 		self.parent.display_manager.update_parameter_display(par_group)
 	
 	
-	def _apply_step_to_parameter(self, par: Par, step: float, diff: int, update_cached_change: bool = False):
+	def _apply_step_to_parameter(self, par: Par, step: float, diff: int, ticks: int = None, gain: float = 1.0, update_cached_change: bool = False):
 		"""Apply a step adjustment to a single parameter.
 		
 		Args:
 			par: The parameter to adjust
 			step: The step size
-			diff: The direction and magnitude of change (value - MIDI_CENTER_VALUE)
+			diff: The direction and magnitude of change (sum of decoded knob deltas)
+			ticks: Number of signed knob messages behind diff - integers and menus move
+			       one unit per message. Defaults to a single message in diff's direction.
+			gain: Knob acceleration multiplier (numeric parameters only, menus and toggles ignore it)
 			update_cached_change: Whether to update lastCachedChange (only for main parameter)
 		"""
+		if ticks is None:
+			ticks = 1 if diff > 0 else -1
+		
 		if par.isNumber:
 			# Calculate step amount based on mode
 			if self.parent.stepMode == StepMode.FIXED:
@@ -340,14 +522,18 @@ class MidiMessageHandler:
 			else:  # Adaptive mode - step scales with parameter range
 				min_val, max_val = par.normMin, par.normMax
 				step_amount = ((max_val - min_val) * step) * diff
+			step_amount *= gain
 			
 			# Handle integer parameters with different step behavior
 			if par.isInt:
 				if self.parent.stepMode == StepMode.FIXED:
-					step_amount = 1 if diff > 0 else -1
+					step_amount = ticks
 				else:
 					min_val, max_val = par.normMin, par.normMax
-					step_amount = max(1, ((max_val - min_val) * step)) * (1 if diff > 0 else -1)
+					step_amount = max(1, ((max_val - min_val) * step)) * ticks
+				# Accelerated integers still move in whole units, at least one per message
+				if gain != 1.0:
+					step_amount = int(round(step_amount * gain)) or ticks
 			
 			# Apply the step to current value
 			par.val = par.eval() + step_amount
@@ -357,10 +543,10 @@ class MidiMessageHandler:
 		
 		elif (par.isMenu or getattr(par, 'style', None) in ['Menu', 'StrMenu']) and (getattr(par, 'style', None) != 'StrMenu' or self.parent.should_allow_strmenus(par)):
 			# Handle menu parameters - step through menu options
-			if abs(diff) >= 1:  # Only change on significant step
+			if ticks != 0:  # Only change on significant step
 				current_index = par.menuIndex
 				num_menu_items = len(par.menuNames)
-				step_direction = 1 if diff > 0 else -1
+				step_direction = ticks
 				
 				if self.parent.evalLoopmenus and current_index is not None:
 					# Loop around when reaching the end
@@ -406,13 +592,14 @@ class MidiMessageHandler:
 			elif par.isToggle:
 				par.val = not par.eval()
 	
-	def _do_step_single(self, active_par: Par, step: float, value: int, update_display: bool = True):
-		"""Apply step value to a single parameter based on MIDI input
+	def _do_step_single(self, active_par: Par, step: float, diff: int, ticks: int, gain: float = 1.0, update_display: bool = True, validated: bool = False):
+		"""Apply step value to a single parameter based on coalesced MIDI input
 		
 		In hover mode (not slot mode), if multiple operators of the same type are selected,
-		the same parameter change will be applied to all of them."""
+		the same parameter change will be applied to all of them.
+		Pass validated=True for members of a ParGroup control plan (already validated)."""
 		# Validate parameter is editable (constant or bind mode, not expression/export)
-		if not ParameterValidator.is_valid_parameter(active_par):
+		if not validated and not ParameterValidator.is_valid_parameter(active_par):
 			# Parameter has expression or is in export mode - show error and skip
 			if update_display:
 				self.parent.display_manager.show_parameter_error(active_par, ScreenMessages.EXPR)
@@ -422,10 +609,8 @@ class MidiMessageHandler:
 		if self.parent.knobPushState:
 			step = self._get_push_step(step)
 		
-		diff = value - MidiConstants.MIDI_CENTER_VALUE
-		
 		# Apply step to main parameter
-		self._apply_step_to_parameter(active_par, step, diff, update_cached_change=True)
+		self._apply_step_to_parameter(active_par, step, diff, ticks, gain, update_cached_change=True)
 		
 		if self.parent.activeSlot is None: # hover mode
 			# Multi-operator editing: Apply same change to other selected operators of same type
@@ -434,24 +619,104 @@ class MidiMessageHandler:
 			if mulit_mode != MultiAdjustMode.OFF.value:
 				matching_pars = ParameterValidator.get_matching_selected_pars(active_par)
 				if matching_pars:
-					for other_par in matching_pars:
-						try:
-							if other_par is None or not ParameterValidator.is_valid_parameter(other_par):
-								continue
-							
-							if mulit_mode == MultiAdjustMode.SNAP.value:
-								other_par.val = active_par.eval()
-							elif mulit_mode == MultiAdjustMode.RELATIVE.value:
-								# Apply the same step adjustment
-								self._apply_step_to_parameter(other_par, step, diff, update_cached_change=False)
-						except:
-							# If any error occurs with one operator, continue with others
-							continue
+					self._apply_multi_adjust(active_par, matching_pars, mulit_mode, step, diff, ticks, gain)
 		
 		# Update screen display (only if requested)
 		if update_display:
 			self.parent.display_manager.update_parameter_display(active_par)
 
+	def _apply_multi_adjust(self, active_par: Par, matching_pars: list, multi_mode: str,
+							step: float, diff: int, ticks: int, gain: float = 1.0):
+		"""Apply a knob step to all matching parameters of other selected operators in one batch.
+		
+		Targets are gathered once, numeric RELATIVE steps are computed in a single vectorized
+		pass and all values are written back in one loop. Failing targets are collected in
+		multiAdjustFailures instead of interrupting the batch.
+		"""
+		failures = []
+		targets = []
+		for other_par in matching_pars:
+			try:
+				if other_par is not None and ParameterValidator.is_valid_parameter(other_par):
+					targets.append(other_par)
+			except Exception as e:
+				failures.append((other_par, e))
+		
+		if multi_mode == MultiAdjustMode.SNAP.value:
+			value = active_par.eval()
+			writes = [(other_par, value) for other_par in targets]
+		elif multi_mode == MultiAdjustMode.RELATIVE.value:
+			numeric = []
+			writes = []
+			for other_par in targets:
+				if other_par.isNumber:
+					numeric.append(other_par)
+				else:
+					# Menus and toggles step through their options individually
+					try:
+						self._apply_step_to_parameter(other_par, step, diff, ticks, gain, update_cached_change=False)
+					except Exception as e:
+						failures.append((other_par, e))
+			if numeric:
+				writes = zip(numeric, self._batch_step_values(numeric, step, diff, ticks, gain))
+		else:
+			writes = []
+		
+		for other_par, value in writes:
+			try:
+				other_par.val = value
+			except Exception as e:
+				failures.append((other_par, e))
+		
+		self.multiAdjustFailures = [(self._par_path(p), str(e)) for p, e in failures]
+	
+	def _batch_step_values(self, pars: list, step: float, diff: int, ticks: int, gain: float = 1.0) -> list:
+		"""Compute stepped values for numeric parameters in one pass (NumPy if available).
+		Mirrors the numeric branch of _apply_step_to_parameter, including adaptive ranges and integers."""
+		adaptive = self.parent.stepMode != StepMode.FIXED
+		currents = [p.eval() for p in pars]
+		is_int = [p.isInt for p in pars]
+		ranges = [p.normMax - p.normMin for p in pars] if adaptive else None
+		
+		if np is not None:
+			cur = np.asarray(currents, dtype=np.float64)
+			ints = np.asarray(is_int, dtype=bool)
+			if adaptive:
+				rng = np.asarray(ranges, dtype=np.float64)
+				float_amount = rng * step * diff * gain
+				int_amount = np.maximum(1.0, rng * step) * ticks
+			else:
+				float_amount = np.full(cur.shape, step * diff * gain)
+				int_amount = np.full(cur.shape, float(ticks))
+			if gain != 1.0:
+				int_amount = np.round(int_amount * gain)
+				int_amount[int_amount == 0] = ticks
+			new_values = np.where(ints, np.round(cur + int_amount), cur + float_amount)
+			return [int(v) if i else float(v) for v, i in zip(new_values.tolist(), is_int)]
+		
+		new_values = []
+		for idx, current in enumerate(currents):
+			if adaptive:
+				float_amount = ranges[idx] * step * diff * gain
+				int_amount = max(1, ranges[idx] * step) * ticks
+			else:
+				float_amount = step * diff * gain
+				int_amount = ticks
+			if is_int[idx]:
+				if gain != 1.0:
+					int_amount = int(round(int_amount * gain)) or ticks
+				new_values.append(int(round(current + int_amount)))
+			else:
+				new_values.append(current + float_amount)
+		return new_values
+	
+	@staticmethod
+	def _par_path(par) -> str:
+		try:
+			return f'{par.owner.path}:{par.name}'
+		except Exception:
+			return str(par)
+	
 	def _get_push_step(self, step: float) -> float:
 		if self.parent.evalPushstepmode == PushStepMode.FIXED.value:
 			return self.parent.evalPushstep
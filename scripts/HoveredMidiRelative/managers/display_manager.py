@@ -6,11 +6,434 @@ Saveorigin : HoveredMidiRelative.201.toe
 Saveversion : 2023.12120
 Info Header End'''
 import re
+import json
 from typing import Optional, Union
-from constants import ScreenMessages, VSN1Constants, KnobLedUpdateMode, StepMode
+from constants import ScreenMessages, VSN1Constants, VSN1DisplayState, VSN1Routines, BridgeQueueKey, DisplaySchedulerConstants, KnobLedUpdateMode, StepMode
 from formatters import LabelFormatter
 from validators import ParameterValidator
 import math
+import time
+
+class DisplayRequest:
+	"""Latest routine display update waiting for the next flush (one instance, overwritten in place)"""
+	__slots__ = ('pending', 'val', 'min_val', 'max_val', 'label', 'display_text', 'norm_default', 'clamps', 'force_knob_leds')
+	
+	def __init__(self):
+		self.set(None, None, None, None, None, None, None, False)
+		self.pending = False
+	
+	def set(self, val, min_val, max_val, label, display_text, norm_default, clamps, force_knob_leds):
+		self.val = val
+		self.min_val = min_val
+		self.max_val = max_val
+		self.label = label
+		self.display_text = display_text
+		self.norm_default = norm_default
+		self.clamps = clamps
+		self.force_knob_leds = force_knob_leds
+		self.pending = True
+
+class RenderFrame:
+	"""Last rendered display frame (one instance, overwritten in place).
+	assign() returns a bitmask of the fields that changed since the previous frame, so the
+	VSN1 and UI renderers only re-format / re-set those.
+	"""
+	VALUE = 1 << 0  # Value text and circle fill
+	RANGE = 1 << 1
+	LABEL = 1 << 2
+	BOTTOM_TEXT = 1 << 3
+	STEP_INDICATOR = 1 << 4
+	NORM_DEFAULT = 1 << 5
+	CLAMPS = 1 << 6
+	ALL = (1 << 7) - 1
+	
+	__slots__ = ('val', 'norm_min', 'norm_max', 'label', 'bottom_text', 'percentage', 'step_indicator', 'norm_default', 'clamps', 'dirty', 'stale')
+	
+	def __init__(self):
+		self.val = self.norm_min = self.norm_max = self.label = self.bottom_text = None
+		self.percentage = self.step_indicator = self.norm_default = self.clamps = None
+		self.dirty = RenderFrame.ALL
+		self.stale = True
+	
+	def assign(self, val, norm_min, norm_max, label, bottom_text, percentage, step_indicator, norm_default, clamps) -> int:
+		"""Store the next frame and return its dirty bits"""
+		if self.stale:
+			dirty = RenderFrame.ALL
+			self.stale = False
+		else:
+			dirty = 0
+			if val != self.val or percentage != self.percentage:
+				dirty |= RenderFrame.VALUE
+			if norm_min != self.norm_min or norm_max != self.norm_max:
+				dirty |= RenderFrame.RANGE
+			if label != self.label:
+				dirty |= RenderFrame.LABEL
+			if bottom_text != self.bottom_text:
+				dirty |= RenderFrame.BOTTOM_TEXT
+			if step_indicator != self.step_indicator:
+				dirty |= RenderFrame.STEP_INDICATOR
+			if norm_default != self.norm_default:
+				dirty |= RenderFrame.NORM_DEFAULT
+			if clamps != self.clamps:
+				dirty |= RenderFrame.CLAMPS
+		self.val = val
+		self.norm_min = norm_min
+		self.norm_max = norm_max
+		self.label = label
+		self.bottom_text = bottom_text
+		self.percentage = percentage
+		self.step_indicator = step_indicator
+		self.norm_default = norm_default
+		self.clamps = clamps
+		self.dirty = dirty
+		return dirty
+	
+	def invalidate(self):
+		"""Something was drawn outside the frame pipeline, the next frame redraws every field"""
+		self.stale = True
+
+class LedFeedbackChannel:
+	"""Deduplicated, rate-limited LED feedback.
+	Only values that differ from what was last sent go out, at most once per interval per LED;
+	faster changes are held and the latest value is sent when the interval has passed.
+	"""
+	def __init__(self, send_func, interval_ms: float = VSN1Constants.LED_FEEDBACK_INTERVAL_MS):
+		self._send_func = send_func  # Called with {led key: value}, returns False if nothing was sent
+		self.interval = interval_ms / 1000.0
+		self._sent = {}
+		self._last_send = {}
+		self._pending = {}
+		self._flush_run = None
+		self.sends = 0
+		self.suppressed = 0
+	
+	def update(self, values: dict):
+		"""Request LED values, keyed by LED"""
+		now = absTime.seconds
+		due = {}
+		for key, value in values.items():
+			if self._sent.get(key) == value:
+				# Already showing this value, drop any newer value still waiting
+				self._pending.pop(key, None)
+				self.suppressed += 1
+			elif now - self._last_send.get(key, -1.0) >= self.interval:
+				self._pending.pop(key, None)
+				due[key] = value
+			else:
+				self._pending[key] = value
+		self._send(due, now)
+		self._arm_flush()
+	
+	def reset(self):
+		"""Forget the sent values so the next update of every LED is sent"""
+		self._sent.clear()
+	
+	def _send(self, values: dict, now: float):
+		if not values or self._send_func(values) is False:
+			return
+		self.sends += 1
+		self._sent.update(values)
+		for key in values:
+			self._last_send[key] = now
+	
+	def _arm_flush(self):
+		if not self._pending or self._flush_run is not None:
+			return
+		self._flush_run = run("args[0]._flush()", self, delayMilliSeconds=math.ceil(self.interval * 1000), delayRef=op.TDResources)
+	
+	def _flush(self):
+		self._flush_run = None
+		now = absTime.seconds
+		due = {key: value for key, value in self._pending.items()
+			   if now - self._last_send.get(key, -1.0) >= self.interval}
+		for key in due:
+			del self._pending[key]
+		self._send(due, now)
+		self._arm_flush()
+
+class RenderTarget:
+	"""A display surface the DisplayManager fans its frames out to.
+	Each target keeps its own serializer state and the dirty bits of frames it has not shown yet,
+	so a target that holds frames back (throttle, backpressure) catches up with the latest one.
+	"""
+	min_interval_ms = 0.0  # Per-target throttle on top of the shared display scheduler
+	
+	def __init__(self, manager):
+		self.manager = manager
+		self.dirty = RenderFrame.ALL
+		self._last_render = -1.0
+		self.frames_rendered = 0
+		self.frames_held = 0
+	
+	@property
+	def enabled(self) -> bool:
+		return True
+	
+	def ready(self) -> bool:
+		"""Whether the target takes a frame now"""
+		return (absTime.seconds - self._last_render) * 1000 >= self.min_interval_ms
+	
+	def submit(self, frame: RenderFrame, dirty: int) -> bool:
+		"""Render the frame if the target is ready, returns False if it was held back"""
+		self.dirty |= dirty
+		if not self.enabled or not self.dirty:
+			return True
+		if not self.ready():
+			self.frames_held += 1
+			return False
+		self.render(frame, self.dirty)
+		self.dirty = 0
+		self._last_render = absTime.seconds
+		self.frames_rendered += 1
+		return True
+	
+	def invalidate(self):
+		self.dirty = RenderFrame.ALL
+	
+	def detach(self):
+		"""Called when the target is removed from the DisplayManager"""
+		pass
+	
+	def render(self, frame: RenderFrame, dirty: int):
+		"""Draw the dirty fields of the frame on the surface (subclasses implement this)"""
+		pass
+	
+	# Outputs outside the frame, no-ops unless the surface has them
+	def connect(self):
+		pass
+	
+	def clear(self):
+		pass
+	
+	def set_bank(self, bank_idx: int):
+		pass
+	
+	def set_outline(self, color_index: int):
+		pass
+	
+	def set_step_mode(self, step_mode: StepMode, mode_frame: RenderFrame):
+		pass
+	
+	def set_leds(self, leds: dict):
+		pass
+
+class VSN1Target(RenderTarget):
+	"""A VSN1 module behind an IntechGridComm component: update_param() field deltas, routine calls and Lua LEDs"""
+	def __init__(self, manager, grid_comm):
+		super().__init__(manager)
+		self.grid_comm : IntechGridCommExt = grid_comm
+		# update_param() fields as Lua literals, indexed by VSN1DisplayState field (index 0 unused):
+		# the current frame, and the last one sent to the module (None forces a full frame)
+		self._fields = [None] * (VSN1DisplayState.NUM_FIELDS + 1)
+		self._state = None
+		# Bank/outline/step mode routine calls, sent as the prefix of the next display frame so they
+		# always reach the module before the frame that uses them (routine -> call, latest wins)
+		self._setters = {}
+		self._sent_setters = {}  # Last setter call per routine, replayed when the module lost its state
+		self.led_channel = LedFeedbackChannel(self._send_leds)
+		self.grid_comm.creditListeners.append(self._on_credit)
+		self.grid_comm.moduleResetListeners.append(self._on_module_reset)
+	
+	@property
+	def enabled(self) -> bool:
+		return self.manager.is_vsn1_enabled()
+	
+	def ready(self) -> bool:
+		"""Only render when the bridge has forwarded the previous frame, so no frame is serialized just to be replaced"""
+		return super().ready() and self.grid_comm.HasCredit(BridgeQueueKey.DISPLAY)
+	
+	def _on_credit(self, key: str):
+		"""The bridge forwarded a frame: show the latest one right away if frames or setters were held meanwhile"""
+		if key != BridgeQueueKey.DISPLAY:
+			return
+		if self.dirty and self.manager._targets_behind:
+			self.manager._render_targets(0)
+		elif self._setters:
+			self._send_state()
+	
+	def _on_module_reset(self):
+		"""The module rebooted or reloaded its profile: reinstall the routines and send everything again"""
+		if not self.enabled:
+			return
+		self.connect()
+		self._state = None
+		self._setters = {**self._sent_setters, **self._setters}
+		self.led_channel.reset()
+		self.invalidate()
+		self.manager._render_targets(0)
+		self.manager.update_all_slot_leds()
+	
+	def detach(self):
+		if self._on_credit in self.grid_comm.creditListeners:
+			self.grid_comm.creditListeners.remove(self._on_credit)
+		if self._on_module_reset in self.grid_comm.moduleResetListeners:
+			self.grid_comm.moduleResetListeners.remove(self._on_module_reset)
+	
+	def render(self, frame: RenderFrame, dirty: int):
+		"""Render the frame to the VSN1 screen - ONLY the Lua output, no logic"""
+		if self._state is None:
+			dirty = RenderFrame.ALL
+		
+		# Only re-format the Lua literals of dirty fields, the others keep last frame's
+		fields = self._fields
+		if dirty & RenderFrame.VALUE:
+			fields[VSN1DisplayState.VALUE] = f'{frame.val}'
+		if dirty & RenderFrame.RANGE:
+			fields[VSN1DisplayState.NORM_MIN] = f'{frame.norm_min}'
+			fields[VSN1DisplayState.NORM_MAX] = f'{frame.norm_max}'
+		if dirty & RenderFrame.LABEL:
+			fields[VSN1DisplayState.LABEL] = f"'{frame.label}'"
+		if dirty & RenderFrame.BOTTOM_TEXT:
+			fields[VSN1DisplayState.BOTTOM_TEXT] = f"'{frame.bottom_text}'"
+		if dirty & RenderFrame.STEP_INDICATOR:
+			fields[VSN1DisplayState.STEP_INDICATOR] = f'{frame.step_indicator}' if frame.step_indicator is not None else VSN1DisplayState.NIL
+		if dirty & RenderFrame.NORM_DEFAULT:
+			fields[VSN1DisplayState.NORM_DEFAULT] = f'{frame.norm_default if frame.norm_default is not None else -1}'
+		if dirty & RenderFrame.CLAMPS:
+			clamps = frame.clamps if frame.clamps is not None else (0, 0)
+			fields[VSN1DisplayState.CLAMPS] = '{'+f'{1 if clamps[0] else 0}, {1 if clamps[1] else 0}'+ '}'
+		
+		# Slot labels and bank are not part of the frame, check them every time
+		info = self.manager._get_slot_label_strip()
+		fields[VSN1DisplayState.INFO] = '{' + ','.join(f"'{s}'" for s in info) + '}' if info else '{}'
+		currBank = self.manager.parent.currBank
+		fields[VSN1DisplayState.BANK] = f'{currBank if currBank is not None else 0}'
+		self._send_state()
+	
+	def _send_state(self):
+		"""Send only the update_param() fields that changed since the last frame.
+		The first frame after a (re)connect or screen clear is sent in full. Pending setters go first."""
+		# No queue key: display frames use the bridge's default queue
+		prefix = ''
+		if self._setters:
+			prefix = ' '.join(self._setters.values()) + ' '
+			self._sent_setters.update(self._setters)
+			self._setters.clear()
+		fields = self._fields
+		state = self._state
+		if state is None:
+			self._state = list(fields)
+			self.grid_comm.SendState(VSN1DisplayState.UPDATE_FUNC, {i: fields[i] for i in range(1, len(fields))}, prefix=prefix, reset=True)
+			return
+		delta = None
+		for i in range(1, len(fields)):
+			if fields[i] != state[i]:
+				if delta is None:
+					delta = {}
+				delta[i] = state[i] = fields[i]
+		if delta is not None or prefix:
+			self.grid_comm.SendState(VSN1DisplayState.UPDATE_FUNC, delta or {}, prefix=prefix)
+	
+	def connect(self):
+		"""Push the Lua routine registry to the module (a no-op there if this version is installed)"""
+		self.grid_comm.SendLua(VSN1Routines.INSTALL)
+		# The package can end its queued scripts with the short echo routine from now on
+		self.grid_comm.ConfigurePacing(echo=VSN1Routines.PACING_ECHO)
+	
+	def clear(self):
+		# Install first (a no-op if present), the module may have rebooted since the last connect
+		self.connect()
+		self.call_routine(VSN1Routines.CLEAR)
+		# Screen is blank now, forget what it showed so the next render is a full frame
+		self._state = None
+		self.led_channel.reset()
+		self.invalidate()
+	
+	def set_bank(self, bank_idx: int):
+		self._queue_setter(VSN1Routines.BANK, bank_idx)
+	
+	def set_outline(self, color_index: int):
+		self._queue_setter(VSN1Routines.OUTLINE, color_index)
+	
+	def set_step_mode(self, step_mode: StepMode, mode_frame: RenderFrame):
+		self._setters[VSN1Routines.STEP_MODE] = f'{VSN1Routines.STEP_MODE}({2 if step_mode == StepMode.FIXED else 3})'
+		self.render(mode_frame, RenderFrame.ALL)
+		self.invalidate()
+	
+	def _queue_setter(self, routine: str, arg: int):
+		"""Run the setter ahead of the next display frame, right away if the display queue has room"""
+		self._setters[routine] = f'{routine}({arg})'
+		if self.ready():
+			self._send_state()
+	
+	def set_leds(self, leds: dict):
+		"""Send LED values (unchanged LEDs are skipped)"""
+		self.led_channel.update(leds)
+	
+	def _send_leds(self, leds: dict):
+		"""LED channel output: changed LEDs merged into the bridge's pending LED message"""
+		self.grid_comm.SendState(VSN1Routines.LEDS, leds, key=BridgeQueueKey.LEDS)
+	
+	def call_routine(self, routine: str, *args, key: str = ''):
+		"""Call an installed routine with numeric arguments.
+		With a key the call is queued in the bridge, where only the latest call per key is kept."""
+		self.grid_comm.SendLua(f"{routine}({','.join(str(a) for a in args)})", queue=bool(key), key=key)
+
+class UITarget(RenderTarget):
+	"""The panel UI, drawn by UIManager"""
+	def __init__(self, manager, ui_renderer):
+		super().__init__(manager)
+		self.ui_renderer = ui_renderer
+	
+	@property
+	def enabled(self) -> bool:
+		return self.ui_renderer.ui_enabled
+	
+	def render(self, frame: RenderFrame, dirty: int):
+		self.ui_renderer.render_display(frame.val, frame.norm_min, frame.norm_max, frame.label, frame.bottom_text, frame.percentage, step_indicator=frame.step_indicator, norm_default=frame.norm_default, clamps=frame.clamps, dirty=dirty)
+	
+	def clear(self):
+		self.ui_renderer.clear_screen()
+		self.invalidate()
+	
+	def set_bank(self, bank_idx: int):
+		self.ui_renderer.set_bank_indicator(bank_idx)
+	
+	def set_outline(self, color_index: int):
+		self.ui_renderer.update_outline_color(color_index)
+	
+	def set_step_mode(self, step_mode: StepMode, mode_frame: RenderFrame):
+		self.ui_renderer.set_stepmode_indicator(step_mode, mode_frame.step_indicator)
+
+class WebsocketMirrorTarget(RenderTarget):
+	"""Display mirror as JSON messages over a websocket DAT (e.g. a browser view or another TD session).
+	Frames only carry their dirty fields, at most one per min_interval_ms."""
+	FIELDS = (
+		(RenderFrame.VALUE, ('val', 'percentage')),
+		(RenderFrame.RANGE, ('norm_min', 'norm_max')),
+		(RenderFrame.LABEL, ('label',)),
+		(RenderFrame.BOTTOM_TEXT, ('bottom_text',)),
+		(RenderFrame.STEP_INDICATOR, ('step_indicator',)),
+		(RenderFrame.NORM_DEFAULT, ('norm_default',)),
+		(RenderFrame.CLAMPS, ('clamps',)),
+	)
+	
+	def __init__(self, manager, websocket, min_interval_ms: float = DisplaySchedulerConstants.MIN_INTERVAL_MS):
+		super().__init__(manager)
+		self.websocket = websocket
+		self.min_interval_ms = min_interval_ms
+	
+	def _send(self, message: dict):
+		self.websocket.sendText(json.dumps(message, default=str))
+	
+	def render(self, frame: RenderFrame, dirty: int):
+		self._send({'type': 'frame', 'fields': {name: getattr(frame, name) for bit, names in self.FIELDS if dirty & bit for name in names}})
+	
+	def clear(self):
+		self._send({'type': 'clear'})
+		self.invalidate()
+	
+	def set_bank(self, bank_idx: int):
+		self._send({'type': 'bank', 'index': bank_idx})
+	
+	def set_outline(self, color_index: int):
+		self._send({'type': 'outline', 'color': color_index})
+	
+	def set_step_mode(self, step_mode: StepMode, mode_frame: RenderFrame):
+		self._send({'type': 'stepmode', 'mode': step_mode.value})
+	
+	def set_leds(self, leds: dict):
+		self._send({'type': 'leds', 'leds': leds})
 
 class DisplayManager:
 	"""Unified display manager that handles ALL display logic and hardware rendering (VSN1 + UI)"""
@@ -22,12 +445,29 @@ class DisplayManager:
 		self.grid_comm : IntechGridCommExt = self.parent.ownerComp.op('IntechGridComm').ext.IntechGridCommExt
 		self.knob_led_dampen = 0.4
 		
-		# Throttled display update system (for VSN1's ~20fps refresh rate)
+		# Surfaces every frame is fanned out to, more can be added with add_render_target()
+		self.vsn1_target = VSN1Target(self, self.grid_comm)
+		self.ui_target = UITarget(self, self.ui_renderer)
+		self.render_targets = [self.vsn1_target, self.ui_target]
+		self._targets_behind = False  # A target held back the last frame, keep a flush armed for it
+		
+		# LED feedback: knob ring fill (MIDI CC), the Lua set_led() LEDs are fed per VSN1 target
+		self.ring_led_channel = LedFeedbackChannel(self._send_ring_led)
+		self.midi_out_error = False  # Last LED feedback send failed to reach the MIDI device
+		
+		# Slot label strip per bank: bank_idx -> (slot list, labels, slot keys, slot indices by key)
+		self._slot_label_cache = {}
+		
+		# Throttled display update system: armed only while data is pending, interval adapts to downstream
 		self._display_update_run = None
-		self._pending_display_data = None
-		fps = 30
-		self._display_update_interval_ms = int((1.0 / fps) * 1000)
+		self._pending_display = DisplayRequest()
+		self._frame = RenderFrame()
+		self._display_update_interval_ms = DisplaySchedulerConstants.MIN_INTERVAL_MS
 		self._display_timer_running = False
+		self._last_display_flush = 0.0
+		self.display_flushes = 0
+		self.display_frames_outpaced = 0  # Flushes that came faster than the bridge forwards frames
+		self.display_cost_ms = 0.0  # Smoothed render + send time of a flush
 	
 	def is_vsn1_enabled(self) -> bool:
 		"""Check if VSN1 hardware support is enabled"""
@@ -83,12 +523,10 @@ class DisplayManager:
 	
 	def clear_screen(self):
 		"""Clear all displays"""
-		# VSN1
-		if self.is_vsn1_enabled():
-			lua_code = "--[[@cb]] lcd:ldaf(0,0,319,239,c[1])lcd:ldrr(3,3,317,237,10,c[2])lcd:ldsw()"
-			self.grid_comm.SendLua(lua_code)
-		# UI
-		self.ui_renderer.clear_screen()
+		for target in self._enabled_targets():
+			target.clear()
+		self.ring_led_channel.reset()
+		self.invalidate_render_frame()
 	
 	def update_all_display(self, val, norm_min, norm_max, 
 						  label: str, display_text: Optional[str] = None, step_indicator = None, compress: bool = True, norm_default = None, clamps = None):
@@ -127,11 +565,37 @@ class DisplayManager:
 
 		if step_indicator is None:
 			# get current step if not provided for some reason
-			step_indicator = next((i for i, s in enumerate(self.parent.seqSteps) if s.par.Step.eval() == self.parent._currStep), None)
-		# Delegate to renderers with processed data
-		self._render_vsn1_display(val, norm_min, norm_max, processed_label, bottom_text, step_indicator=step_indicator, norm_default=norm_default, clamps=clamps)
-		
-		self.ui_renderer.render_display(val, norm_min, norm_max, processed_label, bottom_text, percentage, step_indicator=step_indicator, norm_default=norm_default, clamps=clamps)
+			step_indicator = self.parent.stepTable.current_index
+		# Compute the frame once, the render targets only redo the fields that changed
+		dirty = self._frame.assign(val, norm_min, norm_max, processed_label, bottom_text, percentage, step_indicator, norm_default, clamps)
+		self._render_targets(dirty)
+	
+	def _render_targets(self, dirty: int):
+		"""Fan the current frame out to every render target, keep a flush armed for targets that held it back"""
+		self._targets_behind = False
+		for target in self.render_targets:
+			if not target.submit(self._frame, dirty):
+				self._targets_behind = True
+		if self._targets_behind:
+			self._ensure_display_update_timer()
+	
+	def _enabled_targets(self) -> list:
+		return [target for target in self.render_targets if target.enabled]
+	
+	def add_render_target(self, target: RenderTarget):
+		"""Fan the display out to another surface (e.g. a second Grid module), starting from the current frame"""
+		self.render_targets.append(target)
+		if not target.enabled:
+			return
+		target.connect()
+		target.clear()
+		if self._frame.label is not None:
+			target.submit(self._frame, RenderFrame.ALL)
+	
+	def remove_render_target(self, target: RenderTarget):
+		if target in self.render_targets:
+			self.render_targets.remove(target)
+			target.detach()
     
 	def update_parameter_display(self, par_or_group: Union[Par, ParGroup], bottom_text: str = None, force_knob_leds: bool = False, is_routine: bool = True):
 		"""Update displays for a specific parameter (or ParGroup) - handles ALL logic here
@@ -197,82 +661,91 @@ class DisplayManager:
 			return
 		
 		# Routine update: Store pending display data (will be rendered when timer fires)
-		self._pending_display_data = {
-			'val': val,
-			'min_val': min_val,
-			'max_val': max_val,
-			'label': label,
-			'display_text': display_text,
-			'norm_default': norm_default,
-			'clamps': clamps,
-			'force_knob_leds': force_knob_leds
-		}
+		self._pending_display.set(val, min_val, max_val, label, display_text, norm_default, clamps, force_knob_leds)
 		
 		# Ensure the continuous timer is running (don't restart, just ensure it exists)
 		self._ensure_display_update_timer()
 	
 	def _ensure_display_update_timer(self):
-		"""Ensure the continuous display update timer is running. Starts it if not already running."""
+		"""Arm a single display flush for the pending data. Nothing is scheduled while idle."""
 		if self._display_timer_running:
-			return  # Timer already running, just update pending data
+			return  # Already armed, the flush picks up the latest pending data
 		
-		# Start continuous timer that fires every 50ms
 		self._display_timer_running = True
-		self._display_update_run = run(
-			"args[0]._display_timer_tick()",
-			self,
-			delayMilliSeconds=self._display_update_interval_ms,
-			delayRef=op.TDResources
-		)
+		wait_ms = self._display_update_interval_ms - (absTime.seconds - self._last_display_flush) * 1000
+		if wait_ms > 0:
+			self._display_update_run = run(
+				"args[0]._display_timer_tick()",
+				self,
+				delayMilliSeconds=math.ceil(wait_ms),
+				delayRef=op.TDResources
+			)
+		else:
+			# Idle for longer than the interval: flush at frame end (still merges same-frame updates)
+			self._display_update_run = run(
+				"args[0]._display_timer_tick()",
+				self,
+				endFrame=True,
+				delayRef=op.TDResources
+			)
 	
 	def _display_timer_tick(self):
-		"""Called every 50ms by the continuous timer. Flushes pending display and schedules next tick."""
-		# Flush pending display if available
-		if self._pending_display_data is not None:
-			data = self._pending_display_data
-			self._pending_display_data = None
-			
-			# Update all displays with the latest data
-			self.update_all_display(
-				data['val'],
-				data['min_val'],
-				data['max_val'],
-				data['label'],
-				data['display_text'],
-				compress=True,
-				norm_default=data['norm_default'],
-				clamps=data['clamps']
-			)
-			
-			# Handle knob LED updates if forced
-			if data['force_knob_leds']:
-				self._update_knob_leds(data['val'], data['min_val'], data['max_val'])
-		
-		# Check if timer should continue running
-		# If there's no pending data and no active parameter, stop the timer
-		if self._pending_display_data is None:
-			# Check if we should keep timer running (if there's an active parameter, keep it running)
-			if self.parent.activePar is None and self.parent.hoveredPar is None:
-				self._display_timer_running = False
-				return
+		"""Flush the pending display data, adapt the flush interval and go idle until new data arrives"""
+		self._display_timer_running = False
+		self._display_update_run = None
+		data = self._pending_display
+		if not data.pending:
+			if self._targets_behind:
+				# No new data, but a target still has to catch up with the last frame
+				self._render_targets(0)
+			return
+		data.pending = False
 		
-		# Schedule next tick (continuous loop)
-		self._display_update_run = run(
-			"args[0]._display_timer_tick()",
-			self,
-			delayMilliSeconds=self._display_update_interval_ms,
-			delayRef=op.TDResources
+		gap_ms = (absTime.seconds - self._last_display_flush) * 1000
+		self._last_display_flush = absTime.seconds
+		start = time.perf_counter()
+		
+		# Update all displays with the latest data
+		self.update_all_display(
+			data.val,
+			data.min_val,
+			data.max_val,
+			data.label,
+			data.display_text,
+			compress=True,
+			norm_default=data.norm_default,
+			clamps=data.clamps
 		)
+		
+		# Handle knob LED updates if forced
+		if data.force_knob_leds:
+			self._update_knob_leds(data.val, data.min_val, data.max_val)
+		
+		self._adapt_display_interval(gap_ms, (time.perf_counter() - start) * 1000)
+	
+	def _adapt_display_interval(self, gap_ms: float, cost_ms: float):
+		"""Back off when frames outpace the bridge queue or rendering gets expensive, otherwise speed up"""
+		consts = DisplaySchedulerConstants
+		self.display_flushes += 1
+		self.display_cost_ms += consts.COST_SMOOTHING * (cost_ms - self.display_cost_ms)
+		
+		interval = self._display_update_interval_ms
+		# The package reports the interval it paces its queue to, measured from the module round trip
+		if gap_ms < (self.grid_comm.bridgeIntervalMs or consts.BRIDGE_QUEUE_INTERVAL_MS):
+			# index.js keeps only the newest queued frame, so this one likely replaced an unsent one
+			self.display_frames_outpaced += 1
+			interval += consts.INTERVAL_STEP_MS
+		else:
+			interval *= consts.INTERVAL_DECAY
+		interval = max(interval, self.display_cost_ms * consts.COST_FACTOR)
+		self._display_update_interval_ms = tdu.clamp(interval, consts.MIN_INTERVAL_MS, consts.MAX_INTERVAL_MS)
 
 	def _get_display_parameter(self, par_or_group: Union[Par, ParGroup]) -> Optional[Par]:
 		"""Extract the parameter to display from either a single Par or ParGroup
 		For ParGroups, returns the first valid parameter"""
 		if ParameterValidator.is_pargroup(par_or_group):
-			# Get first valid parameter from the group
-			for p in par_or_group:
-				if p is not None and ParameterValidator.is_valid_parameter(p):
-					return p
-			return None
+			# First valid member, from the group's control plan
+			return self.parent.midi_handler.get_pargroup_plan(par_or_group).display_par
 		
 		# Single Par - validate it exists
 		if not par_or_group.valid:
@@ -385,20 +858,20 @@ class DisplayManager:
 			percentage = (val - min_val) / (max_val - min_val) if max_val != min_val else 0.5
 			self.update_knob_leds_gradual(percentage)
 		elif self.parent.knobLedUpdateMode in [KnobLedUpdateMode.STEPS]:
-			index = next((i for i, s in enumerate(self.parent.seqSteps) if s.par.Step.eval() == self.parent._currStep), None)
+			index = self.parent.stepTable.current_index
 			self.update_knob_leds_steps(index)
 		elif self.parent.knobLedUpdateMode in [KnobLedUpdateMode.OFF]:
 			self.update_knob_leds_gradual(0)
 	
 	def update_step_display(self, step: float):
 		"""Update displays with current step value - handles ALL logic here"""
-		seq = self.parent.seqSteps
-		if len(seq) == 0:
+		step_table = self.parent.stepTable
+		if not step_table.steps:
 			return
 			
 		# Calculate step display values
-		min_step = min(s.par.Step.eval() for s in seq)
-		max_step = max(s.par.Step.eval() for s in seq)
+		min_step = step_table.min_step
+		max_step = step_table.max_step
 		
 		# Map step to 0-1 range for display
 		if max_step != min_step:
@@ -410,7 +883,7 @@ class DisplayManager:
 		mapped_step = mapped_step ** 0.5
 		
 		# Find step index for indicator
-		index = next((i for i, s in enumerate(seq) if s.par.Step.eval() == step), None)
+		index = step_table.index_of(step)
 		
 		self.update_all_display(mapped_step, min_step, max_step, ScreenMessages.STEP, 
 							   display_text=str(step), step_indicator=index, compress=False)
@@ -421,11 +894,8 @@ class DisplayManager:
 			self.step_updated = True
 
 	def set_bank_indicator(self, bank_idx: int):
-		# VSN1
-		if self.is_vsn1_enabled():
-			self.grid_comm.SendLua(f'b={bank_idx};lcd:ldsw()')
-		# UI
-		self.ui_renderer.set_bank_indicator(bank_idx)
+		for target in self._enabled_targets():
+			target.set_bank(bank_idx)
 	
 	# VSN1-specific methods that also update UI equivalents
 	def update_all_slot_leds(self):
@@ -457,11 +927,8 @@ class DisplayManager:
 	
 	def update_outline_color_index(self, color_index: int):
 		"""Update outline color and UI equivalent"""
-		# VSN1
-		if self.is_vsn1_enabled():
-			self.grid_comm.SendLua(f'rc={color_index};lcd:ldrr(3,3,317,237,10,c[rc])lcd:ldsw()')
-		# UI
-		self.ui_renderer.update_outline_color(color_index)
+		for target in self._enabled_targets():
+			target.set_outline(color_index)
 	
 	def send_slot_led_feedback(self, slot_idx: int, value: int):
 		"""Send slot feedback to both displays"""
@@ -474,63 +941,101 @@ class DisplayManager:
 
 	def set_stepmode_indicator(self, step_mode: StepMode):
 		"""Set mode indicator in UI"""
-		curr_step = self.parent._currStep
-		step_indicator = next((i for i, s in enumerate(self.parent.seqSteps) if s.par.Step.eval() == curr_step), None)
-		# VSN1
-		if self.is_vsn1_enabled():
-			if step_mode == StepMode.FIXED:
-				self.grid_comm.SendLua(f'ci=2')
-			else:
-				self.grid_comm.SendLua(f'ci=3')
-			self._render_vsn1_display(0.5, 0, 1, '_MODE_', '_FIXED_' if step_mode == StepMode.FIXED else '_ADAPT_', step_indicator=step_indicator)
-		# UI
-		self.ui_renderer.set_stepmode_indicator(step_mode, step_indicator)
+		step_indicator = self.parent.stepTable.current_index
+		mode_frame = RenderFrame()
+		mode_frame.assign(0.5, 0, 1, '_MODE_', '_FIXED_' if step_mode == StepMode.FIXED else '_ADAPT_', 0.5, step_indicator, None, None)
+		for target in self._enabled_targets():
+			target.set_step_mode(step_mode, mode_frame)
+		self.invalidate_render_frame()
 	
 	# ============================================================================
 	# VSN1 Hardware Communication Methods (Private)
 	# ============================================================================
 	
 	def _send_batch_leds(self, led_updates: list):
-		"""Send multiple LED commands in a single Lua message"""
+		"""Send multiple LED commands in a single Lua message (unchanged LEDs are skipped)"""
 		if not self.is_vsn1_enabled() or not led_updates:
 			return
-		lua_commands = []
-		for idx, value in led_updates:
-			lua_commands.append(f'set_led({idx},1,{int(value)})')
-		batch_lua = ';'.join(lua_commands)
-		self.grid_comm.SendLua(batch_lua)
-	
-	def _render_vsn1_display(self, val, norm_min, norm_max, processed_label: str, bottom_text: str, step_indicator = None, norm_default = None, info = None, clamps = None):
-		"""Render display data to VSN1 screen - ONLY the Lua output, no logic"""
-		if not self.is_vsn1_enabled():
-			return
-		if info is None:
-			# list current active parameters
-			_slot_pars = self.parent.repo_manager.get_all_slots_for_bank(self.parent.currBank)
-			_slot_pars = _slot_pars + [None] * (len(VSN1Constants.SLOT_INDICES) - len(_slot_pars))
-			_labels = []
-			for i, par in enumerate(_slot_pars):
-				if par is not None:
-					try:
-						label = LabelFormatter.get_label_for_parameter(par, self.parent.labelDisplayMode, max_length=6)
-						if self.parent.activeSlot is not None:
-							_activePar = self.parent.repo_manager.get_slot_parameter(self.parent.activeSlot, self.parent.currBank)
-							if _activePar is not None and _activePar.owner == par.owner and _activePar.name == par.name:
-								label = '`'+label
-					except:
-						label = "---"
-				else:
-					label = "---"
-				_labels.append(label)	
-			info = _labels
-		if norm_default is None:
-			norm_default = -1
-		if clamps is None:
-			clamps = (0, 0)
-		info_lua = '{' + ','.join(f"'{s}'" for s in info) + '}' if info else '{}'
-		clamps_lua = '{'+f'{1 if clamps[0] else 0}, {1 if clamps[1] else 0}'+ '}'
-		lua_code = f"update_param({val}, {norm_min}, {norm_max}, '{processed_label}', '{bottom_text}', {step_indicator}, {norm_default}, {info_lua}, {clamps_lua}, {self.parent.currBank if self.parent.currBank is not None else 0})"
-		self.grid_comm.SendLua(lua_code, queue=True)
+		leds = {idx: int(value) for idx, value in led_updates}
+		for target in self._enabled_targets():
+			target.set_leds(leds)
+	
+	def _send_ring_led(self, values: dict):
+		"""Ring LED channel output: quantized fill as a MIDI CC"""
+		fill = values['ring'] / VSN1Constants.RING_LED_RESOLUTION
+		try:
+			self.parent.midiOut.sendControl(self.parent.evalChannel, VSN1Constants.ROTARY_LED_FEEDBACK_INDEX, fill)
+		except tdError as e:
+			if not self.midi_out_error:
+				self.midi_out_error = True
+				known = next((m for m in VSN1Constants.MIDI_OUT_ERRORS if m in str(e)), None)
+				if known:
+					self.parent.ownerComp.addScriptError(known)
+			return False
+		if self.midi_out_error or self._has_midi_out_script_error():
+			# Device is reachable again, also clears device errors raised elsewhere
+			self.midi_out_error = False
+			self.parent.ownerComp.clearScriptErrors(error="*MIDI*")
+		return True
+	
+	def _has_midi_out_script_error(self) -> bool:
+		"""Check if the component shows one of the known MIDI out device errors"""
+		errors = self.parent.ownerComp.scriptErrors()
+		return bool(errors) and any(m in errors for m in VSN1Constants.MIDI_OUT_ERRORS)
+	
+	def install_routines(self):
+		"""Push the Lua routine registry to every connected module (a no-op there if this version is installed)"""
+		for target in self._enabled_targets():
+			target.connect()
+	
+	def invalidate_render_frame(self):
+		"""Make the next frame redraw every field (after drawing outside the frame pipeline)"""
+		self._frame.invalidate()
+	
+	def _get_slot_label_strip(self) -> list:
+		"""Slot labels of the current bank for the VSN1 info table, with the active slot marked"""
+		bank_idx = self.parent.currBank
+		bank_slots = self.parent.slotPars[bank_idx]
+		entry = self._slot_label_cache.get(bank_idx)
+		# slotPars rows are replaced on reload/resize, so a different list also means stale
+		if entry is None or entry[0] is not bank_slots:
+			entry = self._build_slot_label_strip(bank_slots)
+			self._slot_label_cache[bank_idx] = entry
+		_, labels, keys, slots_by_key = entry
+		
+		# Mark every slot holding the active slot's parameter
+		active_slot = self.parent.activeSlot
+		if active_slot is None or active_slot >= len(keys) or keys[active_slot] is None:
+			return labels
+		labels = list(labels)
+		for i in slots_by_key[keys[active_slot]]:
+			labels[i] = '`' + labels[i]
+		return labels
+	
+	def _build_slot_label_strip(self, bank_slots: list) -> tuple:
+		"""Format the labels of one bank's slots (unmarked)"""
+		num_labels = max(len(bank_slots), len(VSN1Constants.SLOT_INDICES))
+		labels = ["---"] * num_labels
+		keys = [None] * num_labels
+		slots_by_key = {}
+		for i, par in enumerate(bank_slots):
+			if par is None:
+				continue
+			try:
+				labels[i] = LabelFormatter.get_label_for_parameter(par, self.parent.labelDisplayMode, max_length=6)
+				keys[i] = (par.owner.path, par.name)
+			except:
+				labels[i] = "---"
+				continue
+			slots_by_key.setdefault(keys[i], []).append(i)
+		return bank_slots, labels, keys, slots_by_key
+	
+	def invalidate_slot_labels(self, bank_idx: Optional[int] = None):
+		"""Drop cached slot labels for a bank (or all banks) after slots or the label mode change"""
+		if bank_idx is None:
+			self._slot_label_cache.clear()
+		else:
+			self._slot_label_cache.pop(bank_idx, None)
 	
 	def clear_all_slot_leds(self):
 		"""Clear all slot LEDs (set to 0)"""
@@ -545,17 +1050,7 @@ class DisplayManager:
 		if not self.is_vsn1_enabled():
 			return
 		fill = tdu.clamp(fill, 0, 1)
-		try:
-			self.parent.midiOut.sendControl(self.parent.evalChannel, VSN1Constants.ROTARY_LED_FEEDBACK_INDEX, fill)
-			if f"Cannot communicate with the MIDI device" in self.parent.ownerComp.scriptErrors():
-				self.parent.ownerComp.clearScriptErrors(error="*Cannot communicate with the MIDI device*")
-			if f"Could not open the MIDI interface" in self.parent.ownerComp.scriptErrors():
-				self.parent.ownerComp.clearScriptErrors()
-				return
-		except tdError as e:
-			if "Cannot communicate with the MIDI device" in str(e):
-				self.parent.ownerComp.addScriptError(f"Cannot communicate with the MIDI device")
-				return
+		self.ring_led_channel.update({'ring': round(fill * VSN1Constants.RING_LED_RESOLUTION)})
 	
 	def update_knob_leds_steps(self, step_indicator_idx: int):
 		"""Update knob LEDs with steps"""
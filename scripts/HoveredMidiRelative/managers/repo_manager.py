@@ -33,6 +33,7 @@ class RepoManager:
 			bank_idx = self.parent.currBank
 		
 		self.parent.slotPars[bank_idx][slot_idx] = parameter
+		self.parent.display_manager.invalidate_slot_labels(bank_idx)
 	
 	def clear_slot(self, slot_idx: int, bank_idx: Optional[int] = None):
 		"""Clear a slot"""
@@ -102,6 +103,8 @@ class RepoManager:
 			for bank_idx in range(num_banks):
 				self.parent.bankActiveSlots[bank_idx] = None
 		
+		self.parent.display_manager.invalidate_slot_labels()
+		
 		# Now load from tables
 		for bank_idx in range(num_banks):
 			bank_table = self.Repo.op(f'bank{bank_idx}')
@@ -8,7 +8,7 @@ Info Header End'''
 
 from typing import Optional, Union
 from constants import ScreenMessages, VSN1ColorIndex
-from validators import ParameterValidator
+from validators import ParameterValidator, SelectionSnapshot
 from formatters import LabelFormatter
 
 class SlotManager:
@@ -75,6 +75,10 @@ class SlotManager:
 					invalid_params.append((slot_idx, bank_idx))
 		
 		if invalid_params:
+			# Operators were deleted/renamed - drop cached type verdicts and selection snapshots
+			ParameterValidator.invalidate_verdicts()
+			SelectionSnapshot.invalidate()
+			
 			# Start processing the first one
 			self._invalidation_queue = invalid_params
 			self._processing_invalidation = True
@@ -277,6 +281,7 @@ class SlotManager:
 		"""Clear slot data without updating UI (for batch operations)"""
 		# Clear from internal storage
 		self.parent.slotPars[bank_idx][slot_idx] = None
+		self.parent.display_manager.invalidate_slot_labels(bank_idx)
 		
 		# If this was the active slot, deactivate it
 		if self.parent.activeSlot == slot_idx and self.parent.currBank == bank_idx:
@@ -610,6 +615,7 @@ class SlotManager:
 			
 			# Success! Restore the parameter to the slot
 			self.parent.slotPars[bank_idx][slot_idx] = recovered_par
+			self.parent.display_manager.invalidate_slot_labels(bank_idx)
 			
 			# Save to table (unless this is a batch operation that will save later)
 			if save_to_table:
@@ -663,6 +669,7 @@ class SlotManager:
 		
 		# Assign parameter (or ParGroup) to runtime storage
 		self.parent.slotPars[currBank][slot_idx] = parameter
+		self.parent.display_manager.invalidate_slot_labels(currBank)
 		
 		# Update table for persistence (only current bank for performance)
 		self.parent.repo_manager.save_bank_to_table(currBank)
@@ -739,6 +746,7 @@ class SlotManager:
 		
 		# Clear the slot
 		self.parent.slotPars[currBank][slot_idx] = None
+		self.parent.display_manager.invalidate_slot_labels(currBank)
 		self.parent._set_parexec_pars(None)
 		self.parent.activeSlot = None
 		self.parent._activeSlotPar = None  # Clear cached active slot parameter
@@ -830,6 +838,7 @@ class SlotManager:
 		self.parent.activeSlot = slot_idx
 		self.parent._activeSlotPar = slot_par  # Store directly for ultra-fast access
 		self.parent.bankActiveSlots[currBank] = slot_idx
+		self.parent.midi_handler.prepare_control_plan(slot_par)
 		
 		# Check if a jump occurred before activation (user navigated away from hovered parameter)
 		# If so, clear hoveredPar as it's likely stale
@@ -897,6 +906,9 @@ class SlotManager:
 		if bank_idx < 0 or bank_idx >= self.parent.numBanks:
 			return False
 		
+		# Refresh the recalled bank's labels (parameters may have been renamed meanwhile)
+		self.parent.display_manager.invalidate_slot_labels(bank_idx)
+		
 		try:
 			# Clear any unused captured values from current bank's active slot
 			old_bank = self.parent.currBank
@@ -1206,6 +1218,7 @@ class SlotManager:
 		"""Clear a slot in a specific bank (internal method for invalidation, no undo support)"""
 		# Clear the slot
 		self.parent.slotPars[bank_idx][slot_idx] = None
+		self.parent.display_manager.invalidate_slot_labels(bank_idx)
 		self.parent._set_parexec_pars(None)
 		
 		# If this was the active slot in this bank, deactivate it
@@ -7,6 +7,7 @@ Saveversion : 2023.12120
 Info Header End'''
 from constants import VSN1ColorIndex, ScreenMessages, StepMode, OverrideUIElements
 from formatters import LabelFormatter
+from display_manager import RenderFrame
 
 class UIManager:
 	"""Manager for UI elements"""
@@ -57,23 +58,29 @@ class UIManager:
 		self.ui.par.Clamps2 = 1 if clamps[1] else 0
 
 	
-	def render_display(self, val, norm_min, norm_max, processed_label: str, bottom_text: str, percentage: float, step_indicator = None, norm_default = None, clamps = None):
-		"""Render display data to UI - ONLY the UI parameter updates, no logic"""
+	def render_display(self, val, norm_min, norm_max, processed_label: str, bottom_text: str, percentage: float, step_indicator = None, norm_default = None, clamps = None, dirty: int = RenderFrame.ALL):
+		"""Render display data to UI - ONLY the UI parameter updates, no logic.
+		dirty: RenderFrame bits of the fields to set, the others are left as they are"""
 		if not self.ui_enabled:
 			return
 		# Set UI parameters - ONLY difference from VSN1 renderer
-		self._set_circle_fill(percentage)
-		self._set_top_text(processed_label)
-		self._set_bottom_text(bottom_text)
-		if norm_default is None:
-			norm_default = -1
-		self._set_defaultnotch(norm_default)
-		if clamps is None:
-			clamps = (0, 0)
-		self._set_clamps(clamps)
+		if dirty & RenderFrame.VALUE:
+			self._set_circle_fill(percentage)
+		if dirty & RenderFrame.LABEL:
+			self._set_top_text(processed_label)
+		if dirty & RenderFrame.BOTTOM_TEXT:
+			self._set_bottom_text(bottom_text)
+		if dirty & RenderFrame.NORM_DEFAULT:
+			if norm_default is None:
+				norm_default = -1
+			self._set_defaultnotch(norm_default)
+		if dirty & RenderFrame.CLAMPS:
+			if clamps is None:
+				clamps = (0, 0)
+			self._set_clamps(clamps)
 		
 		# Set step indicator if provided
-		if step_indicator is not None:
+		if step_indicator is not None and dirty & RenderFrame.STEP_INDICATOR:
 			self.set_step_indicator(step_indicator)
 	
 	def clear_screen(self):
@@ -196,6 +203,8 @@ class UIManager:
 			return
 		self.ui.par.Modecolorindex = 1 if step_mode == StepMode.FIXED else 2
 		self.render_display(0.5, 0, 1, '_MODE_', '_FIXED_' if step_mode == StepMode.FIXED else '_ADAPT_', 0.5, step_indicator=step_indicator)
+		# Drawn outside the display manager's frame
+		self.parent.display_manager.invalidate_render_frame()
 
 	def set_hovered_ui_color(self, color_index: int, force = False):
 		"""Set hovered UI color with proper brightness adjustments per element type.
@@ -137,36 +137,40 @@ class UndoManager:
 		self.parameterUndoCreated[par_path] = True
 		return True
 	
-	def create_pargroup_undo(self, par_group: 'ParGroup'):
+	def create_pargroup_undo(self, par_group: 'ParGroup', undo_pars: list = None):
 		"""Create a single undo action for all parameters in a ParGroup.
 		
 		Args:
 			par_group: The ParGroup to create undo for
+			undo_pars: Pre-filtered members to capture (from the group's control plan)
 		"""
 		if not self.parent.evalEnableundo:
 			return
 		
+		if undo_pars is None:
+			# Skip unit parameters (e.g., tunit, runit, sunit) but not "unit" itself
+			undo_pars = [
+				par for par in par_group
+				if par is not None and not (par.name.endswith('unit') and len(par.name) > 4) and ParameterValidator.is_valid_parameter(par) and not par.isPulse
+			]
+		
 		# Collect all valid parameters that need undo
 		pars_to_undo = []
 		
 		# First pass: capture initial values for all parameters (if not already captured)
 		# This ensures all parameters have initial values before creating undo
-		for par in par_group:
-			# Skip unit parameters (e.g., tunit, runit, sunit) but not "unit" itself
-			if par is not None and not (par.name.endswith('unit') and len(par.name) > 4) and ParameterValidator.is_valid_parameter(par) and not par.isPulse:
-				par_path = f"{par.owner.path}:{par.name}"
-				# Capture initial value if not already captured (consistent with multi-undo)
-				if par_path not in self.parameterInitialValues:
-					self.capture_initial_parameter_value(par)
+		for par in undo_pars:
+			par_path = f"{par.owner.path}:{par.name}"
+			# Capture initial value if not already captured (consistent with multi-undo)
+			if par_path not in self.parameterInitialValues:
+				self.capture_initial_parameter_value(par)
 		
 		# Second pass: collect parameters that need undo (have initial values and undo not created yet)
-		for par in par_group:
-			# Skip unit parameters (e.g., tunit, runit, sunit) but not "unit" itself
-			if par is not None and not (par.name.endswith('unit') and len(par.name) > 4) and ParameterValidator.is_valid_parameter(par) and not par.isPulse:
-				par_path = f"{par.owner.path}:{par.name}"
-				# Add to undo list if we have initial value and haven't created undo yet
-				if par_path in self.parameterInitialValues and par_path not in self.parameterUndoCreated:
-					pars_to_undo.append(par)
+		for par in undo_pars:
+			par_path = f"{par.owner.path}:{par.name}"
+			# Add to undo list if we have initial value and haven't created undo yet
+			if par_path in self.parameterInitialValues and par_path not in self.parameterUndoCreated:
+				pars_to_undo.append(par)
 		
 		# If no parameters need undo, return (initial values captured for next adjustment)
 		if not pars_to_undo:
@@ -116,11 +116,11 @@ class ZoomManager:
 		except Exception as e:
 			print(f"Error starting zoom timeout: {e}")
 	
-	def handle_zoom_knob(self, value: int) -> bool:
+	def handle_zoom_knob(self, diff: int) -> bool:
 		"""Handle zoom knob MIDI message
 		
 		Args:
-			value: MIDI value from knob
+			diff: Signed knob delta (decoded from the MIDI value)
 			
 		Returns:
 			True if zoom was handled, False otherwise
@@ -131,8 +131,6 @@ class ZoomManager:
 			self.clear_target()
 			return False
 		
-		from constants import MidiConstants
-		
 		# Get zoom mode from parent
 		zoom_mode = getattr(self.parent, 'evalZoommode', 'Seek')
 		
@@ -151,7 +149,7 @@ class ZoomManager:
 			return False
 		
 		current_zoom = _jumpExt.currentZoom
-		direction = 1 if value > MidiConstants.MIDI_CENTER_VALUE else -1
+		direction = 1 if diff > 0 else -1
 		zoom_delta = direction * self.parent.evalZoomnetwork * (5 if self.parent.knobPushState else 1)
 		_zoom_limit = self.zoom_limit
 		# Check if we've hit the zoom limit
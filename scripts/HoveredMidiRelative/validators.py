@@ -5,6 +5,7 @@ Author : Dan@DAN-4090
 Saveorigin : HoveredMidiRelative.179.toe
 Saveversion : 2023.12120
 Info Header End'''
+from collections import OrderedDict
 from constants import *
 from typing import Union
 
@@ -12,6 +13,37 @@ from typing import Union
 class ParameterValidator:
 	"""Helper class for parameter validation"""
 	
+	# Type verdict cache (LRU): (operator id, par/group name, style, allow_strmenus) -> supported.
+	# Only the TYPE verdict is cached - validity (mode, enable, readOnly) is always checked live,
+	# so mode changes never see a stale result. The par/group style is part of the key to catch
+	# custom par edits, a ParGroup's style changes with its members.
+	_verdicts = OrderedDict()
+	_verdict_hits = 0
+	_verdict_misses = 0
+	MAX_VERDICTS = 4096
+	
+	@staticmethod
+	def _verdict_key(par_or_group, allow_strmenus: bool):
+		"""Cache key for a parameter or ParGroup, None if it can't be keyed (e.g. invalid)"""
+		try:
+			return (par_or_group.owner.id, par_or_group.name, par_or_group.style, bool(allow_strmenus))
+		except (AttributeError, tdError):
+			return None
+	
+	@staticmethod
+	def invalidate_verdicts():
+		"""Drop all cached type verdicts (called after operator deletes/renames)"""
+		ParameterValidator._verdicts.clear()
+	
+	@staticmethod
+	def verdict_cache_stats() -> dict:
+		"""Hit/miss counters and size of the type verdict cache"""
+		return {
+			'hits': ParameterValidator._verdict_hits,
+			'misses': ParameterValidator._verdict_misses,
+			'size': len(ParameterValidator._verdicts),
+		}
+	
 	@staticmethod
 	def is_strmenu(par) -> bool:
 		"""Check if parameter is a StrMenu (both isMenu and isString, or style == 'StrMenu')"""
@@ -114,6 +146,25 @@ class ParameterValidator:
 		if par_or_group is None:
 			return False
 		
+		key = ParameterValidator._verdict_key(par_or_group, allow_strmenus)
+		if key is not None:
+			verdict = ParameterValidator._verdicts.get(key)
+			if verdict is not None:
+				ParameterValidator._verdict_hits += 1
+				ParameterValidator._verdicts.move_to_end(key)
+				return verdict
+			ParameterValidator._verdict_misses += 1
+		
+		verdict = ParameterValidator._compute_supported_parameter_type(par_or_group, allow_strmenus)
+		if key is not None:
+			ParameterValidator._verdicts[key] = verdict
+			if len(ParameterValidator._verdicts) > ParameterValidator.MAX_VERDICTS:
+				ParameterValidator._verdicts.popitem(last=False)
+		return verdict
+	
+	@staticmethod
+	def _compute_supported_parameter_type(par_or_group: Union[Par, ParGroup], allow_strmenus: bool = False) -> bool:
+		"""Uncached type check behind is_supported_parameter_type (internal helper)"""
 		# Handle ParGroup
 		if ParameterValidator.is_pargroup(par_or_group):
 			# Get all parameters from the group (regardless of validity)
@@ -175,24 +226,93 @@ class ParameterValidator:
 	@staticmethod
 	def get_matching_selected_pars(par: Par):
 		"""Get list of selected operators that match the parameter's owner type.
-		Only works in hover mode (not slot mode) for multi-operator editing."""
+		Only works in hover mode (not slot mode) for multi-operator editing.
+		Resolved tuples are cached by SelectionSnapshot until the hovered parameter changes."""
+		return SelectionSnapshot.get_matching_pars(par)
+
+
+class SelectionSnapshot:
+	"""Cache of resolved multi-operator matching parameters per (owner, parameter name).
+	
+	A snapshot is kept until it is invalidated, the selection is not re-read on every knob tick.
+	Selecting operators moves the mouse off the hovered parameter, so the extension invalidates
+	on every hovered parameter change; the slot manager invalidates after operator deletes/renames.
+	"""
+	_snapshots = OrderedDict()  # (owner id, par name) -> matching pars (LRU)
+	hits = 0
+	misses = 0
+	MAX_SNAPSHOTS = 64
+	
+	@staticmethod
+	def get_matching_pars(par: Par) -> tuple:
 		try:
 			owner = par.owner
-			parent_comp = owner.parent()
-			
-			# Get selected children in the parent
-			if not parent_comp or not hasattr(parent_comp, 'selectedChildren'):
-				return []
+			key = (owner.id, par.name)
+			matching_pars = SelectionSnapshot._snapshots.get(key)
+			if matching_pars is not None:
+				SelectionSnapshot.hits += 1
+				SelectionSnapshot._snapshots.move_to_end(key)
+				return matching_pars
 			
-			selected = parent_comp.selectedChildren
-			if not selected or len(selected) <= 1:
-				return []
+			SelectionSnapshot.misses += 1
+			parent_comp = owner.parent()
+			selected = getattr(parent_comp, 'selectedChildren', None) if parent_comp else None
+			if selected and len(selected) > 1:
+				matching_pars = tuple(
+					other_par for other_par in (_op.par[par.name] for _op in selected if _op != owner)
+					if other_par is not None
+				)
+			else:
+				matching_pars = ()
+		except (AttributeError, tdError):
+			return ()
+		
+		SelectionSnapshot._snapshots[key] = matching_pars
+		if len(SelectionSnapshot._snapshots) > SelectionSnapshot.MAX_SNAPSHOTS:
+			SelectionSnapshot._snapshots.popitem(last=False)
+		return matching_pars
+	
+	@staticmethod
+	def invalidate():
+		"""Drop all snapshots (on hovered parameter changes and network changes)"""
+		SelectionSnapshot._snapshots.clear()
 
-			matching_pars = [
-				_op.par[par.name] for _op in selected 
-				if _op != par.owner and _op.par[par.name] is not None
-			]
 
-			return matching_pars
-		except Exception as e:
-			return []
\ No newline at end of file
+class ParGroupPlan:
+	"""Control plan for a ParGroup, compiled once when the group becomes active.
+	
+	Holds the writable members (unit and invalid parameters filtered out), the member
+	shown on the display and the members captured for undo. The plan stays current
+	until one of the members changes mode (e.g. gets an expression or bind).
+	
+	Checking that costs a .mode read per member, so it is done at most once per frame:
+	knob flushes, undo and the display all ask within the same frame.
+	"""
+	
+	def __init__(self, par_group: ParGroup):
+		self.group = par_group
+		# Exclude unit parameters (e.g., tunit, runit, sunit) but not "unit" itself
+		self._candidates = [
+			p for p in par_group
+			if p is not None and not (p.name.endswith('unit') and len(p.name) > 4)
+		]
+		self.modes = tuple(p.mode for p in self._candidates)
+		self.members = [p for p in self._candidates if ParameterValidator.is_valid_parameter(p)]
+		self.display_par = self.members[0] if self.members else None
+		self.undo_pars = [p for p in self.members if not p.isPulse]
+		self._checked_frame = absTime.frame
+	
+	def is_current(self, par_group: ParGroup) -> bool:
+		"""Check if the plan still applies to the given group (same group, no member mode changes)"""
+		if par_group is not self.group:
+			return False
+		frame = absTime.frame
+		if frame == self._checked_frame:
+			return True
+		try:
+			current = tuple(p.mode for p in self._candidates) == self.modes
+		except (AttributeError, tdError):
+			return False
+		if current:
+			self._checked_frame = frame
+		return current
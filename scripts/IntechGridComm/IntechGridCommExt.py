@@ -10,22 +10,95 @@ CustomParHelper: CustomParHelper = next(d for d in me.docked if 'ExtUtils' in d.
 ###
 import json
 class IntechGridCommExt:
+	DEFAULT_QUEUE_KEY = 'display'  # Queue the package uses for queued messages without a key
+	CREDIT_WINDOW = 1  # Queued messages per key that may wait in the package before senders hold back
+	CREDIT_TIMEOUT = 0.5  # Seconds without an ack before outstanding messages count as lost
+	PACING_MIN_MS = 20.0  # Bounds for the package's adaptive queue interval
+	PACING_MAX_MS = 200.0
+	MAX_BATCH_LENGTH = 900  # Longest batched script per execute-code message, the module's immediate buffer is ~1 kB
+	# Appended once to the websocket DAT's callbacks DAT: package replies reach onReceiveText,
+	# everything it doesn't consume (e.g. "set" events) still goes to the original callback
+	RECEIVE_HOOK_MARKER = '# IntechGridCommExt receive hook'
+	RECEIVE_HOOK = (
+		'\n\n' + RECEIVE_HOOK_MARKER + '\n'
+		'_onReceiveTextOriginal = globals().get(\'onReceiveText\')\n'
+		'def onReceiveText(dat, rowIndex, message):\n'
+		'\tif dat.parent().ext.IntechGridCommExt.onReceiveText(message):\n'
+		'\t\treturn\n'
+		'\tif _onReceiveTextOriginal is not None:\n'
+		'\t\treturn _onReceiveTextOriginal(dat, rowIndex, message)\n'
+	)
+
 	def __init__(self, ownerComp):
 		CustomParHelper.Init(self, ownerComp, enable_properties=True, enable_callbacks=True)
 		self.ownerComp = ownerComp
 		self.websocket: websocketDAT = self.ownerComp.op('websocket1')
 		self.reconnectTimer: timerDAT = self.ownerComp.op('timer1')
 		self.callbackManager = self.ownerComp.op('callbackManager')
+		# execute-code fragments collected during the current frame, sent as one script at frame end
+		self._batch = []
+		self._batchRun = None
+		self.luaCalls = 0  # SendLua/SendState calls (messages before batching)
+		self.messagesSent = 0  # Websocket messages actually sent (after batching)
+		# Credit flow control: queued messages per key the package has not forwarded (acked) yet.
+		# Only enforced once the package has sent an ack, older packages never do.
+		self.ackSupported = False
+		self._outstanding = {}
+		self._creditTime = {}
+		self.acksReceived = 0
+		self.creditListeners = []  # Called with the queue key whenever the package acks messages
+		# Called when the package stops getting pacing echoes: the module lost its Lua state (reboot, profile reload)
+		self.moduleResetListeners = []
+		# Queue interval the package paces to, from its measured module round trip (None until reported)
+		self.bridgeIntervalMs = None
+		self.bridgeEstimateMs = None
+		self.pacingEcho = ''  # Installed Lua routine the package may call instead of its inline echo
+		# Packages older than queue-state drop it silently and never reply. Until the first reply the
+		# merged states are kept, so they can be resent in full as queue-code if none arrives in time.
+		self.bridgeReplied = False
+		self.legacyBridge = False
+		self._states = {}  # (key, func) -> {'prefix': str, 'fields': dict}
+		self._replyCheck = None
+		# Latest package telemetry merged with the local counters, {} while disconnected.
+		# Script CHOPs / DATs calling FillTelemetryChop / FillTelemetryDat recook when it changes.
+		self.Telemetry = tdu.Dependency({})
+		self._installReceiveHook()
+		
+	def _installReceiveHook(self):
+		"""Route the package's replies (acks, pacing, telemetry) from the websocket DAT to onReceiveText.
+		Without it none of them arrive and the extension falls back to the legacy queue-code path."""
+		callbacks_par = self.websocket.par.callbacks
+		callbacks = callbacks_par.eval() if callbacks_par is not None else None
+		if callbacks is None:
+			debug("IntechGridComm: websocket1 has no callbacks DAT, package replies can't be received")
+			return
+		if self.RECEIVE_HOOK_MARKER not in callbacks.text:
+			callbacks.text = callbacks.text.rstrip('\n') + self.RECEIVE_HOOK
 		
 	@property
 	def isQueued(self) -> bool:
 		"""Used for package that supports queued messages"""
 		return self.ownerComp.par.Queuedmessage.eval()
 
-	def SendLua(self, lua_code: str, queue: bool = False):
+	@property
+	def isBatched(self) -> bool:
+		"""Collect execute-code messages of a frame into one script"""
+		return getattr(self, 'evalBatchmessages', True)
+
+	def SendLua(self, lua_code: str, queue: bool = False, key: str = ''):
+		"""Run Lua on the module. Queued messages are coalesced per key by the package (latest wins)."""
+		self.luaCalls += 1
+		self._sendLua(lua_code, queue, key)
+
+	def _sendLua(self, lua_code: str, queue: bool = False, key: str = ''):
 		if queue:
 			# Used for package that supports queued messages
 			package_type = 'queue-code'
+		elif self.isBatched:
+			self._batch.append(lua_code)
+			if self._batchRun is None:
+				self._batchRun = run("args[0]._onBatchRun()", self, endFrame=True, delayRef=op.TDResources)
+			return
 		else:
 			package_type = 'execute-code'
 		#package_type = 'execute-code'
@@ -33,21 +106,240 @@ class IntechGridCommExt:
 			'type': package_type,
 			'script': lua_code
 		}
+		if key:
+			package['key'] = key
 		
-		self.websocket.sendText(json.dumps(package))
+		self._sendPackage(package)
+
+	def _onBatchRun(self):
+		self._batchRun = None
+		self.FlushBatch()
+
+	def FlushBatch(self):
+		"""Send the execute-code collected so far in call order, joined into scripts of at most MAX_BATCH_LENGTH
+		(a single longer call is sent on its own)"""
+		if not self._batch:
+			return
+		chunks = []
+		chunk = ''
+		for lua_code in self._batch:
+			if chunk and len(chunk) + 1 + len(lua_code) > self.MAX_BATCH_LENGTH:
+				chunks.append(chunk)
+				chunk = ''
+			chunk = f'{chunk} {lua_code}' if chunk else lua_code
+		chunks.append(chunk)
+		self._batch.clear()
+		for script in chunks:
+			self._send(json.dumps({
+				'type': 'execute-code',
+				'script': script
+			}))
+
+	def _sendPackage(self, package: dict):
+		# Queued messages must not overtake execute-code of the same frame (e.g. routine installs)
+		self.FlushBatch()
+		if package['type'] != 'execute-code':
+			key = package.get('key') or self.DEFAULT_QUEUE_KEY
+			if not self._outstanding.get(key):
+				self._creditTime[key] = absTime.seconds
+			self._outstanding[key] = self._outstanding.get(key, 0) + 1
+		self._send(json.dumps(package))
+
+	def HasCredit(self, key: str = DEFAULT_QUEUE_KEY) -> bool:
+		"""Whether a queued message for this key would be forwarded rather than replace one still waiting"""
+		# Only gate once acks are known to arrive (older package or no receive hook: never)
+		if not (self.bridgeReplied and self.ackSupported) or self._outstanding.get(key, 0) < self.CREDIT_WINDOW:
+			return True
+		if absTime.seconds - self._creditTime.get(key, 0.0) > self.CREDIT_TIMEOUT:
+			# No ack for too long (lost message, package reloaded): start over
+			self._outstanding[key] = 0
+			return True
+		return False
+
+	def _resetCredits(self):
+		self.bridgeReplied = False
+		self.legacyBridge = False
+		self._states.clear()
+		if self._replyCheck is not None:
+			self._replyCheck.kill()
+			self._replyCheck = None
+		self.ackSupported = False
+		self._outstanding.clear()
+		self._creditTime.clear()
+		self.bridgeIntervalMs = None
+		self.bridgeEstimateMs = None
+
+	def ConfigurePacing(self, echo: str = None):
+		"""Send the adaptive pacing bounds to the package (older packages ignore the message).
+		echo names an installed routine taking the sequence number, used for the round trip echo."""
+		if echo is not None:
+			self.pacingEcho = echo
+		package = {
+			'type': 'configure-pacing',
+			'minMs': getattr(self, 'evalPacingminms', self.PACING_MIN_MS),
+			'maxMs': getattr(self, 'evalPacingmaxms', self.PACING_MAX_MS)
+		}
+		if self.pacingEcho:
+			package['echo'] = self.pacingEcho
+		# Keep call order with execute-code batched this frame (e.g. the echo routine install)
+		self.FlushBatch()
+		self._send(json.dumps(package))
+
+	def _send(self, text: str):
+		self.messagesSent += 1
+		self.websocket.sendText(text)
+
+	def ResetMessageStats(self):
+		"""Reset the before/after batching message counters"""
+		self.luaCalls = 0
+		self.messagesSent = 0
+
+	def SendState(self, func: str, fields: dict, prefix: str = '', reset: bool = False, key: str = ''):
+		"""Queue a field delta for a device-side state function, e.g. func{[1]=0.5,[5]='0.50'}.
+		The package merges deltas that arrive before the next send, so no field is lost.
+		reset drops any pending fields (used for full frames) and prefix is Lua run before the call.
+		key selects the package's coalescing queue (its default is the display queue).
+		"""
+		self.luaCalls += 1
+		if not self.bridgeReplied:
+			entry = self._states.get((key, func))
+			if entry is None or reset:
+				entry = self._states[(key, func)] = {'prefix': entry['prefix'] if entry else '', 'fields': {}}
+			entry['fields'].update({str(k): v for k, v in fields.items()})
+			if self.legacyBridge:
+				self._sendLegacyState(key, func, prefix, entry['fields'])
+				return
+			entry['prefix'] += prefix
+			if self._replyCheck is None:
+				self._replyCheck = run("args[0]._onReplyCheck()", self, delayMilliSeconds=self.CREDIT_TIMEOUT * 1000, delayRef=op.TDResources)
+		package = {
+			'type': 'queue-state',
+			'func': func,
+			'fields': {str(k): v for k, v in fields.items()}
+		}
+		if reset:
+			package['reset'] = True
+		if prefix:
+			package['prefix'] = prefix
+		if key:
+			package['key'] = key
+		self._sendPackage(package)
+
+	def _onReplyCheck(self):
+		self._replyCheck = None
+		if self.bridgeReplied or self.legacyBridge:
+			return
+		self.legacyBridge = True
+		debug("IntechGridComm: no reply from the Grid package - it is older than this component "
+			  "(update the package) or the websocket DAT's onReceiveText doesn't call "
+			  "ext.IntechGridCommExt.onReceiveText. Falling back to queue-code.")
+		# The package dropped everything sent as queue-state so far, resend it in full
+		for (key, func), entry in self._states.items():
+			self._sendLegacyState(key, func, entry['prefix'], entry['fields'])
+			entry['prefix'] = ''
+
+	def _sendLegacyState(self, key: str, func: str, prefix: str, fields: dict):
+		"""Full state as plain Lua for packages without queue-state (one latest-wins queue, no keys)"""
+		if prefix:
+			# Ahead of the queued call, latest-wins would drop it with a replaced message
+			self._sendLua(prefix)
+		table = ','.join(f'[{k}]={v}' for k, v in sorted(fields.items(), key=lambda kv: int(kv[0])))
+		script = f'{func}{{{table}}}'
+		if key and key != self.DEFAULT_QUEUE_KEY:
+			# Only the display keeps the single queue slot, other states go out right away
+			self._sendLua(script)
+		else:
+			self._sendLua(script, queue=True)
 
 	def onReconnectTimerTrigger(self):
 		"""TouchDesigner callback when reconnect timer done"""
 		self.ownerComp.par.Resetcomm.pulse()
 
+	def onReceiveText(self, message: str) -> bool:
+		"""Text from the package, forwarded by the websocket DAT's onReceiveText callback (see RECEIVE_HOOK).
+		Acks ({"event": "ack", "key": ..., "count": n}) return credits for forwarded queued messages,
+		pacing ({"event": "pacing", "intervalMs": ..., "estimateMs": ...}) reports the queue interval,
+		echo-lost means queued scripts stopped running to their end (module lost the routines).
+		Returns False for anything else (e.g. "set" events), which the original callback handles."""
+		try:
+			data = json.loads(message)
+		except ValueError:
+			return False
+		if not isinstance(data, dict):
+			return False
+		event = data.get('event')
+		if event == 'ack':
+			self._onAck(data)
+		elif event == 'pacing':
+			self.bridgeIntervalMs = data.get('intervalMs')
+			self.bridgeEstimateMs = data.get('estimateMs')
+		elif event == 'telemetry':
+			self._onTelemetry(data)
+		elif event == 'echo-lost':
+			for listener in self.moduleResetListeners:
+				listener()
+		else:
+			return False
+		if not self.bridgeReplied:
+			# The package understands queue-state, stop keeping states for the fallback
+			self.bridgeReplied = True
+			self.legacyBridge = False
+			self._states.clear()
+		return True
+
+	def _onTelemetry(self, data: dict):
+		"""Package counters (frames in/out/dropped, bytes, latency, queue depth, ...) plus what TD sent"""
+		telemetry = {k: v for k, v in data.items() if k != 'event' and isinstance(v, (int, float))}
+		telemetry.update(
+			luaCalls=self.luaCalls,
+			messagesSent=self.messagesSent,
+			acksReceived=self.acksReceived,
+			outstanding=sum(self._outstanding.values())
+		)
+		self.Telemetry.val = telemetry
+
+	def FillTelemetryChop(self, scriptOp):
+		"""Script CHOP onCook helper: one channel per telemetry value"""
+		scriptOp.clear()
+		scriptOp.numSamples = 1
+		for name, value in self.Telemetry.val.items():
+			scriptOp.appendChan(name)[0] = float(value)
+
+	def FillTelemetryDat(self, scriptOp):
+		"""Script DAT onCook helper: name / value rows"""
+		scriptOp.clear()
+		scriptOp.appendRow(['name', 'value'])
+		for name, value in self.Telemetry.val.items():
+			scriptOp.appendRow([name, value])
+
+	def _onAck(self, data: dict):
+		key = data.get('key') or self.DEFAULT_QUEUE_KEY
+		self.ackSupported = True
+		self.acksReceived += 1
+		self._outstanding[key] = max(0, self._outstanding.get(key, 0) - data.get('count', 1))
+		self._creditTime[key] = absTime.seconds
+		for listener in self.creditListeners:
+			listener(key)
+
 	def onConnect(self):
+		self._resetCredits()
+		self.ConfigurePacing()
 		self.reconnectTimer.par.initialize.pulse()
 		self.callbackManager.Do_Callback('onConnect')
 
 	def onDisconnect(self):
+		self._batch.clear()
+		self._resetCredits()
+		self.Telemetry.val = {}
 		self.reconnectTimer.par.start.pulse()
 		self.callbackManager.Do_Callback('onDisconnect')
 
+	def onParPacingminms(self, _val):
+		self.ConfigurePacing()
+
+	def onParPacingmaxms(self, _val):
+		self.ConfigurePacing()
+
 	def onParSend(self):
 		if self.evalLuacode:
 			self.SendLua(self.evalLuacode, queue=self.isQueued)